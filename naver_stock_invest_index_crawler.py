@@ -4,59 +4,399 @@ Playwright를 사용한 한솔홀딩스 투자분석 데이터 크롤러
 """
 
 import asyncio
+import hashlib
+import logging
+import numpy as np
 import pandas as pd
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 import json
+import lxml.html
+try:
+    import orjson  # 선택 의존성: 설치되어 있으면 JSON 파싱/직렬화에 사용
+except ImportError:
+    orjson = None
+try:
+    import ijson  # 선택 의존성: 큰 주식 목록 JSON을 항목 단위로 스트리밍 파싱
+except ImportError:
+    ijson = None
 from datetime import datetime, timezone, timedelta
 import os
+import random
 import re
-from s3_utils import upload_file_to_s3, generate_s3_key
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import product
+from s3_utils import upload_file_to_s3, upload_with_retry, generate_s3_key
 import sys
+import tempfile
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
 # Windows에서 Unicode 인코딩 문제 해결
 if os.name == 'nt':
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-# .env 파일 로드 (로컬 환경에서만)
-if os.path.exists('.env'):
+# 필터/슬라이스 결과를 방어적으로 복사하지 않도록 Copy-on-Write 활성화 (pandas>=2.0)
+pd.options.mode.copy_on_write = True
+
+# .env 파일 로드 (로컬 환경에서만, Lambda에서는 dotenv import/파일 확인 생략)
+if not os.environ.get('AWS_LAMBDA_FUNCTION_NAME') and os.path.exists('.env'):
+    from dotenv import load_dotenv
     load_dotenv()
 
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+# Playwright는 API 호출마다 inspect.stack()으로 호출 위치를 수집함 (오류 메시지/트레이싱용)
+# PW_INSPECT_STACK=0이면 Playwright 내부에서만 빈 스택을 반환하도록 바꿔 CPU 사용량을 줄임
+if os.environ.get('PW_INSPECT_STACK') == '0':
+    try:
+        import inspect
+        import types
+        from playwright._impl import _connection as _pw_connection
+        _pw_connection.inspect = types.SimpleNamespace(**{**vars(inspect), 'stack': lambda *args, **kwargs: []})
+    except (ImportError, AttributeError) as e:
+        logger.warning(f"⚠️ Playwright 스택 수집 비활성화 실패: {str(e)}")
+
+# 한국 표준시
+KST = timezone(timedelta(hours=9))
+
+# 컬럼명 정리용 정규식
+_RE_CONSENSUS_OPEN = re.compile(r'\n.*?보기')
+_RE_CONSENSUS_CLOSE = re.compile(r'\n.*?닫기')
+_RE_WS_CTRL = re.compile(r'[\n\t\r]+')
+_RE_WS_MULTI = re.compile(r'\s+')
+
+# 접기/펼치기 관련 특수문자와 상위 항목 키워드
+_EXPAND_CHARS_TABLE = str.maketrans('', '', '▼▲△▽+-')
+_PARENT_KEYWORDS = ('지표', '분석', '비율', '현황', '상황', '내역')
+
+# row 변환용 정규식
+_RE_YEAR = re.compile(r'\d{4}/\d{2}')
+_RE_IFRS_PAREN = re.compile(r'\(([^()]*(?:IFRS|GAAP)[^()]*)\)')
+_RE_FIRST_PAREN = re.compile(r'\((.*?)\)')
+
+# 변환 결과에서 행마다 같은 값이 반복되는 컬럼 (category로 저장해 메모리 절감)
+_ROW_CATEGORY_COLUMNS = ('company_code', 'company_name', 'finGubun', 'tab', 'search_type', 'column_type',
+                         'yyyy', 'month', 'value_type', 'data_type', 'crawl_time')
+
+# 투자분석 지표 테이블 셀렉터
+_DATA_TABLE_SELECTOR = 'table.gHead01.all-width.data-list'
+
+# 지표 테이블 내용 해시 (AJAX 갱신 감지용)
+_TABLE_SIGNATURE_JS = """
+(sel) => {
+    let h = 0;
+    for (const t of document.querySelectorAll(sel)) {
+        const s = t.textContent;
+        for (let i = 0; i < s.length; i++) h = (h * 31 + s.charCodeAt(i)) | 0;
+    }
+    return h;
+}
+"""
+
+# 키워드가 포함된 지표 테이블 존재 여부
+_KEYWORD_TABLE_JS = """
+([sel, keyword]) => Array.from(document.querySelectorAll(sel)).some(t => t.textContent.includes(keyword))
+"""
+
+# finGubun/기간/키워드 테이블 상태를 한 번에 확인
+_PAGE_STATE_JS = """
+({sel, fg, pt, kw}) => {
+    const s = document.getElementById('finGubun');
+    const ptOk = Array.from(document.querySelectorAll('input[type="radio"]')).some(radio => {
+        if (!radio.checked) return false;
+        const label = (radio.id && document.querySelector(`label[for="${radio.id}"]`)) || radio.closest('label');
+        return (radio.value || '').includes(pt) || !!(label && label.textContent.includes(pt));
+    });
+    const tblOk = !!kw && Array.from(document.querySelectorAll(sel)).some(t => t.textContent.includes(kw));
+    return {fgOk: !!(s && s.selectedOptions[0] && s.selectedOptions[0].text.includes(fg)), ptOk, tblOk};
+}
+"""
+
+# 한 번 찾은 finGubun option value / 기간 라디오 셀렉터 캐시 (라벨 매칭·JS 탐색 생략용)
+_SELECTOR_CACHE_PATH = os.environ.get('SELECTOR_CACHE_PATH', '/tmp/naver_selectors.json')
+_SELECTOR_CACHE = None
+
+# 클릭한 라디오/라벨 요소에서 라디오 버튼을 다시 찾을 수 있는 셀렉터 생성
+_RADIO_SELECTOR_JS = """
+(e) => {
+    const r = e.matches('input') ? e : (e.control || e.querySelector('input[type="radio"]'));
+    if (!r) return null;
+    if (r.id) return '#' + CSS.escape(r.id);
+    if (r.name && r.value) return `input[type="radio"][name="${r.name}"][value="${r.value}"]`;
+    return null;
+}
+"""
+
+
+def _get_selector_cache():
+    """셀렉터 캐시를 (최초 1회) 파일에서 읽어 반환"""
+    global _SELECTOR_CACHE
+    if _SELECTOR_CACHE is None:
+        try:
+            with open(_SELECTOR_CACHE_PATH, 'r', encoding='utf-8') as f:
+                _SELECTOR_CACHE = json.load(f)
+        except (OSError, ValueError):
+            _SELECTOR_CACHE = {}
+        _SELECTOR_CACHE.setdefault('finGubun', {})
+        _SELECTOR_CACHE.setdefault('period', {})
+    return _SELECTOR_CACHE
+
+
+def _update_selector_cache(section, key, value):
+    """셀렉터 캐시 갱신 후 파일에 저장 (값이 바뀐 경우에만)"""
+    cache = _get_selector_cache()
+    if not value or cache[section].get(key) == value:
+        return
+    cache[section][key] = value
+    try:
+        with open(_SELECTOR_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        logger.warning(f"⚠️ 셀렉터 캐시 저장 실패: {str(e)}")
+
+
+# 테이블 추출에 필요 없는 리소스 (차단 대상)
+_BLOCKED_RESOURCE_TYPES = {'image', 'stylesheet', 'font', 'media'}
+_BLOCKED_URL_PATTERNS = ('google-analytics', 'doubleclick', 'googletagmanager', 'wcslog.naver')
+
+# 정적 리소스 디스크 캐시 (웜 Lambda/반복 실행 시 재다운로드 방지)
+# 지표 데이터가 담긴 HTML/XHR은 항상 새로 받도록 스크립트만 캐시
+_NW_CACHE_DIR = os.environ.get('NW_CACHE_DIR', '/tmp/nw-cache')
+_NW_CACHE_TTL = int(os.environ.get('CACHE_TTL_SECONDS', '3600'))
+_NW_CACHE_RESOURCE_TYPES = {'script'}
+_VOLATILE_QUERY_KEYS = {'_', 't', 'ts', 'timestamp', 'sid', 'sessionid', 'session_id'}
+# 디코딩된 본문을 저장하므로 인코딩/길이 관련 헤더는 저장하지 않음
+_NW_CACHE_SKIP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+def _network_cache_key(method, url):
+    """타임스탬프/세션 파라미터를 제거하고 정렬한 URL 기준 캐시 키"""
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _VOLATILE_QUERY_KEYS
+    )
+    normalized = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+    return hashlib.sha1(f"{method} {normalized}".encode('utf-8')).hexdigest()
+
+
+def _read_network_cache(entry_path):
+    """
+    유효한 캐시 항목을 읽어 (status, headers, body)로 반환 (없거나 만료/손상이면 None)
+    
+    캐시 항목은 한 파일에 메타데이터 JSON 한 줄과 본문을 함께 저장하므로
+    헤더와 본문이 서로 다른 쓰기에서 섞일 수 없음
+    """
+    try:
+        if time.time() - os.path.getmtime(entry_path) >= _NW_CACHE_TTL:
+            return None
+        with open(entry_path, 'rb') as f:
+            meta_line, body = f.read().split(b'\n', 1)
+        meta = json.loads(meta_line)
+        return meta['status'], meta['headers'], body
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # 캐시 없음 또는 손상 → 네트워크에서 가져옴
+
+
+def _write_network_cache(entry_path, status, headers, body):
+    """캐시 항목을 임시 파일에 쓴 뒤 os.replace로 원자적으로 교체"""
+    os.makedirs(_NW_CACHE_DIR, exist_ok=True)
+    meta_line = json.dumps({'status': status, 'headers': headers}).encode('utf-8')
+    fd, tmp_path = tempfile.mkstemp(dir=_NW_CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(meta_line + b'\n')
+            f.write(body)
+        os.replace(tmp_path, entry_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+async def _fulfill_from_network_cache(route):
+    """
+    캐시가 유효하면 디스크에서 응답하고, 아니면 실제 요청 후 캐시에 저장
+    
+    캐시 읽기나 네트워크 요청에 실패하면 route.continue_()로 요청을 그대로 통과시킴
+    
+    Args:
+        route: Playwright Route
+    """
+    request = route.request
+    entry_path = os.path.join(_NW_CACHE_DIR, f"{_network_cache_key(request.method, request.url)}.entry")
+    
+    # 컨테이너 이미지가 Python 3.8이라 asyncio.to_thread 대신 기본 executor 사용
+    loop = asyncio.get_running_loop()
+    cached = await loop.run_in_executor(None, _read_network_cache, entry_path)
+    if cached is not None:
+        status, headers, body = cached
+        await route.fulfill(status=status, headers=headers, body=body)
+        return
+    
+    try:
+        response = await route.fetch()
+        body = await response.body()
+    except Exception as e:
+        logger.debug("네트워크 캐시용 요청 실패, 그대로 통과: %s (%s)", request.url, e)
+        await route.continue_()
+        return
+    
+    if response.status == 200:
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _NW_CACHE_SKIP_HEADERS}
+        try:
+            await loop.run_in_executor(None, _write_network_cache, entry_path, response.status, headers, body)
+        except OSError as e:
+            logger.warning(f"⚠️ 네트워크 캐시 저장 실패: {str(e)}")
+    await route.fulfill(response=response, body=body)
+
+# Lambda 웜 스타트 간 재사용할 공유 브라우저
+# (Playwright 객체는 생성된 이벤트 루프에서만 사용할 수 있으므로 루프 단위로 관리)
+_PW = None
+_BROWSER = None
+_BROWSER_LOOP = None
+_BROWSER_LOCK = None
+
+
+async def _get_shared_browser(headless, browser_args):
+    """
+    공유 Chromium 브라우저를 반환 (없거나 연결이 끊겼으면 새로 실행)
+    
+    Args:
+        headless (bool): 헤드리스 모드 여부
+        browser_args (list): Chromium 실행 인자
+        
+    Returns:
+        Browser: 공유 브라우저
+    """
+    global _PW, _BROWSER, _BROWSER_LOOP, _BROWSER_LOCK
+    
+    loop = asyncio.get_running_loop()
+    if _BROWSER_LOOP is not loop:
+        # 다른(이미 닫힌) 이벤트 루프에서 만든 브라우저는 재사용 불가
+        _PW = None
+        _BROWSER = None
+        _BROWSER_LOOP = loop
+        _BROWSER_LOCK = asyncio.Lock()
+    
+    async with _BROWSER_LOCK:
+        if _BROWSER is None or not _BROWSER.is_connected():
+            if _PW is None:
+                _PW = await async_playwright().start()
+            _BROWSER = await _PW.chromium.launch(headless=headless, args=browser_args)
+            logger.info("✅ Playwright 브라우저가 성공적으로 초기화되었습니다.")
+        else:
+            logger.info("♻️ 실행 중인 Playwright 브라우저를 재사용합니다.")
+        return _BROWSER
+
+
+async def close_shared_browser():
+    """
+    공유 브라우저와 Playwright 드라이버 종료
+    
+    asyncio.run()처럼 호출마다 이벤트 루프를 닫는 진입점에서는 루프가 닫히기 전에 호출해야 한다.
+    """
+    global _PW, _BROWSER, _BROWSER_LOOP, _BROWSER_LOCK
+    
+    try:
+        if _BROWSER_LOOP is asyncio.get_running_loop():
+            # 브라우저 종료가 실패해도 드라이버는 반드시 정리 (Chromium 프로세스 누수 방지)
+            if _BROWSER is not None:
+                try:
+                    await _BROWSER.close()
+                except Exception as e:
+                    logger.warning(f"⚠️ 브라우저 종료 중 오류: {str(e)}")
+            if _PW is not None:
+                try:
+                    await _PW.stop()
+                except Exception as e:
+                    logger.warning(f"⚠️ Playwright 종료 중 오류: {str(e)}")
+            logger.info("🧹 브라우저를 종료했습니다.")
+    finally:
+        _PW = None
+        _BROWSER = None
+        _BROWSER_LOOP = None
+        _BROWSER_LOCK = None
+
+
 class PlaywrightStockCrawler:
-    def __init__(self, headless=None, wait_timeout=None):
+    # 컨테이너 수명 동안 바뀌지 않는 설정값 (import 시 1회 계산)
+    _HEADLESS = os.environ.get('HEADLESS', 'true').lower() == 'true'
+    _WAIT_TIMEOUT = int(os.environ.get('WAIT_TIMEOUT', '10000'))
+    _MAX_TAB_CONCURRENCY = int(os.environ.get('MAX_TAB_CONCURRENCY', '4'))
+    _PAGES_PER_CONTEXT = int(os.environ.get('PAGES_PER_CONTEXT', '5'))
+    _IS_LAMBDA = bool(os.environ.get('AWS_LAMBDA_FUNCTION_NAME'))
+    
+    _USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    _VIEWPORT = {"width": 1920, "height": 1080}
+    
+    # Chromium 실행 인자 (Lambda 최적화)
+    _BROWSER_ARGS = (
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-blink-features=AutomationControlled',
+        '--disable-web-security',
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
+        '--disable-ipc-flooding-protection',
+        '--disable-background-networking'
+    )
+    # Lambda 환경 추가 인자 (--single-process 대신 --no-zygote: 장시간 실행 시 메모리 안정성)
+    _LAMBDA_EXTRA_ARGS = (
+        '--no-zygote',
+        '--disable-gpu',
+        '--disable-software-rasterizer',
+        '--memory-pressure-off',
+        '--disk-cache-dir=/tmp/pw-cache'
+    )
+    # Chromium은 --disable-features를 마지막 한 번만 반영하므로 목록을 합쳐서 전달
+    _DISABLED_FEATURES = ('VizDisplayCompositor',)
+    _LAMBDA_DISABLED_FEATURES = ('TranslateUI', 'BlinkGenPropertyTrees')
+    
+    def __init__(self, headless=None, wait_timeout=None, max_concurrency=None):
         """
         Playwright 크롤러 초기화
         
         Args:
             headless (bool): 브라우저를 백그라운드에서 실행할지 여부 (환경변수 우선)
             wait_timeout (int): 요소 대기 시간 (밀리초) (환경변수 우선)
+            max_concurrency (int): 동시에 실행할 탭 크롤링 작업 수 (환경변수 우선)
         """
-        # 환경변수에서 설정값 읽기
-        self.headless = headless if headless is not None else os.environ.get('HEADLESS', 'true').lower() == 'true'
-        self.wait_timeout = wait_timeout or int(os.environ.get('WAIT_TIMEOUT', '10000'))
+        # 인자가 없으면 환경변수 기반 클래스 기본값 사용
+        self.headless = headless if headless is not None else self._HEADLESS
+        self.wait_timeout = wait_timeout or self._WAIT_TIMEOUT
+        self.max_concurrency = max_concurrency or self._MAX_TAB_CONCURRENCY
         self.browser = None
+        self.context = None
         self.page = None
+        self._tab_semaphore = None
+        self.pages_per_context = self._PAGES_PER_CONTEXT
+        self._idle_contexts = []  # [(context, 처리한 페이지 수), ...]
         self.start_time = None
         self.end_time = None
     
     def start_timer(self):
         """크롤링 시작 시간 기록"""
-        self.start_time = datetime.now()
-        timestamp = self.start_time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"🕐 크롤링 시작: {timestamp}")
+        self.start_time = time.monotonic()
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        logger.info(f"🕐 크롤링 시작: {timestamp}")
         
     def end_timer(self):
         """크롤링 종료 시간 기록 및 소요시간 계산"""
-        self.end_time = datetime.now()
-        timestamp = self.end_time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"🕐 크롤링 종료: {timestamp}")
+        self.end_time = time.monotonic()
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        logger.info(f"🕐 크롤링 종료: {timestamp}")
         
-        if self.start_time:
-            duration = self.end_time - self.start_time
-            total_seconds = int(duration.total_seconds())
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
+        if self.start_time is not None:
+            elapsed = self.end_time - self.start_time
+            minutes, seconds = divmod(int(elapsed), 60)
+            hours, minutes = divmod(minutes, 60)
             
             if hours > 0:
                 duration_str = f"{hours}시간 {minutes}분 {seconds}초"
@@ -65,122 +405,165 @@ class PlaywrightStockCrawler:
             else:
                 duration_str = f"{seconds}초"
             
-            print(f"⏱️ 총 소요시간: {duration_str}")
-            return duration
+            logger.info(f"⏱️ 총 소요시간: {duration_str}")
+            return timedelta(seconds=elapsed)
         return None
         
     async def setup_browser(self):
-        """브라우저 설정 및 초기화"""
+        """브라우저 설정 및 초기화 (웜 스타트 시 공유 브라우저 재사용)"""
         try:
-            self.playwright = await async_playwright().start()
-            
-            # Chromium 브라우저 실행 (Lambda 최적화)
-            browser_args = [
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-renderer-backgrounding',
-                '--disable-ipc-flooding-protection',
-                '--disable-background-networking'
-            ]
-            
-            # Lambda 환경에서 추가 최적화
-            if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
-                browser_args.extend([
-                    '--single-process',
-                    '--disable-gpu',
-                    '--disable-software-rasterizer',
-                    '--memory-pressure-off'
-                ])
-                
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=browser_args
-            )
+            browser_args = list(self._BROWSER_ARGS)
+            disabled_features = self._DISABLED_FEATURES
+            if self._IS_LAMBDA:
+                browser_args.extend(self._LAMBDA_EXTRA_ARGS)
+                disabled_features += self._LAMBDA_DISABLED_FEATURES
+            browser_args.append(f"--disable-features={','.join(disabled_features)}")
             
-            # 컨텍스트 생성 (User-Agent 포함)
-            self.context = await self.browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                          '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            # 새 페이지 생성
-            self.page = await self.context.new_page()
+            self.browser = await _get_shared_browser(self.headless, browser_args)
             
-            # 뷰포트 설정
-            await self.page.set_viewport_size({"width": 1920, "height": 1080})
-            
-            print("✅ Playwright 브라우저가 성공적으로 초기화되었습니다.")
+            # 탭 작업별 컨텍스트는 _run_tab에서 생성 (동시 실행 수 제한)
+            self._tab_semaphore = asyncio.Semaphore(self.max_concurrency)
             
         except Exception as e:
-            print(f"❌ 브라우저 초기화 중 오류 발생: {str(e)}")
+            logger.error(f"❌ 브라우저 초기화 중 오류 발생: {str(e)}")
             raise
+    
+    async def _new_context(self):
+        """
+        탭 작업용 BrowserContext 생성 (쿠키/스토리지가 작업별로 분리됨)
+        
+        Returns:
+            BrowserContext: 새 컨텍스트
+        """
+        context = await self.browser.new_context(
+            user_agent=self._USER_AGENT,
+            viewport=self._VIEWPORT
+        )
+        # 이미지/CSS/폰트/미디어 및 광고·트래커 요청 차단 (라우트는 컨텍스트와 함께 정리됨)
+        await context.route("**/*", self._route_request)
+        return context
+    
+    async def _acquire_context(self):
+        """
+        재사용 가능한 컨텍스트를 꺼내거나 새로 생성
+        
+        Returns:
+            tuple: (BrowserContext, 해당 컨텍스트에서 처리한 페이지 수)
+        """
+        if self._idle_contexts:
+            return self._idle_contexts.pop()
+        return await self._new_context(), 0
+    
+    async def _release_context(self, context, pages_used):
+        """
+        컨텍스트 반납 - PAGES_PER_CONTEXT 페이지를 처리했으면 닫아서 Chromium 메모리 회수
+        
+        Args:
+            context: 반납할 BrowserContext
+            pages_used (int): 해당 컨텍스트에서 처리한 페이지 수
+        """
+        if pages_used >= self.pages_per_context:
+            await context.close()
+        else:
+            self._idle_contexts.append((context, pages_used))
+    
+    @staticmethod
+    async def _route_request(route):
+        """불필요한 리소스 요청은 중단하고, 정적 스크립트는 디스크 캐시로 응답, 나머지는 그대로 통과"""
+        request = route.request
+        if (request.resource_type in _BLOCKED_RESOURCE_TYPES
+                or any(pattern in request.url for pattern in _BLOCKED_URL_PATTERNS)):
+            await route.abort()
+        elif (_NW_CACHE_TTL > 0 and request.method == 'GET'
+                and request.resource_type in _NW_CACHE_RESOURCE_TYPES):
+            await _fulfill_from_network_cache(route)
+        else:
+            await route.continue_()
             
-    async def navigate_to_page(self, url):
+    async def navigate_to_page(self, url, page=None):
         """페이지로 이동"""
+        page = page or self.page
         try:
-            print(f"📄 페이지 이동 중: {url}")
+            logger.info(f"📄 페이지 이동 중: {url}")
             
-            # 페이지 로드
-            await self.page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            # 응답 수신(commit)까지만 기다리고, 실제 준비 여부는 필요한 요소 기준으로 판단
+            await page.goto(url, wait_until='commit', timeout=15000)
             
-            # 추가 로딩 대기
-            await self.page.wait_for_timeout(3000)
+            # finGubun 콤보박스와 지표 테이블이 DOM에 붙을 때까지 대기
+            await page.wait_for_selector('select#finGubun', state='attached', timeout=self.wait_timeout)
+            await page.wait_for_selector(_DATA_TABLE_SELECTOR, state='attached', timeout=self.wait_timeout)
             
-            print("✅ 페이지 로딩 완료")
+            logger.info("✅ 페이지 로딩 완료")
             
         except Exception as e:
-            print(f"❌ 페이지 이동 중 오류 발생: {str(e)}")
+            logger.error(f"❌ 페이지 이동 중 오류 발생: {str(e)}")
             raise
+    
+    async def _table_signature(self, page):
+        """지표 테이블 내용의 해시값 (AJAX 갱신 감지용)"""
+        return await page.evaluate(_TABLE_SIGNATURE_JS, _DATA_TABLE_SELECTOR)
+    
+    async def _wait_for_table_refresh(self, page, before):
+        """
+        액션 이후 지표 테이블 내용이 갱신될 때까지 대기
+        
+        Args:
+            page: Playwright 페이지
+            before (int): 액션 이전 테이블 해시값
+        """
+        try:
+            await page.wait_for_function(
+                f"([sel, before]) => ({_TABLE_SIGNATURE_JS})(sel) !== before",
+                arg=[_DATA_TABLE_SELECTOR, before],
+                timeout=self.wait_timeout
+            )
+        except Exception:
+            logger.warning("⚠️ 테이블 갱신 대기 시간 초과 - 현재 화면으로 계속 진행합니다.")
             
-    async def select_finGubun(self, finGubun_type="K-IFRS(연결)"):
+    async def select_finGubun(self, finGubun_type="K-IFRS(연결)", page=None):
         """
         finGubun 콤보박스에서 값 선택
         
         Args:
             finGubun_type (str): "K-IFRS(연결)" 또는 "K-IFRS(별도)"
+            page: 사용할 Playwright 페이지 (기본값: self.page)
             
         Returns:
             bool: 성공 여부
         """
+        page = page or self.page
         try:
-            print(f"📊 '{finGubun_type}' finGubun 선택 시도 중...")
-            
-            # finGubun 콤보박스 찾기
-            selectors = [
-                "#finGubun",
-                "select[id='finGubun']",
-                "select[name='finGubun']",
-                "[id*='finGubun']"
-            ]
-            
-            # 각 셀렉터로 시도
-            for selector in selectors:
+            logger.info(f"📊 '{finGubun_type}' finGubun 선택 시도 중...")
+            
+            before = await self._table_signature(page)
+            
+            # 이전에 찾은 option value가 있으면 바로 선택
+            cached_value = _get_selector_cache()['finGubun'].get(finGubun_type)
+            if cached_value:
                 try:
-                    # 콤보박스가 보이는지 확인
-                    combo_element = self.page.locator(selector).first
-                    if await combo_element.is_visible():
-                        # 콤보박스를 화면에 스크롤
-                        await combo_element.scroll_into_view_if_needed()
-                        await self.page.wait_for_timeout(500)
-                        
-                        # 콤보박스에서 값 선택
-                        await combo_element.select_option(label=finGubun_type)
-                        print(f"✅ '{finGubun_type}' finGubun 선택 성공!")
-                        
-                        # 데이터 로딩 대기
-                        await self.page.wait_for_timeout(1500)
-                        return True
-                        
-                except Exception as e:
-                    continue
+                    await page.select_option('#finGubun', value=cached_value, timeout=self.wait_timeout)
+                    logger.info(f"✅ '{finGubun_type}' finGubun 선택 성공! (캐시된 value: {cached_value})")
+                    await self._wait_for_table_refresh(page, before)
+                    return True
+                except PlaywrightTimeoutError:
+                    logger.warning(f"⚠️ 캐시된 finGubun value가 맞지 않아 다시 탐색합니다: {cached_value}")
+            
+            # finGubun 콤보박스 셀렉터를 하나의 로케이터로 묶어 첫 번째 매칭 요소에 바로 선택
+            selector = "#finGubun, select[name='finGubun'], select[id*='finGubun']"
+            try:
+                combo_element = page.locator(selector).first
+                await combo_element.select_option(label=finGubun_type, timeout=self.wait_timeout)
+                logger.info(f"✅ '{finGubun_type}' finGubun 선택 성공!")
+                _update_selector_cache('finGubun', finGubun_type, await combo_element.input_value())
+                
+                # 데이터 갱신 대기
+                await self._wait_for_table_refresh(page, before)
+                return True
+            except PlaywrightTimeoutError:
+                pass
                     
             # JavaScript로 직접 콤보박스 선택 시도
-            print(f"🔄 JavaScript로 '{finGubun_type}' finGubun 선택 시도...")
+            logger.info(f"🔄 JavaScript로 '{finGubun_type}' finGubun 선택 시도...")
             
             js_select_script = f"""
             () => {{
@@ -209,17 +592,17 @@ class PlaywrightStockCrawler:
             }}
             """
             
-            result = await self.page.evaluate(js_select_script)
+            result = await page.evaluate(js_select_script)
             if result:
-                print(f"✅ JavaScript로 '{finGubun_type}' finGubun 선택 성공!")
-                await self.page.wait_for_timeout(1500)  # 데이터 로딩 대기
+                logger.info(f"✅ JavaScript로 '{finGubun_type}' finGubun 선택 성공!")
+                await self._wait_for_table_refresh(page, before)  # 데이터 갱신 대기
                 return True
                 
-            print(f"❌ '{finGubun_type}' finGubun 콤보박스를 찾을 수 없습니다.")
+            logger.error(f"❌ '{finGubun_type}' finGubun 콤보박스를 찾을 수 없습니다.")
             
             # 디버깅: 사용 가능한 옵션들 확인
-            print(f"🔍 사용 가능한 finGubun 옵션들 확인 중...")
-            available_options = await self.page.evaluate("""
+            logger.info(f"🔍 사용 가능한 finGubun 옵션들 확인 중...")
+            available_options = await page.evaluate("""
             () => {
                 const finGubunSelect = document.getElementById('finGubun') || 
                                      document.querySelector('select[id*="finGubun"]') ||
@@ -238,59 +621,67 @@ class PlaywrightStockCrawler:
             """)
             
             if available_options:
-                print(f"📋 사용 가능한 finGubun 옵션들:")
+                logger.info(f"📋 사용 가능한 finGubun 옵션들:")
                 for i, option in enumerate(available_options):
                     selected_mark = " [선택됨]" if option['selected'] else ""
-                    print(f"   {i+1}. {option['text']} (value: {option['value']}){selected_mark}")
+                    logger.info(f"   {i+1}. {option['text']} (value: {option['value']}){selected_mark}")
             else:
-                print(f"❌ finGubun 콤보박스 자체를 찾을 수 없습니다.")
+                logger.error(f"❌ finGubun 콤보박스 자체를 찾을 수 없습니다.")
                 
             return False
             
         except Exception as e:
-            print(f"❌ '{finGubun_type}' finGubun 선택 중 오류 발생: {str(e)}")
+            logger.error(f"❌ '{finGubun_type}' finGubun 선택 중 오류 발생: {str(e)}")
             return False
 
-    async def select_period_type(self, period_type="연간"):
+    async def select_period_type(self, period_type="연간", page=None):
         """
         연간/분기 라디오 버튼 선택
         
         Args:
             period_type (str): "연간" 또는 "분기"
+            page: 사용할 Playwright 페이지 (기본값: self.page)
             
         Returns:
             bool: 성공 여부
         """
+        page = page or self.page
         try:
-            print(f"📅 '{period_type}' 기간 타입 선택 시도 중...")
-            
-            # 다양한 셀렉터로 라디오 버튼 찾기
-            selectors = [
-                f"input[type='radio'][value*='{period_type}']",
-                f"input[type='radio'] + label:has-text('{period_type}')",
-                f"label:has-text('{period_type}') input[type='radio']",
-                f"[for*='{period_type}']",
-                f"input[id*='{period_type}']",
-                f"input[name*='period'][value*='{period_type}']",
-                f"input[name*='term'][value*='{period_type}']"
-            ]
-            
-            # 각 셀렉터로 시도
-            for selector in selectors:
+            logger.info(f"📅 '{period_type}' 기간 타입 선택 시도 중...")
+            
+            before = await self._table_signature(page)
+            
+            # 이전에 찾은 라디오 셀렉터가 있으면 바로 클릭
+            cached_selector = _get_selector_cache()['period'].get(period_type)
+            if cached_selector:
                 try:
-                    element = self.page.locator(selector).first
-                    if await element.is_visible():
-                        await element.scroll_into_view_if_needed()
-                        await self.page.wait_for_timeout(500)
-                        await element.click()
-                        print(f"✅ '{period_type}' 라디오 버튼 클릭 성공!")
-                        await self.page.wait_for_timeout(1500)  # 데이터 로딩 대기
-                        return True
-                except Exception as e:
-                    continue
+                    await page.locator(cached_selector).first.check(timeout=self.wait_timeout)
+                    logger.info(f"✅ '{period_type}' 라디오 버튼 클릭 성공! (캐시된 셀렉터: {cached_selector})")
+                    await self._wait_for_table_refresh(page, before)
+                    return True
+                except PlaywrightTimeoutError:
+                    logger.warning(f"⚠️ 캐시된 기간 타입 셀렉터가 맞지 않아 다시 탐색합니다: {cached_selector}")
+            
+            # 라디오 버튼 셀렉터를 하나의 로케이터로 묶어 보이는 첫 번째 요소 클릭
+            selector = ", ".join([
+                f"input[type='radio'][value*='{period_type}']:visible",
+                f"input[type='radio'] + label:has-text('{period_type}'):visible",
+                f"label:has-text('{period_type}') input[type='radio']:visible",
+                f"[for*='{period_type}']:visible",
+                f"input[id*='{period_type}']:visible"
+            ])
+            try:
+                element = page.locator(selector).first
+                await element.click(timeout=self.wait_timeout)
+                logger.info(f"✅ '{period_type}' 라디오 버튼 클릭 성공!")
+                _update_selector_cache('period', period_type, await element.evaluate(_RADIO_SELECTOR_JS))
+                await self._wait_for_table_refresh(page, before)  # 데이터 갱신 대기
+                return True
+            except PlaywrightTimeoutError:
+                pass
             
             # JavaScript로 직접 라디오 버튼 클릭 시도
-            print(f"🔄 JavaScript로 '{period_type}' 라디오 버튼 클릭 시도...")
+            logger.info(f"🔄 JavaScript로 '{period_type}' 라디오 버튼 클릭 시도...")
             
             js_click_script = f"""
             () => {{
@@ -352,228 +743,176 @@ class PlaywrightStockCrawler:
             }}
             """
             
-            result = await self.page.evaluate(js_click_script)
+            result = await page.evaluate(js_click_script)
             if result:
-                print(f"✅ JavaScript로 '{period_type}' 라디오 버튼 클릭 성공!")
-                await self.page.wait_for_timeout(1500)  # 데이터 로딩 대기
+                logger.info(f"✅ JavaScript로 '{period_type}' 라디오 버튼 클릭 성공!")
+                await self._wait_for_table_refresh(page, before)  # 데이터 갱신 대기
                 return True
                 
-            print(f"❌ '{period_type}' 라디오 버튼을 찾을 수 없습니다.")
+            logger.error(f"❌ '{period_type}' 라디오 버튼을 찾을 수 없습니다.")
             return False
             
         except Exception as e:
-            print(f"❌ '{period_type}' 라디오 버튼 클릭 중 오류 발생: {str(e)}")
+            logger.error(f"❌ '{period_type}' 라디오 버튼 클릭 중 오류 발생: {str(e)}")
             return False
 
-    async def click_tab(self, tab_name):
+    async def click_tab(self, tab_name, page=None):
         """
         투자분석 탭 클릭
         
         Args:
             tab_name (str): 클릭할 탭 이름
+            page: 사용할 Playwright 페이지 (기본값: self.page)
             
         Returns:
             bool: 성공 여부
         """
+        page = page or self.page
         try:
-            print(f"🖱️ '{tab_name}' 탭 클릭 시도 중...")
-            
-            # 다양한 셀렉터로 탭 찾기
-            selectors = [
-                f"text={tab_name}",
-                f"a:has-text('{tab_name}')",
-                f"span:has-text('{tab_name}')",
-                f"button:has-text('{tab_name}')",
-                f"td:has-text('{tab_name}')",
-                f"div:has-text('{tab_name}')",
-                f"[onclick*='{tab_name}']",
-                f"[href*='{tab_name}']"
-            ]
-            
-            # 각 셀렉터로 시도
-            for selector in selectors:
-                try:
-                    # 요소가 보이는지 확인
-                    element = self.page.locator(selector).first
-                    if await element.is_visible():
-                        # 요소를 화면에 스크롤
-                        await element.scroll_into_view_if_needed()
-                        await self.page.wait_for_timeout(500)
-                        
-                        # 클릭
-                        await element.click()
-                        print(f"✅ '{tab_name}' 탭 클릭 성공!")
-                        
-                        # 데이터 로딩 대기
-                        await self.page.wait_for_timeout(1500)
-                        return True
-                        
-                except Exception as e:
-                    continue
+            logger.info(f"🖱️ '{tab_name}' 탭 클릭 시도 중...")
+            
+            # 탭 셀렉터를 하나의 로케이터로 묶어 보이는 첫 번째 요소 클릭
+            # (div:has-text는 탭을 감싼 상위 영역까지 매칭되므로 텍스트가 정확히 일치하는 요소만 사용)
+            selector = ", ".join([
+                f"a:text-is('{tab_name}'):visible",
+                f"span:text-is('{tab_name}'):visible",
+                f"button:text-is('{tab_name}'):visible",
+                f"td:text-is('{tab_name}'):visible",
+                f"[onclick*='{tab_name}']:visible",
+                f"[href*='{tab_name}']:visible"
+            ])
+            try:
+                # 클릭 (데이터 로딩 대기는 extract_table_data에서 키워드 테이블 기준으로 수행)
+                await page.locator(selector).first.click(timeout=self.wait_timeout)
+                logger.info(f"✅ '{tab_name}' 탭 클릭 성공!")
+                return True
+            except PlaywrightTimeoutError:
+                pass
                     
             # JavaScript로 직접 클릭 시도
-            print(f"🔄 JavaScript로 '{tab_name}' 탭 클릭 시도...")
+            logger.info(f"🔄 JavaScript로 '{tab_name}' 탭 클릭 시도...")
             
             js_click_script = f"""
             () => {{
-                const elements = Array.from(document.querySelectorAll('*'));
-                const targetElement = elements.find(el => 
-                    el.textContent && el.textContent.trim() === '{tab_name}' &&
-                    (el.tagName === 'A' || el.tagName === 'SPAN' || el.tagName === 'BUTTON' || el.tagName === 'TD')
-                );
-                
-                if (targetElement) {{
-                    targetElement.click();
-                    return true;
+                // 탭이 될 수 있는 태그만 조회 (script/style 등 큰 텍스트 노드는 건너뜀)
+                for (const el of document.querySelectorAll('a, span, button, td')) {{
+                    if (el.textContent.trim() === '{tab_name}') {{
+                        el.click();
+                        return true;
+                    }}
                 }}
                 return false;
             }}
             """
             
-            result = await self.page.evaluate(js_click_script)
+            result = await page.evaluate(js_click_script)
             if result:
-                print(f"✅ JavaScript로 '{tab_name}' 탭 클릭 성공!")
-                await self.page.wait_for_timeout(1500)
+                logger.info(f"✅ JavaScript로 '{tab_name}' 탭 클릭 성공!")
                 return True
                 
-            print(f"❌ '{tab_name}' 탭을 찾을 수 없습니다.")
+            logger.error(f"❌ '{tab_name}' 탭을 찾을 수 없습니다.")
             return False
             
         except Exception as e:
-            print(f"❌ '{tab_name}' 탭 클릭 중 오류 발생: {str(e)}")
+            logger.error(f"❌ '{tab_name}' 탭 클릭 중 오류 발생: {str(e)}")
             return False
             
-    async def extract_table_data(self, tab_name, finGubun_type="K-IFRS(연결)"):
+    def _tab_keyword(self, tab_name, finGubun_type="K-IFRS(연결)"):
+        """
+        탭 데이터 테이블을 식별할 키워드 반환 (finGubun에 따라 활동성 키워드 변경)
+        
+        Args:
+            tab_name (str): 탭 이름
+            finGubun_type (str): finGubun 구분값
+            
+        Returns:
+            str: 키워드 (정의되지 않은 탭이면 빈 문자열)
+        """
+        if tab_name == '활동성':
+            return '자기자본회전율' if finGubun_type == "K-IFRS(연결)" else '총자산회전율'
+        
+        tab_keywords = {
+            '수익성': '매출총이익률',
+            '성장성': '매출액증가율',
+            '안정성': '부채비율'
+        }
+        return tab_keywords.get(tab_name, '')
+    
+    async def _page_state(self, page, finGubun_type, period_type, keyword):
+        """
+        finGubun/기간 타입 선택 상태와 키워드 테이블 표시 여부를 한 번의 호출로 확인
+        
+        Returns:
+            dict: {'fgOk': bool, 'ptOk': bool, 'tblOk': bool}
+        """
+        return await page.evaluate(_PAGE_STATE_JS, {
+            "sel": _DATA_TABLE_SELECTOR,
+            "fg": finGubun_type,
+            "pt": period_type,
+            "kw": keyword
+        })
+    
+    async def extract_table_data(self, tab_name, finGubun_type="K-IFRS(연결)", page=None):
         """
         현재 화면의 테이블 데이터 추출 (특정 키워드가 포함된 테이블만)
         
         Args:
             tab_name (str): 현재 탭 이름
             finGubun_type (str): finGubun 구분값 ("K-IFRS(연결)" 또는 "K-IFRS(별도)")
+            page: 사용할 Playwright 페이지 (기본값: self.page)
             
         Returns:
             pandas.DataFrame: 추출된 데이터
         """
+        page = page or self.page
         try:
-            print(f"📊 '{tab_name}' 탭에서 테이블 데이터 추출 중...")
+            logger.info(f"📊 '{tab_name}' 탭에서 테이블 데이터 추출 중...")
             
-            # 테이블 로딩 대기
-            await self.page.wait_for_timeout(1500)
+            keyword = self._tab_keyword(tab_name, finGubun_type)
+            if not keyword:
+                logger.error(f"❌ '{tab_name}' 탭에 대한 키워드가 정의되지 않았습니다.")
+                return pd.DataFrame()
             
-            # 간단한 테이블 개수 확인
-            table_count = await self.page.evaluate("""
-            () => {
-                const tables = document.querySelectorAll('table.gHead01.all-width.data-list');
-                return tables.length;
-            }
-            """)
+            # 키워드가 포함된 테이블이 렌더링될 때까지 대기
+            try:
+                await page.wait_for_function(
+                    _KEYWORD_TABLE_JS,
+                    arg=[_DATA_TABLE_SELECTOR, keyword],
+                    timeout=self.wait_timeout
+                )
+            except Exception:
+                logger.warning(f"⚠️ '{keyword}' 테이블 대기 시간 초과 - 현재 화면으로 계속 진행합니다.")
+            
+            # 대상 테이블 HTML을 한 번에 가져와서 Python(lxml)에서 파싱
+            table_htmls = await page.eval_on_selector_all(
+                _DATA_TABLE_SELECTOR, "els => els.map(e => e.outerHTML)"
+            )
+            tables = [lxml.html.fromstring(html) for html in table_htmls]
             
-            print(f"🔍 페이지에서 발견된 target 테이블 수: {table_count}개")
+            logger.debug(f"🔍 페이지에서 발견된 target 테이블 수: {len(tables)}개")
             
-            # 탭별 키워드 매핑 (finGubun에 따라 활동성 키워드 변경)
-            if tab_name == '활동성':
-                if finGubun_type == "K-IFRS(연결)":
-                    activity_keyword = '자기자본회전율'
-                else:  # K-IFRS(별도)
-                    activity_keyword = '총자산회전율'
-                    
-                tab_keywords = {
-                    '수익성': '매출총이익률',
-                    '성장성': '매출액증가율',
-                    '안정성': '부채비율',
-                    '활동성': activity_keyword
-                }
-            else:
-                tab_keywords = {
-                    '수익성': '매출총이익률',
-                    '성장성': '매출액증가율',
-                    '안정성': '부채비율',
-                    '활동성': '총자산회전율'  # 기본값
-                }
+            logger.debug(f"🔍 '{keyword}' 키워드가 포함된 테이블을 찾는 중... (finGubun: {finGubun_type})")
+            logger.debug(f"📋 현재 탭: {tab_name}, 사용할 키워드: {keyword}")
             
-            keyword = tab_keywords.get(tab_name, '')
-            if not keyword:
-                print(f"❌ '{tab_name}' 탭에 대한 키워드가 정의되지 않았습니다.")
-                return pd.DataFrame()
+            table_data = []
             
-            print(f"🔍 '{keyword}' 키워드가 포함된 테이블을 찾는 중... (finGubun: {finGubun_type})")
-            print(f"📋 현재 탭: {tab_name}, 사용할 키워드: {keyword}")
+            # 키워드가 포함된 첫 번째 테이블 사용
+            for table in tables:
+                if keyword in table.text_content():
+                    rows = self._extract_table_rows(table)
+                    if len(rows) > 1:
+                        table_data.append(rows)
+                        break
             
-            # JavaScript로 키워드가 포함된 테이블 찾기
-            table_data = await self.page.evaluate(f"""
-            () => {{
-                const keyword = '{keyword}';
-                const results = [];
-                
-                // 모든 테이블 검사
-                const allTables = document.querySelectorAll('table.gHead01.all-width.data-list');
-                console.log('Found all target tables:', allTables.length);
-                
-                for (const table of allTables) {{
-                    // 테이블 내용에서 키워드 검색
-                    const tableText = table.textContent;
-                    if (tableText.includes(keyword)) {{
-                        console.log('Found table with keyword:', keyword);
-                        
-                        const rows = table.querySelectorAll('tr');
-                        if (rows.length > 1) {{
-                            const tableData = [];
-                            
-                            for (const row of rows) {{
-                                const cells = row.querySelectorAll('td, th');
-                                if (cells.length > 0) {{
-                                    const rowData = [];
-                                    for (const cell of cells) {{
-                                        const text = cell.textContent.trim();
-                                        rowData.push(text);
-                                    }}
-                                    if (rowData.some(cell => cell)) {{
-                                        tableData.push(rowData);
-                                    }}
-                                }}
-                            }}
-                            
-                            if (tableData.length > 1) {{
-                                results.push(tableData);
-                                console.log('Extracted table data rows:', tableData.length);
-                                break; // 첫 번째 매칭 테이블만 사용
-                            }}
-                        }}
-                    }}
-                }}
-                
-                if (results.length === 0) {{
-                    console.log('No table found with keyword:', keyword);
-                    // 대체: 첫 번째 유효한 테이블 사용
-                    for (const table of allTables) {{
-                        const rows = table.querySelectorAll('tr');
-                        if (rows.length > 5) {{ // 최소 5행 이상인 테이블
-                            const tableData = [];
-                            for (const row of rows) {{
-                                const cells = row.querySelectorAll('td, th');
-                                if (cells.length > 0) {{
-                                    const rowData = [];
-                                    for (const cell of cells) {{
-                                        const text = cell.textContent.trim();
-                                        rowData.push(text);
-                                    }}
-                                    if (rowData.some(cell => cell)) {{
-                                        tableData.push(rowData);
-                                    }}
-                                }}
-                            }}
-                            if (tableData.length > 1) {{
-                                results.push(tableData);
-                                console.log('Using fallback table with rows:', tableData.length);
-                                break;
-                            }}
-                        }}
-                    }}
-                }}
-                
-                return results;
-            }}
-            """)
+            if not table_data:
+                logger.warning(f"⚠️ '{keyword}' 키워드가 포함된 테이블이 없어 대체 테이블을 찾습니다.")
+                # 대체: 첫 번째 유효한 테이블 사용 (최소 5행 이상)
+                for table in tables:
+                    if len(table.xpath('.//tr')) > 5:
+                        rows = self._extract_table_rows(table)
+                        if len(rows) > 1:
+                            table_data.append(rows)
+                            break
             
             if table_data:
                 # 가장 많은 컬럼을 가진 테이블 선택 (투자분석 데이터는 연도별 컬럼이 많음)
@@ -619,16 +958,34 @@ class PlaywrightStockCrawler:
                     # 계층 구조 파싱 (id와 parent_id 컬럼 추가)
                     df = self._add_hierarchy_columns(df)
                     
-                    print(f"✅ '{tab_name}' 탭에서 {len(df)}행의 데이터를 추출했습니다.")
+                    logger.info(f"✅ '{tab_name}' 탭에서 {len(df)}행의 데이터를 추출했습니다.")
                     return df
                     
-            print(f"❌ '{tab_name}' 탭에서 테이블 데이터를 찾을 수 없습니다.")
+            logger.error(f"❌ '{tab_name}' 탭에서 테이블 데이터를 찾을 수 없습니다.")
             return pd.DataFrame()
             
         except Exception as e:
-            print(f"❌ '{tab_name}' 탭에서 데이터 추출 중 오류 발생: {str(e)}")
+            logger.error(f"❌ '{tab_name}' 탭에서 데이터 추출 중 오류 발생: {str(e)}")
             return pd.DataFrame()
     
+    @staticmethod
+    def _extract_table_rows(table):
+        """
+        lxml 테이블 요소에서 행별 셀 텍스트 추출 (빈 행 제외)
+        
+        Args:
+            table (lxml.html.HtmlElement): 테이블 요소
+            
+        Returns:
+            list: 행별 셀 텍스트 리스트
+        """
+        rows = []
+        for tr in table.iter('tr'):
+            row = [cell.text_content().strip() for cell in tr.xpath('.//td | .//th')]
+            if any(row):
+                rows.append(row)
+        return rows
+    
     def _add_hierarchy_columns(self, df):
         """
         데이터프레임에 계층 구조를 나타내는 id와 parent_id 컬럼을 추가
@@ -646,60 +1003,52 @@ class PlaywrightStockCrawler:
             # 첫 번째 컬럼을 항목명으로 가정
             item_column = df.columns[0]
             
-            # id와 parent_id 컬럼 초기화 (parent_id는 공백으로 설정)
-            df['id'] = range(1, len(df) + 1)
-            df['parent_id'] = ''
-            
-            # 계층 구조 파싱 - 간단한 방식
-            last_parent_id = None  # 가장 최근의 "펼치기" 항목 ID
-            
-            for idx, row in df.iterrows():
-                item_text = str(row[item_column]).strip()
-                current_id = row['id']
-                
-                # "펼치기"가 있는지 확인 (텍스트 정리 전에)
-                is_parent = self._is_parent_item(item_text)
+            # 항목명 배열을 한 번만 꺼내서 단일 패스로 계층 구조 파싱 + 텍스트 정리
+            items = df[item_column].to_numpy(dtype=object)
+            ids = np.arange(1, len(items) + 1)
+            parent_ids = np.empty(len(items), dtype=object)
+            cleaned = [None] * len(items)
+            last_parent_id = ''
+            for i, item in enumerate(items):
+                item_text = str(item).strip()
                 
-                if is_parent:
-                    # "펼치기"가 있으면 상위 객체 → 부모 ID 업데이트
-                    last_parent_id = current_id
-                    # 상위 객체는 parent_id가 공백 (최상위)
-                    df.at[idx, 'parent_id'] = ''
+                # "펼치기"가 있으면 상위 객체(parent_id 공백), 없으면 가장 최근 상위 객체의 자식
+                if self._is_parent_item(item_text):
+                    last_parent_id = i + 1
+                    parent_ids[i] = ''
                 else:
-                    # "펼치기"가 없으면 하위 객체 → 가장 최근 부모의 자식
-                    if last_parent_id is not None:
-                        df.at[idx, 'parent_id'] = last_parent_id
-                    else:
-                        df.at[idx, 'parent_id'] = ''
+                    parent_ids[i] = last_parent_id
                 
-                # 마지막에 텍스트 정리 (펼치기 제거)
-                clean_text = self._clean_item_text(item_text)
-                df.at[idx, item_column] = clean_text
-                    
-            # 컬럼 순서 재정렬 (id, parent_id를 맨 앞으로)
-            cols = ['id', 'parent_id'] + [col for col in df.columns if col not in ['id', 'parent_id']]
-            df = df[cols]
+                # 텍스트 정리 (펼치기 제거)
+                cleaned[i] = self._clean_item_text(item_text)
             
-            # 계층 구조 분석 결과 출력
-            parent_count = len([x for x in df['parent_id'] if x != ''])
-            parent_items = len([True for idx, row in df.iterrows() if self._is_parent_item(str(row[item_column]) + ("펼치기" if row.get('parent_id') != '' else ""))])
-            
-            print(f"🔗 계층 구조 파싱 완료:")
-            print(f"   - 하위 항목: {parent_count}개")
-            print(f"   - 상위 항목: {len(df) - parent_count}개")
+            # 정리된 항목명과 id, parent_id를 한 번에 반영
+            df[item_column] = cleaned
+            df.insert(0, 'parent_id', parent_ids)
+            df.insert(0, 'id', ids)
             
-            # 디버깅: 처음 몇 개 항목의 계층 구조 출력
-            if len(df) > 0:
-                print(f"📋 계층 구조 예시 (처음 5개):")
-                for i, (idx, row) in enumerate(df.head(5).iterrows()):
-                    item_name = str(row[item_column])[:30] + "..." if len(str(row[item_column])) > 30 else str(row[item_column])
-                    parent_info = f"→ 부모ID: {row['parent_id']}" if row['parent_id'] != '' else "→ 최상위"
-                    print(f"   {row['id']:2d}. {item_name:35s} {parent_info}")
+            # 계층 구조 분석 결과 출력
+            n_children = int((parent_ids != '').sum())
+            n_parents = len(parent_ids) - n_children
+            
+            logger.info(f"🔗 계층 구조 파싱 완료:")
+            logger.info(f"   - 하위 항목: {n_children}개")
+            logger.info(f"   - 상위 항목: {n_parents}개")
+            
+            # 디버깅: 처음 몇 개 항목의 계층 구조 출력 (DEBUG_HIERARCHY=1일 때만)
+            if os.environ.get('DEBUG_HIERARCHY') == '1' and len(df) > 0:
+                logger.info(f"📋 계층 구조 예시 (처음 5개):")
+                names = df[item_column].iloc[:5].astype(str)
+                names = names.where(names.str.len() <= 30, names.str.slice(0, 30) + "...")
+                head_parents = parent_ids[:5]
+                parents = np.where(head_parents != '', np.char.add("→ 부모ID: ", head_parents.astype(str)), "→ 최상위")
+                for item_id, item_name, parent_info in zip(ids[:5], names, parents):
+                    logger.info(f"   {item_id:2d}. {item_name:35s} {parent_info}")
             
             return df
             
         except Exception as e:
-            print(f"❌ 계층 구조 파싱 중 오류: {str(e)}")
+            logger.error(f"❌ 계층 구조 파싱 중 오류: {str(e)}")
             # 오류 발생시 기본 id만 추가하고 반환
             df['id'] = range(1, len(df) + 1)
             df['parent_id'] = ''
@@ -717,16 +1066,17 @@ class PlaywrightStockCrawler:
         """
         try:
             # 모든 컬럼에 대해 콤마 제거 (id, parent_id, company_code는 제외)
-            for col in df.columns:
-                if col not in ['id', 'parent_id', 'company_code'] and len(df.columns) > 1:
-                    # 문자열로 변환 후 콤마 제거
-                    df[col] = df[col].astype(str).str.replace(',', '', regex=False)
+            if len(df.columns) > 1:
+                cols = df.columns.difference(['id', 'parent_id', 'company_code'], sort=False)
+                if len(cols):
+                    # 대상 컬럼 블록 전체에서 한 번의 replace로 콤마 제거
+                    df[cols] = df[cols].astype(str).replace(',', '', regex=True)
             
-            print(f"🧹 숫자값 콤마 제거 완료")
+            logger.info(f"🧹 숫자값 콤마 제거 완료")
             return df
             
         except Exception as e:
-            print(f"⚠️ 숫자값 정리 중 오류: {str(e)}")
+            logger.warning(f"⚠️ 숫자값 정리 중 오류: {str(e)}")
             return df
     
     def _clean_column_name(self, column_name):
@@ -744,27 +1094,29 @@ class PlaywrightStockCrawler:
         
         # 1. 연간컨센서스보기 패턴 제거: "\n...보기" -> ""
         if "연간컨센서스보기" in column_name:
-            column_name = re.sub(r'\n.*?보기', '', column_name)
+            column_name = _RE_CONSENSUS_OPEN.sub('', column_name)
         
         # 2. 연간컨센서스닫기 패턴 변환: "\n...닫기" -> "(연간컨센서스)"
         if "연간컨센서스닫기" in column_name:
-            column_name = re.sub(r'\n.*?닫기', '(연간컨센서스)', column_name)
+            column_name = _RE_CONSENSUS_CLOSE.sub('(연간컨센서스)', column_name)
         
         # 3. _1 패턴 변환: "_1" -> "(연간컨센서스)"
         if column_name.endswith('_1'):
             column_name = column_name.replace('_1', '(연간컨센서스)')
         
         # 4. 기타 개행문자와 탭 정리
-        column_name = re.sub(r'[\n\t\r]+', ' ', column_name)
+        column_name = _RE_WS_CTRL.sub(' ', column_name)
         
         # 5. 연속된 공백을 하나로 변환
-        column_name = re.sub(r'\s+', ' ', column_name)
+        column_name = _RE_WS_MULTI.sub(' ', column_name)
         
         return column_name.strip()
     
-    def _clean_item_text(self, text):
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _clean_item_text(text):
         """
-        항목 텍스트에서 불필요한 문자 제거
+        항목 텍스트에서 불필요한 문자 제거 (탭/finGubun 간 같은 항목명이 반복되므로 캐시)
         
         Args:
             text (str): 원본 텍스트
@@ -782,14 +1134,15 @@ class PlaywrightStockCrawler:
         clean_text = ' '.join(clean_text.split())
         
         # 접기/펼치기 관련 특수문자 제거
-        clean_text = clean_text.replace('▼', '').replace('▲', '').replace('△', '').replace('▽', '')
-        clean_text = clean_text.replace('+', '').replace('-', '').strip()
+        clean_text = clean_text.translate(_EXPAND_CHARS_TABLE).strip()
         
         return clean_text
     
-    def _is_parent_item(self, text):
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _is_parent_item(text):
         """
-        해당 항목이 상위 항목(접기/펼치기가 가능한 항목)인지 판단
+        해당 항목이 상위 항목(접기/펼치기가 가능한 항목)인지 판단 (결과 캐시)
         
         Args:
             text (str): 분석할 텍스트
@@ -805,14 +1158,13 @@ class PlaywrightStockCrawler:
             return True
             
         # 접기/펼치기 관련 특수문자가 있으면 상위 항목
-        expand_collapse_chars = ['▼', '▲', '△', '▽', '+', '-']
-        if any(char in text for char in expand_collapse_chars):
+        # (_clean_item_text와 같은 삭제 테이블 사용 - 문자가 지워지면 길이가 달라짐)
+        if len(text.translate(_EXPAND_CHARS_TABLE)) != len(text):
             return True
             
         # 특정 패턴의 항목명 (예: "수익성 지표", "성장성 분석" 등)
-        parent_keywords = ['지표', '분석', '비율', '현황', '상황', '내역']
-        clean_text = self._clean_item_text(text)
-        if any(keyword in clean_text for keyword in parent_keywords):
+        clean_text = PlaywrightStockCrawler._clean_item_text(text)
+        if any(keyword in clean_text for keyword in _PARENT_KEYWORDS):
             return True
             
         return False
@@ -830,20 +1182,22 @@ class PlaywrightStockCrawler:
         if df.empty or 'yyyy' not in df.columns or 'month' not in df.columns:
             return None, None
         
-        # 가장 많이 나타나는 연도/월 찾기
-        year_counts = df['yyyy'].value_counts()
-        month_counts = df['month'].value_counts()
+        # 가장 많이 나타나는 연도/월 찾기 (정렬 없이 np.unique 카운트의 argmax)
+        years = df['yyyy'].dropna().to_numpy(dtype=str)
+        months = df['month'].dropna().to_numpy(dtype=str)
         
-        if not year_counts.empty and not month_counts.empty:
-            most_common_year = year_counts.index[0]
-            most_common_month = month_counts.index[0]
+        if years.size and months.size:
+            year_values, year_counts = np.unique(years, return_counts=True)
+            month_values, month_counts = np.unique(months, return_counts=True)
+            most_common_year = year_values[year_counts.argmax()]
+            most_common_month = month_values[month_counts.argmax()]
             
-            print(f"📅 크롤링된 데이터에서 추출된 연도/월: {most_common_year}/{most_common_month}")
+            logger.info(f"📅 크롤링된 데이터에서 추출된 연도/월: {most_common_year}/{most_common_month}")
             return most_common_year, most_common_month
         
         return None, None
 
-    def save_data_by_yyyymm(self, df, output_dir, period_type, s3_bucket=None, save_local=True):
+    def save_data_by_yyyymm(self, df, output_dir, period_type, s3_bucket=None, save_local=True, file_format=None):
         """
         yyyymm별로 데이터를 분리하여 저장
         
@@ -853,112 +1207,117 @@ class PlaywrightStockCrawler:
             period_type (str): "연간" 또는 "분기"
             s3_bucket (str): S3 버킷명 (선택사항)
             save_local (bool): 로컬 저장 여부 (기본값: True)
+            file_format (str): "csv" 또는 "parquet" (기본값: 환경변수 OUTPUT_FORMAT, 없으면 "csv")
         """
         if df.empty or 'yyyy' not in df.columns or 'month' not in df.columns:
-            print("❌ yyyy, month 컬럼이 없어 데이터를 분리할 수 없습니다.")
+            logger.error("❌ yyyy, month 컬럼이 없어 데이터를 분리할 수 없습니다.")
             return
         
-        # yyyymm 컬럼 생성
-        df['yyyymm'] = df['yyyy'].astype(str) + df['month'].astype(str).str.zfill(2)
-        
-        # 고유한 yyyymm 값들 찾기
-        unique_yyyymm = sorted(df['yyyymm'].unique())
-        print(f"📅 발견된 yyyymm: {unique_yyyymm}")
-        
-        # 가장 큰 yyyymm 찾기 (분석 데이터용)
-        max_yyyymm = max(unique_yyyymm)
-        print(f"📅 분석 데이터(전년대비/전분기대비)가 포함될 최신 년월: {max_yyyymm}")
-
-        # 각 yyyymm별로 데이터 분리하여 저장
-        for yyyymm in unique_yyyymm:
-            # 해당 yyyymm 데이터만 필터링
-            yyyymm_data = df[df['yyyymm'] == yyyymm].copy()
-
-            # 분석 데이터는 최신 년월에만 포함
-            if yyyymm != max_yyyymm and 'column_type' in yyyymm_data.columns:
-                # 최신 년월이 아니면 분석 데이터 제외
-                filtered_df = yyyymm_data[yyyymm_data['column_type'] != 'analysis_data'].copy()
-                excluded_count = len(yyyymm_data) - len(filtered_df)
-                if excluded_count > 0:
-                    print(f"📊 {yyyymm}: 분석 데이터 {excluded_count}개 제외 (최신 년월 {max_yyyymm}에만 포함)")
-            else:
-                # 최신 년월이거나 column_type 컬럼이 없으면 모든 데이터 포함
-                filtered_df = yyyymm_data.copy()
-            
-            if not filtered_df.empty:
-                # 파일명 생성
-                period_suffix = "_annual" if period_type == "연간" else "_quarterly"
-                filename = f"{output_dir}/{yyyymm}_all_companies{period_suffix}_transformed.csv"
-                
-                # 로컬 CSV 저장 (save_local이 True인 경우)
-                if save_local:
-                    # 저장 전 데이터 타입 조정: value 컬럼만 숫자로, 나머지는 문자열로
-                    df_to_save = filtered_df.copy()
-                    for col in df_to_save.columns:
-                        if col != 'value':
-                            df_to_save[col] = df_to_save[col].astype(str)
-                    
-                    df_to_save.to_csv(filename, index=False, encoding='utf-8-sig')
-                    print(f"💾 {yyyymm} 로컬 데이터 저장: {filename} ({len(filtered_df)}행)")
-                else:
-                    print(f"⏭️ {yyyymm} 로컬 저장 생략 (save_local=False)")
-                
-                # S3 업로드 (버킷이 지정된 경우)
-                if s3_bucket:
-                    try:
-                        # 기간 타입을 영어로 변환
-                        period_type_en = "annual" if period_type == "연간" else "quarter"
-                        
-                        # yyyymm에서 연도와 월 추출
-                        year = yyyymm[:4]
-                        month = yyyymm[4:6]
-                        
-                        # S3 키 생성
-                        s3_key = generate_s3_key(period_type_en, year, month)
-                        
-                        print(f"📤 S3 업로드 준비: s3://{s3_bucket}/{s3_key}")
-                        print(f"📅 데이터 연도/월: {year}/{month}")
-                        
-                        # S3 업로드 (로컬 파일이 있어야 업로드 가능)
-                        if save_local:
-                            s3_upload_result = upload_file_to_s3(filename, s3_bucket, s3_key)
-                            
-                            if s3_upload_result.get("success"):
-                                print(f"✅ S3 업로드 성공: {s3_upload_result['s3_url']}")
-                                print(f"📦 파일 크기: {s3_upload_result['size']} bytes")
-                            else:
-                                print(f"❌ S3 업로드 실패: {s3_upload_result.get('error', '알 수 없는 오류')}")
-                        else:
-                            print(f"⚠️ S3 업로드 건너뜀: 로컬 파일이 생성되지 않았습니다 (save_local=False)")
-                            
-                    except Exception as e:
-                        print(f"❌ S3 업로드 과정에서 오류: {str(e)}")
-            else:
-                print(f"⚠️ {yyyymm} 데이터가 비어있어 저장하지 않았습니다.")
+        # yyyymm 컬럼 생성 (yyyy/month는 transform_to_row_format에서 문자열로 생성됨, 이미 있으면 재사용)
+        if 'yyyymm' not in df.columns:
+            df = df.assign(yyyymm=df['yyyy'].str.cat(df['month'].str.zfill(2)))
+        
+        # 가장 큰 yyyymm (분석 데이터용)
+        writer = PerYYYYMMWriter(output_dir, period_type, s3_bucket, save_local, file_format,
+                                 latest_yyyymm=df['yyyymm'].max())
+        writer.add(df)
+        writer.close()
 
             
     async def cleanup(self):
-        """브라우저 종료 및 정리"""
-        try:
-            if self.page:
-                await self.page.close()
-            if hasattr(self, 'context') and self.context:
-                await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if hasattr(self, 'playwright'):
-                await self.playwright.stop()
-            print("🧹 브라우저를 종료했습니다.")
-        except Exception as e:
-            print(f"⚠️ 브라우저 종료 중 오류: {str(e)}")
+        """
+        크롤러가 사용한 컨텍스트 정리
+        
+        브라우저는 다음 호출에서 재사용하도록 남겨둔다 (종료는 close_shared_browser).
+        """
+        # 한 리소스의 종료 실패가 나머지 종료를 막지 않도록 동시에 닫고 오류는 개별 기록
+        closers = []
+        if self.page:
+            closers.append(self.page.close())
+        if self.context:
+            closers.append(self.context.close())
+        closers.extend(context.close() for context, _ in self._idle_contexts)
+        
+        results = await asyncio.gather(*closers, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ 브라우저 컨텍스트 정리 중 오류: {str(result)}")
+        
+        self.page = None
+        self.context = None
+        self._idle_contexts = []
+        self.browser = None
+        logger.info("🧹 브라우저 컨텍스트를 정리했습니다.")
     
     async def close_browser(self):
         """브라우저 정리 (별칭 메서드)"""
         await self.cleanup()
+    
+    async def __aenter__(self):
+        """async with 진입 시 브라우저 설정"""
+        await self.setup_browser()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """async with 종료 시 컨텍스트 정리 (예외는 그대로 전파)"""
+        await self.cleanup()
+        return False
+            
+    async def _run_tab(self, url, company_name, tab, finGubun_type, period_type):
+        """
+        작업 전용 페이지에서 (finGubun, 탭) 한 조합을 크롤링
+        
+        컨텍스트는 PAGES_PER_CONTEXT 페이지까지 재사용한 뒤 닫아 메모리 증가를 제한한다.
+        
+        Args:
+            url (str): 크롤링할 URL
+            company_name (str): 회사명
+            tab (str): 탭 이름
+            finGubun_type (str): "K-IFRS(연결)" 또는 "K-IFRS(별도)"
+            period_type (str): "연간" 또는 "분기"
+            
+        Returns:
+            pandas.DataFrame: 추출된 데이터 (실패 시 빈 DataFrame)
+        """
+        async with self._tab_semaphore:
+            context, pages_used = await self._acquire_context()
+            page = None
+            try:
+                page = await context.new_page()
+                await self.navigate_to_page(url, page)
+                
+                # 현재 선택 상태를 한 번에 확인 후 필요한 액션만 수행
+                state = await self._page_state(page, finGubun_type, period_type, self._tab_keyword(tab, finGubun_type))
+                
+                # 기간 타입 선택 (연간/분기)
+                if not state['ptOk'] and not await self.select_period_type(period_type, page):
+                    logger.warning(f"⚠️ {company_name}: '{period_type}' 기간 타입 선택에 실패했지만 크롤링을 계속 진행합니다.")
+                
+                # finGubun 선택
+                if not state['fgOk'] and not await self.select_finGubun(finGubun_type, page):
+                    logger.warning(f"⚠️ {company_name}: '{finGubun_type}' finGubun 선택에 실패했지만 크롤링을 계속 진행합니다.")
+                
+                # 선택 변경 없이 이미 해당 탭 테이블이 보이면 탭 클릭 생략
+                already_on_tab = state['ptOk'] and state['fgOk'] and state['tblOk']
+                if not already_on_tab and not await self.click_tab(tab, page):
+                    logger.error(f"❌ {finGubun_type} - {tab}: 탭 클릭 실패")
+                    return pd.DataFrame()
+                
+                return await self.extract_table_data(tab, finGubun_type, page)
+                
+            except Exception as e:
+                logger.error(f"❌ {company_name} {finGubun_type} - {tab} 크롤링 중 오류: {str(e)}")
+                pages_used = self.pages_per_context  # 오류가 난 컨텍스트는 재사용하지 않음
+                return pd.DataFrame()
+                
+            finally:
+                if page:
+                    await page.close()
+                await self._release_context(context, pages_used + 1)
             
     async def _crawl_single_company(self, url, company_code, company_name, period_type="연간"):
         """
-        단일 회사 크롤링 (브라우저 재사용)
+        단일 회사 크롤링 (브라우저 재사용, 탭/finGubun 조합 병렬 실행)
         
         Args:
             url (str): 크롤링할 URL
@@ -970,82 +1329,45 @@ class PlaywrightStockCrawler:
             dict: 크롤링 결과
         """
         try:
-            # 페이지 이동
-            await self.navigate_to_page(url)
-            
-            # 기간 타입 선택 (연간/분기)
-            print(f"📅 {company_name}: 기간 타입 '{period_type}' 선택 중...")
             if period_type == "annual":
                 period_type = "연간"
             elif period_type == "quarter":
                 period_type = "분기"
             
-            period_selected = await self.select_period_type(period_type)
-            if not period_selected:
-                print(f"⚠️ {company_name}: '{period_type}' 기간 타입 선택에 실패했지만 크롤링을 계속 진행합니다.")
-            
             # finGubun 구분값들
             finGubun_types = ['K-IFRS(연결)', 'K-IFRS(별도)']
             tabs = ['수익성', '성장성', '안정성', '활동성']
-            results = {}
+            jobs = list(product(finGubun_types, tabs))
             
-            # finGubun별로 크롤링
-            for finGubun_idx, finGubun_type in enumerate(finGubun_types):
-                print(f"\n{'='*50}")
-                print(f"[{finGubun_idx+1}/2] {company_name}: '{finGubun_type}' 크롤링 시작")
-                print(f"{'='*50}")
-                
-                # finGubun 선택
-                finGubun_selected = await self.select_finGubun(finGubun_type)
-                if not finGubun_selected:
-                    print(f"⚠️ {company_name}: '{finGubun_type}' finGubun 선택에 실패했지만 크롤링을 계속 진행합니다.")
-                    # finGubun 선택 실패 시에도 탭 크롤링을 시도해보자
-                else:
-                    print(f"✅ {company_name}: '{finGubun_type}' finGubun 선택 성공!")
+            logger.info(f"🚀 {company_name}: {len(jobs)}개 탭 작업 병렬 실행 (기간: {period_type}, 동시 실행: {self.max_concurrency})")
+            frames = await asyncio.gather(*[
+                self._run_tab(url, company_name, tab, finGubun_type, period_type)
+                for finGubun_type, tab in jobs
+            ])
+            
+            results = {}
+            for (finGubun_type, tab), df in zip(jobs, frames):
+                if df.empty:
+                    logger.error(f"❌ {finGubun_type} - {tab}: 데이터 없음")
+                    continue
                 
-                # 각 탭별로 크롤링
-                for i, tab in enumerate(tabs):
-                    print(f"[{i+1}/4] {finGubun_type} - {tab} 탭 크롤링 중...")
-                    
-                    if await self.click_tab(tab):
-                        df = await self.extract_table_data(tab, finGubun_type)
-                        if not df.empty:
-                            # finGubun 정보를 데이터에 추가 (중복 체크)
-                            if 'finGubun' not in df.columns:
-                                if len(df.columns) > 0:
-                                    df.insert(0, 'finGubun', finGubun_type)
-                                else:
-                                    df['finGubun'] = finGubun_type
-                            
-                            # 결과 저장 (키에 finGubun 포함)
-                            result_key = f"{finGubun_type}_{tab}"
-                            results[result_key] = df
-                            print(f"✅ {finGubun_type} - {tab}: {len(df)}행")
-                        else:
-                            print(f"❌ {finGubun_type} - {tab}: 데이터 없음")
-                            print(f"🔍 {finGubun_type} - {tab}: 빈 테이블인지 확인 중...")
-                            # 빈 테이블에 대한 추가 정보 출력
+                # finGubun 정보를 데이터에 추가 (중복 체크)
+                if 'finGubun' not in df.columns:
+                    if len(df.columns) > 0:
+                        df.insert(0, 'finGubun', finGubun_type)
                     else:
-                        print(f"❌ {finGubun_type} - {tab}: 탭 클릭 실패")
-                    
-                    # 탭 간 대기
-                    await self.page.wait_for_timeout(1000)
+                        df['finGubun'] = finGubun_type
                 
-                # finGubun 구분 간 대기
-                if finGubun_idx < len(finGubun_types) - 1:
-                    print(f"⏳ 다음 finGubun 크롤링을 위해 1초 대기...")
-                    await self.page.wait_for_timeout(1000)
+                # 결과 저장 (키에 finGubun 포함)
+                results[f"{finGubun_type}_{tab}"] = df
+                logger.info(f"✅ {finGubun_type} - {tab}: {len(df)}행")
                 
             return results
             
         except Exception as e:
-            print(f"❌ {company_name} 크롤링 중 오류: {str(e)}")
+            logger.error(f"❌ {company_name} 크롤링 중 오류: {str(e)}")
             return {}
     
-    
-            
-    
-    
     def _extract_data_type_from_column(self, column_name):
         """
         컬럼명에서 데이터 타입을 추출하는 함수 (finGubun 값에서 연결/별도만 추출)
@@ -1057,14 +1379,12 @@ class PlaywrightStockCrawler:
             str: 데이터 타입 (예: "연결", "별도")
         """
         try:
-            if not column_name or '(' not in column_name:
+            # '별도'가 없으면 어떤 경로로도 '연결'(기본값 포함)이므로 정규식 생략
+            if not column_name or '(' not in column_name or '별도' not in column_name:
                 return '연결'  # 기본값
 
-            import re
-
             # IFRS/GAAP 관련 괄호 내용에서 연결/별도 추출
-            ifrs_pattern = r'\(([^()]*(?:IFRS|GAAP)[^()]*)\)'
-            matches = re.findall(ifrs_pattern, column_name)
+            matches = _RE_IFRS_PAREN.findall(column_name)
 
             if matches:
                 data_type = matches[0]  # 첫 번째 IFRS 관련 매치
@@ -1078,7 +1398,7 @@ class PlaywrightStockCrawler:
                     return '연결'  # 기본값
 
             # IFRS 패턴이 없으면 첫 번째 괄호에서 연결/별도 찾기
-            first_paren_content = re.search(r'\((.*?)\)', column_name)
+            first_paren_content = _RE_FIRST_PAREN.search(column_name)
             if first_paren_content:
                 content = first_paren_content.group(1)
 
@@ -1091,9 +1411,180 @@ class PlaywrightStockCrawler:
             return '연결'  # 기본값
 
         except Exception as e:
-            print(f"⚠️ 데이터 타입 추출 중 오류: {str(e)}")
+            logger.warning(f"⚠️ 데이터 타입 추출 중 오류: {str(e)}")
             return '연결'  # 기본값
     
+    def _split_transform_columns(self, columns, period_type):
+        """
+        변환 대상 컬럼을 연도 컬럼과 분석 컬럼으로 구분
+
+        Args:
+            columns (Iterable[str]): 원본 데이터 컬럼들
+            period_type (str): 조회 기간 타입 ("연간" 또는 "분기")
+
+        Returns:
+            tuple: (연도 컬럼 리스트, 분석 컬럼 리스트)
+        """
+        # 1. 연도 컬럼들 (yyyy/mm 패턴이 있는 컬럼 - 연결/별도 구분 없이 모든 재무 데이터)
+        year_columns = [col for col in columns if _RE_YEAR.search(col)]
+        
+        # 2. 분석 컬럼들 (기간 타입에 따라 분기/연간 구분)
+        if period_type == "분기":
+            # 분기 조회: QoQ, 전분기대비 등 분기 관련 분석 컬럼만
+            analysis_keywords = ['QoQ', '전분기대비', '분기증감률']
+        else:
+            # 연간 조회: YoY, 전년대비 등 연간 관련 분석 컬럼만
+            analysis_keywords = ['YoY', '전년대비', '증감률', 'CAGR']
+        
+        # 연도 컬럼으로 이미 잡힌 컬럼은 제외 (한 번의 melt에서 컬럼당 메타데이터는 하나)
+        year_column_set = set(year_columns)
+        analysis_columns = [col for col in columns
+                            if col not in year_column_set and any(keyword in col for keyword in analysis_keywords)]
+        return year_columns, analysis_columns
+    
+    @staticmethod
+    def _latest_year_month(year_columns):
+        """
+        연도 컬럼들 중 가장 큰 연도/월 찾기 (분석 데이터 매핑용) - 정규식으로 안전하게 추출
+
+        Args:
+            year_columns (Iterable[str]): 연도 컬럼들
+
+        Returns:
+            tuple: (연도, 월) 문자열, 없으면 ('', '')
+        """
+        max_year = ''
+        max_month = ''
+        for year_col in year_columns:
+            year_match = _RE_YEAR.search(year_col)
+            if year_match:
+                year_period = year_match.group()  # "2024/09"
+                yy, mm = year_period.split('/')
+                if yy.isdigit() and (not max_year or yy > max_year):
+                    max_year = yy
+                    max_month = mm
+        return max_year, max_month
+    
+    def _melt_to_rows(self, df, period_type, year_columns, analysis_columns, max_year, max_month):
+        """
+        하나의 프레임을 long 포맷으로 변환 (로그 출력 없이 변환만 수행)
+
+        Args:
+            df (pd.DataFrame): 원본 데이터
+            period_type (str): 조회 기간 타입 ("연간" 또는 "분기")
+            year_columns (list): 변환할 연도 컬럼들
+            analysis_columns (list): 변환할 분석 컬럼들
+            max_year (str): 분석 데이터가 매핑될 연도
+            max_month (str): 분석 데이터가 매핑될 월
+
+        Returns:
+            pd.DataFrame: 변환된 데이터 (column_name, value 및 컬럼 메타데이터 포함)
+        """
+        # 행 위치 기준으로 다시 정렬할 수 있도록 인덱스 초기화
+        frame = df.reset_index(drop=True)
+        columns = frozenset(frame.columns)
+        
+        # 행마다 같은 회사/구분 정보는 melt 전에 (원본 행 수만큼만) 한 번 정리
+        # 조회구분 정보 (없으면 기본값)
+        if 'search_type' not in columns:
+            frame['search_type'] = '연간'
+        # company_code가 있으면 6자리 문자열로 보장, 없으면 단일 회사 크롤링 기본값
+        if 'company_code' in columns:
+            frame['company_code'] = frame['company_code'].astype(str).str.zfill(6)
+        else:
+            frame['company_code'] = '004150'
+        if 'company_name' not in columns:
+            frame['company_name'] = '한솔홀딩스'
+        # finGubun이 없는 경우 기본값 설정
+        if 'finGubun' not in columns:
+            frame['finGubun'] = 'K-IFRS(연결)'
+        
+        id_vars = [col for col in ('tab', 'id', 'parent_id', '항목', 'search_type', 'company_code', 'company_name', 'finGubun')
+                   if col in frame.columns]
+        
+        # 컬럼별 메타데이터 (column_type, yyyy, month, value_type, data_type)는 컬럼 단위로 한 번만 계산
+        # period_type에 따라 연도 컬럼의 column_type 구분
+        year_column_type = 'period_data' if period_type == "분기" else 'year_data'
+        column_meta = {}
+        for col in year_columns:
+            yy, mm = _RE_YEAR.search(col).group().split('/')
+            # value_type 결정 (E가 있으면 Expected, 없으면 Real)
+            value_type = 'Expected' if '(E)' in col else 'Real'
+            column_meta[col] = (year_column_type, yy, mm, value_type, self._extract_data_type_from_column(col))
+        
+        # 분석 컬럼들은 최신 년월에만 추가 (분석 데이터는 모두 Real - 실제 계산된 값)
+        for col in analysis_columns:
+            data_type = self._extract_data_type_from_column(col) if '(' in col else 'analysis'
+            column_meta[col] = ('analysis_data', max_year, max_month, 'Real', data_type)
+        
+        # 연도/분석 컬럼을 한 번에 long 포맷으로 변환
+        # 값 블록을 행 우선(row-major)으로 펼치면 행 순서 → 연도 컬럼 → 분석 컬럼 순서가 되므로 정렬이 필요 없음
+        positions = frame.columns.get_indexer_for(list(column_meta))
+        value_names = frame.columns[positions]
+        block = frame.iloc[:, positions].to_numpy(dtype=object)
+        n_rows, n_cols = block.shape
+        
+        values = pd.Series(block.ravel())
+        # 빈 값 제외 (NaN 및 공백 문자열)
+        keep = (values.notna() & (values.astype(str).str.strip() != '')).to_numpy()
+        row_index = np.repeat(np.arange(n_rows), n_cols)[keep]
+        col_index = np.tile(np.arange(n_cols), n_rows)[keep]
+        
+        long_df = frame[id_vars].take(row_index).reset_index(drop=True)
+        long_df['column_name'] = value_names.to_numpy(dtype=object)[col_index]
+        long_df['value'] = values.to_numpy()[keep]
+        
+        # 컬럼 메타데이터는 컬럼 위치 배열에서 바로 가져옴 (행마다 dict 조회 없음)
+        for position, field in enumerate(('column_type', 'yyyy', 'month', 'value_type', 'data_type')):
+            field_values = np.array([column_meta[name][position] for name in value_names], dtype=object)
+            long_df[field] = field_values[col_index]
+        return long_df
+    
+    def _order_row_columns(self, transformed_df, crawl_time):
+        """
+        변환된 데이터의 컬럼명/크롤링 시간/컬럼 순서 정리
+
+        Args:
+            transformed_df (pd.DataFrame): long 포맷으로 변환된 데이터
+            crawl_time (str): KST 크롤링 시간
+
+        Returns:
+            pd.DataFrame: 최종 변환 데이터
+        """
+        transformed_df = transformed_df.rename(columns={'항목': 'item'})
+        transformed_df['crawl_time'] = crawl_time
+        
+        # 컬럼 순서 정리 - 실제 존재하는 컬럼만 선택
+        desired_columns = ['company_code', 'company_name', 'finGubun', 'tab', 'search_type', 'id', 'parent_id', 'item', 'column_name', 'column_type', 'yyyy', 'month', 'value', 'value_type', 'data_type', 'crawl_time']
+        available_columns = [col for col in desired_columns if col in transformed_df.columns]
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 변환된 DataFrame의 실제 컬럼들: {list(transformed_df.columns)}")
+            logger.debug(f"🎯 사용할 컬럼들: {available_columns}")
+        
+        if available_columns:
+            transformed_df = transformed_df[available_columns]
+        else:
+            logger.warning("⚠️ 원하는 컬럼이 없어 원본 컬럼 순서를 유지합니다.")
+        
+        # 반복 문자열 컬럼은 category로 (행마다 문자열 객체 대신 작은 정수 코드만 보관)
+        category_columns = [col for col in _ROW_CATEGORY_COLUMNS if col in transformed_df.columns]
+        return transformed_df.astype(dict.fromkeys(category_columns, 'category'))
+    
+    @staticmethod
+    def _log_row_format_summary(transformed_df):
+        """변환 결과 요약 로그 출력"""
+        logger.info(f"✅ 변환 완료: {transformed_df.shape}")
+        logger.info(f"📈 총 회사 수: {transformed_df['company_code'].nunique()}")
+        logger.info(f"📊 총 재무 항목 수: {transformed_df['item'].nunique()}")
+        logger.info(f"📅 포함된 연도: {sorted([y for y in transformed_df['yyyy'].unique() if y])}")
+        logger.info(f"🔍 조회구분: {sorted(transformed_df['search_type'].unique())}")
+        logger.info(f"📋 finGubun 구분: {sorted(transformed_df['finGubun'].unique())}" if 'finGubun' in transformed_df.columns else "📋 finGubun 구분: 정보 없음")
+        logger.info(f"📋 컬럼 유형: {sorted(transformed_df['column_type'].unique())}")
+        logger.info(f"💎 값 유형: {sorted(transformed_df['value_type'].unique())}")
+        logger.info(f"🏷️ 데이터 타입: {sorted(transformed_df['data_type'].unique())}")
+        logger.info(f"📍 총 데이터 포인트: {len(transformed_df)}")
+    
     def transform_to_row_format(self, combined_df, period_type="연간"):
         """
         컬럼 기반 데이터를 row 기반으로 변환하는 메소드
@@ -1106,222 +1597,355 @@ class PlaywrightStockCrawler:
             pd.DataFrame: 변환된 데이터
         """
         try:
-            print(f"📊 데이터 변환 시작: {combined_df.shape}")
+            logger.info(f"📊 데이터 변환 시작: {combined_df.shape}")
             
             # 변환할 컬럼들 식별
-            # 1. 연도 컬럼들 (yyyy/mm 패턴이 있는 컬럼 - 연결/별도 구분 없이 모든 재무 데이터)
-            import re
-            year_pattern = r'\d{4}/\d{2}'
-            year_columns = [col for col in combined_df.columns if re.search(year_pattern, col)]
-            
-            # 2. 분석 컬럼들 (기간 타입에 따라 분기/연간 구분)
-            if period_type == "분기":
-                # 분기 조회: QoQ, 전분기대비 등 분기 관련 분석 컬럼만
-                analysis_keywords = ['QoQ', '전분기대비', '분기증감률']
-            else:
-                # 연간 조회: YoY, 전년대비 등 연간 관련 분석 컬럼만
-                analysis_keywords = ['YoY', '전년대비', '증감률', 'CAGR']
-
-            analysis_columns = [col for col in combined_df.columns if any(keyword in col for keyword in analysis_keywords)]
+            year_columns, analysis_columns = self._split_transform_columns(combined_df.columns, period_type)
             
             # 3. 전체 변환 대상 컬럼
             target_columns = year_columns + analysis_columns
             
-            print(f"🔍 변환할 연도 컬럼들: {year_columns}")
-            print(f"📈 변환할 분석 컬럼들: {analysis_columns}")
-            print(f"📊 전체 변환 대상: {len(target_columns)}개 컬럼")
+            # 컬럼 목록 출력은 DEBUG 레벨에서만 문자열을 생성
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🔍 변환할 연도 컬럼들: {year_columns}")
+                logger.debug(f"📈 변환할 분석 컬럼들: {analysis_columns}")
+            logger.info(f"📊 전체 변환 대상: {len(target_columns)}개 컬럼")
             
             if not target_columns:
-                print("❌ 변환할 컬럼을 찾을 수 없습니다.")
-                return pd.DataFrame()
-            
-            # 데이터 변환을 위한 리스트
-            transformed_data = []
-            
-            print("🔄 데이터 변환 중...")
-            
-            # 가장 큰 연도/월 찾기 (분석 데이터 매핑용) - 정규식으로 안전하게 추출
-            max_year = ''
-            max_month = ''
-            for year_col in year_columns:
-                year_match = re.search(year_pattern, year_col)
-                if year_match:
-                    year_period = year_match.group()  # "2024/09"
-                    yy, mm = year_period.split('/')
-                    if yy.isdigit() and (not max_year or yy > max_year):
-                        max_year = yy
-                        max_month = mm
-            
-            print(f"📅 분석 데이터 매핑 기준: {max_year}/{max_month}")
-            
-            # 먼저 연도 컬럼들만 처리 (모든 행에서)
-            for _, row in combined_df.iterrows():
-                for target_col in year_columns:
-                    # 연도 컬럼 처리 - 정규식으로 yyyy/mm 패턴 추출
-                    year_match = re.search(year_pattern, target_col)
-                    if year_match:
-                        year_period = year_match.group()  # "2024/09"
-                        yy, mm = year_period.split('/')
-                    else:
-                        yy, mm = '', ''
-                    data_type = self._extract_data_type_from_column(target_col)
-                    # period_type에 따라 column_type 구분
-                    column_type = 'period_data' if period_type == "분기" else 'year_data'
-                    # value_type 결정 (E가 있으면 Expected, 없으면 Real)
-                    value_type = 'Expected' if '(E)' in target_col else 'Real'
-
-                    # 값이 비어있지 않은 경우만 추가
-                    value = row[target_col]
-                    if pd.notna(value) and str(value).strip() != '':
-                        # 조회구분 정보 가져오기 (없으면 기본값)
-                        inquiry_type = row.get('search_type', '연간')
-
-                        # 기본 행 데이터
-                        transformed_row = {
-                            'tab': row['tab'],
-                            'search_type': inquiry_type,
-                            'id': row['id'],
-                            'parent_id': row['parent_id'],
-                            'item': row['항목'],
-                            'column_name': target_col,  # 원본 컬럼명 추가
-                            'column_type': column_type,  # 컬럼 유형 추가
-                            'yyyy': yy,
-                            'month': mm,
-                            'value': value,
-                            'value_type': value_type,  # Expected/Real 구분
-                            'data_type': data_type,
-                            'crawl_time': datetime.now(timezone(timedelta(hours=9))).strftime("%Y-%m-%d %H:%M:%S") # KST 시간 추가
-                        }
-
-                        # company_code가 있으면 추가 (6자리 문자열로 보장)
-                        if 'company_code' in combined_df.columns:
-                            company_code = str(row['company_code']).zfill(6)
-                            transformed_row['company_code'] = company_code
-                        else:
-                            # 단일 회사 크롤링인 경우 기본값 설정
-                            transformed_row['company_code'] = '004150'
-
-                        # company_name이 있으면 추가
-                        if 'company_name' in combined_df.columns:
-                            transformed_row['company_name'] = row['company_name']
-                        else:
-                            # 단일 회사 크롤링인 경우 기본값 설정
-                            transformed_row['company_name'] = '한솔홀딩스'
-
-                        # finGubun이 있으면 추가
-                        if 'finGubun' in combined_df.columns:
-                            transformed_row['finGubun'] = row['finGubun']
-                        else:
-                            # finGubun이 없는 경우 기본값 설정
-                            transformed_row['finGubun'] = 'K-IFRS(연결)'
-
-                        transformed_data.append(transformed_row)
-
-            # 분석 컬럼들은 최신 년월에만 추가 (한 번만)
-            if analysis_columns:
-                print(f"📊 분석 데이터는 최신 년월 {max_year}/{max_month}에만 추가됩니다.")
-                for _, row in combined_df.iterrows():
-                    for target_col in analysis_columns:
-                        # 분석 컬럼 처리 (전년대비 등) - 가장 큰 연도/월에 매핑
-                        yy = max_year
-                        mm = max_month
-                        data_type = self._extract_data_type_from_column(target_col) if '(' in target_col else 'analysis'
-                        column_type = 'analysis_data'
-                        # 분석 데이터는 모두 Real (실제 계산된 값)
-                        value_type = 'Real'
-
-                        # 값이 비어있지 않은 경우만 추가
-                        value = row[target_col]
-                        if pd.notna(value) and str(value).strip() != '':
-                            # 조회구분 정보 가져오기 (없으면 기본값)
-                            inquiry_type = row.get('search_type', '연간')
-
-                            # 기본 행 데이터
-                            transformed_row = {
-                                'tab': row['tab'],
-                                'search_type': inquiry_type,
-                                'id': row['id'],
-                                'parent_id': row['parent_id'],
-                                'item': row['항목'],
-                                'column_name': target_col,  # 원본 컬럼명 추가
-                                'column_type': column_type,  # 컬럼 유형 추가
-                                'yyyy': yy,
-                                'month': mm,
-                                'value': value,
-                                'value_type': value_type,  # Expected/Real 구분
-                                'data_type': data_type,
-                                'crawl_time': datetime.now(timezone(timedelta(hours=9))).strftime("%Y-%m-%d %H:%M:%S") # KST 시간 추가
-                            }
-
-                            # company_code가 있으면 추가 (6자리 문자열로 보장)
-                            if 'company_code' in combined_df.columns:
-                                company_code = str(row['company_code']).zfill(6)
-                                transformed_row['company_code'] = company_code
-                            else:
-                                # 단일 회사 크롤링인 경우 기본값 설정
-                                transformed_row['company_code'] = '004150'
-
-                            # company_name이 있으면 추가
-                            if 'company_name' in combined_df.columns:
-                                transformed_row['company_name'] = row['company_name']
-                            else:
-                                # 단일 회사 크롤링인 경우 기본값 설정
-                                transformed_row['company_name'] = '한솔홀딩스'
-
-                            # finGubun이 있으면 추가
-                            if 'finGubun' in combined_df.columns:
-                                transformed_row['finGubun'] = row['finGubun']
-                            else:
-                                # finGubun이 없는 경우 기본값 설정
-                                transformed_row['finGubun'] = 'K-IFRS(연결)'
-
-                            transformed_data.append(transformed_row)
-            
-            if not transformed_data:
-                print("❌ 변환할 데이터가 없습니다.")
+                logger.error("❌ 변환할 컬럼을 찾을 수 없습니다.")
                 return pd.DataFrame()
             
-            # 새로운 DataFrame 생성
-            transformed_df = pd.DataFrame(transformed_data)
-            
-            # 컬럼 순서 정리 - 실제 존재하는 컬럼만 선택
-            print(f"🔍 변환된 DataFrame의 실제 컬럼들: {list(transformed_df.columns)}")
+            logger.info("🔄 데이터 변환 중...")
             
-            desired_columns = ['company_code', 'company_name', 'finGubun', 'tab', 'search_type', 'id', 'parent_id', 'item', 'column_name', 'column_type', 'yyyy', 'month', 'value', 'value_type', 'data_type', 'crawl_time']
-            available_columns = [col for col in desired_columns if col in transformed_df.columns]
+            max_year, max_month = self._latest_year_month(year_columns)
+            logger.info(f"📅 분석 데이터 매핑 기준: {max_year}/{max_month}")
+            if analysis_columns:
+                logger.info(f"📊 분석 데이터는 최신 년월 {max_year}/{max_month}에만 추가됩니다.")
             
-            print(f"🎯 사용할 컬럼들: {available_columns}")
+            transformed_df = self._melt_to_rows(combined_df, period_type, year_columns, analysis_columns, max_year, max_month)
             
-            if available_columns:
-                transformed_df = transformed_df[available_columns]
-            else:
-                print("⚠️ 원하는 컬럼이 없어 원본 컬럼 순서를 유지합니다.")
-            
-            print(f"✅ 변환 완료: {transformed_df.shape}")
-            print(f"📈 총 회사 수: {transformed_df['company_code'].nunique()}")
-            print(f"📊 총 재무 항목 수: {transformed_df['item'].nunique()}")
-            print(f"📅 포함된 연도: {sorted([y for y in transformed_df['yyyy'].unique() if y])}")
-            print(f"🔍 조회구분: {sorted(transformed_df['search_type'].unique())}")
-            print(f"📋 finGubun 구분: {sorted(transformed_df['finGubun'].unique())}" if 'finGubun' in transformed_df.columns else "📋 finGubun 구분: 정보 없음")
-            print(f"📋 컬럼 유형: {sorted(transformed_df['column_type'].unique())}")
-            print(f"💎 값 유형: {sorted(transformed_df['value_type'].unique())}")
-            print(f"🏷️ 데이터 타입: {sorted(transformed_df['data_type'].unique())}")
-            print(f"📍 총 데이터 포인트: {len(transformed_df)}")
+            if transformed_df.empty:
+                logger.error("❌ 변환할 데이터가 없습니다.")
+                return pd.DataFrame()
             
+            # KST 크롤링 시간 (변환 1회당 한 번만 계산)
+            transformed_df = self._order_row_columns(transformed_df, datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S"))
+            self._log_row_format_summary(transformed_df)
             return transformed_df
             
         except Exception as e:
-            print(f"❌ 데이터 변환 중 오류 발생: {str(e)}")
+            logger.error(f"❌ 데이터 변환 중 오류 발생: {str(e)}")
             return pd.DataFrame()
-            
-            
+    
+    def save_frames_by_yyyymm(self, frames, output_dir, period_type, s3_bucket=None, save_local=True, file_format=None):
+        """
+        회사/탭별 프레임을 하나씩 row 기반으로 변환하면서 바로 yyyymm별 파일에 이어 쓰는 메소드
+        (넓은 원본 전체나 변환 결과 전체를 한 프레임으로 만들지 않음)
 
+        Args:
+            frames (list[pd.DataFrame]): 크롤링된 원본 데이터 프레임 리스트
+            output_dir (str): 출력 디렉토리
+            period_type (str): "연간" 또는 "분기"
+            s3_bucket (str): S3 버킷명 (선택사항)
+            save_local (bool): 로컬 저장 여부 (기본값: True)
+            file_format (str): "csv" 또는 "parquet" (기본값: 환경변수 OUTPUT_FORMAT, 없으면 "csv")
 
+        Returns:
+            dict: yyyymm별 저장된 행 수 (변환 실패 시 빈 dict)
+        """
+        logger.info(f"📊 데이터 변환 시작: {len(frames)}개 프레임, {sum(len(df) for df in frames)}행")
+        
+        # 프레임별 변환 대상 컬럼 식별
+        frame_columns = [self._split_transform_columns(df.columns, period_type) for df in frames]
+        if not any(year_columns or analysis_columns for year_columns, analysis_columns in frame_columns):
+            logger.error("❌ 변환할 컬럼을 찾을 수 없습니다.")
+            return {}
+        
+        # 분석 데이터 매핑 기준은 전체 연도 컬럼에서 계산
+        all_year_columns = dict.fromkeys(col for year_columns, _ in frame_columns for col in year_columns)
+        max_year, max_month = self._latest_year_month(all_year_columns)
+        logger.info(f"📅 분석 데이터 매핑 기준: {max_year}/{max_month}")
+        
+        # 분석 데이터를 포함할 최신 년월 (전체 연도 컬럼 중 가장 큰 yyyymm)
+        latest_yyyymm = max((_RE_YEAR.search(col).group().replace('/', '') for col in all_year_columns), default=None)
+        
+        writer = PerYYYYMMWriter(output_dir, period_type, s3_bucket, save_local, file_format, latest_yyyymm=latest_yyyymm)
+        # KST 크롤링 시간 (변환 1회당 한 번만 계산)
+        crawl_time = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
+        
+        logger.info("🔄 데이터 변환 중...")
+        try:
+            for df, (year_columns, analysis_columns) in zip(frames, frame_columns):
+                if not (year_columns or analysis_columns):
+                    continue
+                long_df = self._melt_to_rows(df, period_type, year_columns, analysis_columns, max_year, max_month)
+                # 값이 하나도 없는 프레임은 건너뜀
+                if len(long_df):
+                    writer.add(self._order_row_columns(long_df, crawl_time))
+        except Exception as e:
+            logger.error(f"❌ 데이터 변환 중 오류 발생: {str(e)}")
+        finally:
+            # 변환 중 오류가 나도 이미 변환된 데이터는 기록
+            written = writer.close()
+        
+        logger.info(f"✅ 변환 완료: {sum(written.values())}행")
+        return written
+
+
+
+class PerYYYYMMWriter:
+    """
+    변환된 데이터를 yyyymm별 파일로 나누어 점진적으로 저장하는 writer
+    
+    add()로 받은 조각을 yyyymm별 버퍼에 모으고, 버퍼 행 수가 flush_rows를 넘으면 해당 yyyymm 파일에 이어 쓴다.
+    close()에서 남은 버퍼를 쓰고 S3 업로드 및 (save_local=False인 경우) 로컬 파일 정리를 수행한다.
+    """
+    
+    def __init__(self, output_dir, period_type, s3_bucket=None, save_local=True, file_format=None,
+                 latest_yyyymm=None, flush_rows=None):
+        """
+        Args:
+            output_dir (str): 출력 디렉토리
+            period_type (str): "연간" 또는 "분기"
+            s3_bucket (str): S3 버킷명 (선택사항)
+            save_local (bool): 로컬 저장 여부 (False면 S3 업로드 후 로컬 파일 삭제)
+            file_format (str): "csv" 또는 "parquet" (기본값: 환경변수 OUTPUT_FORMAT, 없으면 "csv")
+            latest_yyyymm (str): 분석 데이터(전년대비/전분기대비)를 포함할 최신 년월 (없으면 필터링하지 않음)
+            flush_rows (int): yyyymm별 버퍼를 파일에 쓰는 행 수 기준 (기본값: 환경변수 YYYYMM_FLUSH_ROWS, 없으면 50000)
+        """
+        file_format = (file_format or os.environ.get('OUTPUT_FORMAT', 'csv')).lower()
+        if file_format not in ('csv', 'parquet'):
+            logger.warning(f"⚠️ 지원하지 않는 파일 형식 '{file_format}' - csv로 저장합니다.")
+            file_format = 'csv'
+        
+        self.output_dir = output_dir
+        self.period_type = period_type
+        self.s3_bucket = s3_bucket
+        self.save_local = save_local
+        self.file_format = file_format
+        self.latest_yyyymm = latest_yyyymm
+        self.flush_rows = max(1, int(flush_rows or os.environ.get('YYYYMM_FLUSH_ROWS', '50000')))
+        
+        self._buffers = {}          # yyyymm -> 아직 쓰지 않은 DataFrame 조각들
+        self._buffered_rows = {}    # yyyymm -> 버퍼 행 수
+        self._written_rows = {}     # yyyymm -> 파일에 쓴 행 수
+        self._columns = {}          # yyyymm -> 첫 flush의 컬럼 순서 (이후 조각도 같은 순서로 기록)
+        self._parquet_writers = {}  # yyyymm -> pyarrow.parquet.ParquetWriter
+        
+        if latest_yyyymm:
+            logger.info(f"📅 분석 데이터(전년대비/전분기대비)가 포함될 최신 년월: {latest_yyyymm}")
+    
+    def _filename(self, yyyymm):
+        period_suffix = "_annual" if self.period_type == "연간" else "_quarterly"
+        return f"{self.output_dir}/{yyyymm}_all_companies{period_suffix}_transformed.{self.file_format}"
+    
+    def add(self, df):
+        """
+        변환된 데이터 조각을 yyyymm별 버퍼에 추가 (기준 행 수를 넘은 yyyymm은 바로 파일에 기록)
+        
+        Args:
+            df (pd.DataFrame): 변환된 데이터 (yyyy, month 컬럼 필요)
+        """
+        if df.empty:
+            return
+        if 'yyyy' not in df.columns or 'month' not in df.columns:
+            logger.error("❌ yyyy, month 컬럼이 없어 데이터를 분리할 수 없습니다.")
+            return
+        
+        # yyyymm 컬럼 생성 (yyyy/month는 transform_to_row_format에서 문자열로 생성됨, 이미 있으면 재사용)
+        if 'yyyymm' not in df.columns:
+            df = df.assign(yyyymm=df['yyyy'].str.cat(df['month'].str.zfill(2)))
+        
+        # 분석 데이터는 최신 년월에만 포함
+        if self.latest_yyyymm and 'column_type' in df.columns:
+            stale = (df['column_type'] == 'analysis_data') & (df['yyyymm'] != self.latest_yyyymm)
+            excluded_count = int(stale.sum())
+            if excluded_count:
+                logger.info(f"📊 분석 데이터 {excluded_count}개 제외 (최신 년월 {self.latest_yyyymm}에만 포함)")
+                df = df[~stale]
+        
+        for yyyymm, part in df.groupby('yyyymm', sort=False):
+            self._buffers.setdefault(yyyymm, []).append(part)
+            self._buffered_rows[yyyymm] = self._buffered_rows.get(yyyymm, 0) + len(part)
+            if self._buffered_rows[yyyymm] >= self.flush_rows:
+                self._flush(yyyymm)
+    
+    def _flush(self, yyyymm):
+        """yyyymm 버퍼를 파일 끝에 이어 쓰기"""
+        parts = self._buffers.pop(yyyymm, None)
+        self._buffered_rows.pop(yyyymm, None)
+        if not parts:
+            return
+        
+        # 이후 조각도 첫 flush의 컬럼 순서대로 기록
+        columns = self._columns.setdefault(yyyymm, list(parts[0].columns))
+        parts = [part if list(part.columns) == columns else part.reindex(columns=columns) for part in parts]
+        
+        filename = self._filename(yyyymm)
+        if self.file_format == 'parquet':
+            self._write_parquet(yyyymm, filename, parts)
+        else:
+            chunk = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+            # BOM과 헤더는 파일의 첫 조각에만 기록
+            first_write = yyyymm not in self._written_rows
+            chunk.to_csv(filename, mode='w' if first_write else 'a', header=first_write, index=False,
+                         encoding='utf-8-sig' if first_write else 'utf-8')
+        
+        self._written_rows[yyyymm] = self._written_rows.get(yyyymm, 0) + sum(len(part) for part in parts)
+    
+    def _write_parquet(self, yyyymm, filename, parts):
+        """
+        조각들을 Arrow 테이블로 바꿔 pandas concat 없이 그대로 이어 붙여 row group으로 기록
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        writer = self._parquet_writers.get(yyyymm)
+        tables = []
+        for part in parts:
+            # parent_id는 공백/숫자가 섞여 있어 Arrow 컬럼 타입을 맞추기 위해 문자열로 저장
+            if 'parent_id' in part.columns:
+                part = part.astype({'parent_id': str})
+            schema = writer.schema if writer is not None else (tables[0].schema if tables else None)
+            tables.append(pa.Table.from_pandas(part, schema=schema, preserve_index=False))
+        
+        if writer is None:
+            # 반복 문자열은 사전(dictionary) 인코딩, 컬럼 통계 기록 (압축은 PARQUET_COMPRESSION, 기본 zstd)
+            writer = pq.ParquetWriter(filename, tables[0].schema,
+                                      compression=os.environ.get('PARQUET_COMPRESSION', 'zstd'),
+                                      use_dictionary=True, write_statistics=True)
+            self._parquet_writers[yyyymm] = writer
+        # concat_tables는 청크만 이어 붙이므로 데이터 복사가 없음
+        writer.write_table(pa.concat_tables(tables), row_group_size=self.flush_rows)
+    
+    def close(self):
+        """
+        남은 버퍼를 기록하고 파일을 닫은 뒤 S3 업로드
+        
+        yyyymm 파일 하나가 완성되는 즉시 업로드를 시작하므로 다음 파일의 직렬화와 앞 파일의 업로드가 겹친다.
+        
+        Returns:
+            dict: yyyymm별 저장된 행 수
+        """
+        yyyymms = sorted(set(self._buffers) | set(self._written_rows))
+        if not yyyymms:
+            logger.warning("⚠️ 저장할 데이터가 없어 파일을 생성하지 않았습니다.")
+            return {}
+        logger.info(f"📅 발견된 yyyymm: {yyyymms}")
+        
+        content_type = 'application/vnd.apache.parquet' if self.file_format == 'parquet' else 'text/csv; charset=utf-8'
+        
+        # S3 업로드는 스레드 풀에서 병렬로 진행
+        upload_pool = ThreadPoolExecutor(max_workers=8) if self.s3_bucket else None
+        upload_futures = {}
+        
+        for yyyymm in yyyymms:
+            # 남은 버퍼 기록 후 파일을 닫아 업로드 가능한 상태로 만듦
+            self._flush(yyyymm)
+            writer = self._parquet_writers.pop(yyyymm, None)
+            if writer is not None:
+                writer.close()
+            
+            row_count = self._written_rows.get(yyyymm, 0)
+            filename = self._filename(yyyymm)
+            if self.save_local:
+                logger.info(f"💾 {yyyymm} 로컬 데이터 저장: {filename} ({row_count}행)")
+            
+            # S3 업로드 (버킷이 지정된 경우)
+            if upload_pool:
+                try:
+                    # 기간 타입을 영어로 변환
+                    period_type_en = "annual" if self.period_type == "연간" else "quarter"
+                    
+                    # yyyymm에서 연도와 월 추출
+                    year = yyyymm[:4]
+                    month = yyyymm[4:6]
+                    
+                    # S3 키 생성
+                    s3_key = generate_s3_key(period_type_en, year, month, extension=self.file_format)
+                    
+                    logger.info(f"📤 S3 업로드 준비: s3://{self.s3_bucket}/{s3_key}")
+                    logger.info(f"📅 데이터 연도/월: {year}/{month}")
+                    
+                    future = upload_pool.submit(upload_with_retry, upload_file_to_s3, filename, self.s3_bucket, s3_key, content_type)
+                    upload_futures[future] = yyyymm
+                        
+                except Exception as e:
+                    logger.error(f"❌ S3 업로드 과정에서 오류: {str(e)}")
+        
+        # 업로드 결과 수집
+        if upload_pool:
+            for future in as_completed(upload_futures):
+                yyyymm = upload_futures[future]
+                try:
+                    s3_upload_result = future.result()
+                    if s3_upload_result.get("success"):
+                        logger.info(f"✅ {yyyymm} S3 업로드 성공: {s3_upload_result['s3_url']}")
+                        logger.info(f"📦 파일 크기: {s3_upload_result['size']} bytes")
+                    else:
+                        logger.error(f"❌ {yyyymm} S3 업로드 실패: {s3_upload_result.get('error', '알 수 없는 오류')}")
+                except Exception as e:
+                    logger.error(f"❌ {yyyymm} S3 업로드 과정에서 오류: {str(e)}")
+            upload_pool.shutdown()
+        
+        written = dict(sorted(self._written_rows.items()))
+        
+        # 로컬 저장을 원하지 않으면 업로드가 끝난 파일 정리
+        if not self.save_local:
+            for yyyymm in written:
+                try:
+                    os.remove(self._filename(yyyymm))
+                except OSError as e:
+                    logger.warning(f"⚠️ {yyyymm} 임시 파일 삭제 중 오류: {str(e)}")
+            logger.info(f"⏭️ 로컬 저장 생략 (save_local=False) - {len(written)}개 임시 파일 삭제")
+        
+        return written
+
+
+async def _crawl_one(crawler, stock_info, index, total, semaphore, period_type, max_retries):
+    """
+    회사 단위 크롤링 (동시 실행 수 제한, 실패 시 지수 백오프 후 재시도)
+    
+    Args:
+        crawler (PlaywrightStockCrawler): 브라우저를 공유하는 크롤러
+        stock_info (dict): {"code": "004150", "name": "한솔홀딩스"}
+        index (int): 진행 표시용 순번 (0부터)
+        total (int): 전체 회사 수
+        semaphore (asyncio.Semaphore): 동시에 크롤링할 회사 수 제한
+        period_type (str): "연간" 또는 "분기"
+        max_retries (int): 실패 시 재시도 횟수
+    
+    Returns:
+        dict: 탭별 DataFrame (실패 시 None)
+    """
+    company_code = stock_info.get('code', '')
+    company_name = stock_info.get('name', f'Company_{company_code}')
+    # URL 생성
+    url = f"https://navercomp.wisereport.co.kr/v2/company/c1040001.aspx?cn=&cmp_cd={company_code}&menuType=block"
+    
+    async with semaphore:
+        # 회사별 진행 로그는 한 줄로 (동시 실행 시 구분선이 다른 회사 로그와 섞임)
+        logger.info(f"[{index+1}/{total}] {company_name} ({company_code}) 크롤링 시작")
+        
+        for attempt in range(max_retries + 1):
+            if attempt > 0:
+                delay = 2 ** attempt + random.uniform(0, 1)
+                logger.info(f"🔁 {company_name} 재시도 {attempt}/{max_retries} ({delay:.1f}초 대기 후)")
+                await asyncio.sleep(delay)
+            try:
+                # 해당 회사 크롤링 (브라우저 재사용)
+                results = await crawler._crawl_single_company(url, company_code, company_name, period_type)
+                if results:
+                    return results
+                logger.warning(f"⚠️ {company_name} 크롤링 결과 없음")
+            except Exception as e:
+                logger.error(f"❌ {company_name} 크롤링 중 오류: {str(e)}")
+        return None
 
 
 async def crawl_multiple_stocks(stocks_data, output_dir="./crawl_results", period_type="연간", s3_bucket=None, save_local=True):
     """
-    여러 주식 데이터를 순차적으로 크롤링
+    여러 주식 데이터를 병렬로 크롤링 (MAX_COMPANY_CONCURRENCY개 회사 동시 진행)
     
     Args:
         stocks_data (list): 주식 정보 리스트 
@@ -1334,114 +1958,110 @@ async def crawl_multiple_stocks(stocks_data, output_dir="./crawl_results", perio
     Returns:
         dict: 회사별 크롤링 결과
     """
-    print(f"🚀 {len(stocks_data)}개 회사의 투자분석 데이터 크롤링을 시작합니다...")
+    logger.info(f"🚀 {len(stocks_data)}개 회사의 투자분석 데이터 크롤링을 시작합니다...")
     
     # 결과 저장 디렉토리 생성
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
-    all_results = {}
-    success_count = 0
-    failed_companies = []
-    
     # 크롤러 초기화 (한 번만 초기화하여 효율성 증대)
     crawler = PlaywrightStockCrawler(headless=True, wait_timeout=15000)
     crawler.start_timer()  # 타이머 시작
     
-    try:
-        # 브라우저 설정 (한 번만)
-        await crawler.setup_browser()
+    # 브라우저 설정은 한 번만 하고 모든 회사가 공유, 블록을 벗어나면 컨텍스트 정리
+    async with crawler:
+        company_semaphore = asyncio.Semaphore(max(1, int(os.environ.get('MAX_COMPANY_CONCURRENCY', '4'))))
+        max_retries = max(0, int(os.environ.get('COMPANY_MAX_RETRIES', '1')))
         
-        for i, stock_info in enumerate(stocks_data):
-            company_code = stock_info.get('code', '')
-            company_name = stock_info.get('name', f'Company_{company_code}')
-            
-            print(f"\n{'='*60}")
-            print(f"[{i+1}/{len(stocks_data)}] {company_name} ({company_code}) 크롤링 시작")
-            print(f"{'='*60}")
-            
-            try:
-                # URL 생성
-                url = f"https://navercomp.wisereport.co.kr/v2/company/c1040001.aspx?cn=&cmp_cd={company_code}&menuType=block"
-                
-                # 해당 회사 크롤링 (브라우저 재사용)
-                results = await crawler._crawl_single_company(url, company_code, company_name, period_type)
-                
-                if results:
-                    all_results[company_code] = {
-                        'company_name': company_name,
-                        'company_code': company_code,
-                        'data': results,
-                        'status': 'success'
-                    }
-                    
-                    # 개별 파일 저장은 하지 않음 (최종 통합 파일만 저장)
-                    
-                    success_count += 1
-                    print(f"✅ {company_name} 크롤링 성공!")
-                    
-                else:
-                    failed_companies.append(f"{company_name}({company_code})")
-                    print(f"❌ {company_name} 크롤링 실패 - 데이터 없음")
-                    
-            except Exception as e:
-                failed_companies.append(f"{company_name}({company_code})")
-                print(f"❌ {company_name} 크롤링 중 오류: {str(e)}")
-                
-            # 회사 간 대기 (서버 부하 방지)
-            if i < len(stocks_data) - 1:  # 마지막이 아니면
-                print("⏳ 다음 회사 크롤링을 위해 1초 대기...")
-                await asyncio.sleep(1)
-                
-    finally:
-        await crawler.cleanup()
+        # 한 회사의 예기치 못한 예외가 나머지 회사 크롤링을 중단시키지 않도록 예외도 결과로 받음
+        company_results = await asyncio.gather(*[
+            _crawl_one(crawler, stock_info, i, len(stocks_data), company_semaphore, period_type, max_retries)
+            for i, stock_info in enumerate(stocks_data)
+        ], return_exceptions=True)
     
-    # Lambda 환경에서는 요약 파일 저장 생략 (메모리 절약 및 오류 방지)
-    try:
-        # 간단한 요약 정보만 생성 (DataFrame 직렬화 없이)
-        summary_data = {
-            'timestamp': datetime.now(timezone(timedelta(hours=9))).isoformat(),
-            'total_companies': len(stocks_data),
-            'success_count': success_count,
-            'failed_count': len(failed_companies),
-            'failed_companies': failed_companies,
-            'message': f'{success_count}개 성공, {len(failed_companies)}개 실패'
+    # 입력 순서대로 결과 집계 (태스크별 반환값만 사용)
+    outcomes = []
+    for stock_info, results in zip(stocks_data, company_results):
+        company_code = stock_info.get('code', '')
+        company_name = stock_info.get('name', f'Company_{company_code}')
+        if isinstance(results, BaseException):
+            logger.error(f"❌ {company_name} 크롤링 중 오류: {str(results)}")
+            results = None
+        
+        if results:
+            logger.info(f"✅ {company_name} 크롤링 성공!")
+        else:
+            logger.error(f"❌ {company_name} 크롤링 실패 - 데이터 없음")
+        outcomes.append((company_code, company_name, results))
+    
+    # 개별 파일 저장은 하지 않음 (최종 통합 파일만 저장)
+    all_results = {
+        company_code: {
+            'company_name': company_name,
+            'company_code': company_code,
+            'data': results,
+            'status': 'success'
         }
+        for company_code, company_name, results in outcomes if results
+    }
+    success_count = sum(1 for _, _, results in outcomes if results)
+    failed_companies = [f"{company_name}({company_code})" for company_code, company_name, results in outcomes if not results]
+    
+    # 연간/분기를 동시에 크롤링해도 서로 덮어쓰지 않도록 요약 파일명에 기간 구분자 포함
+    period_suffix = "_annual" if period_type == "연간" else "_quarterly"
+    summary_filename = f"{output_dir}/{datetime.now(KST).strftime('%Y%m%d')}_crawling_summary{period_suffix}.json"
+    
+    def write_summary():
+        """크롤링 요약 정보 생성 및 (로컬 환경에서) 요약 파일 저장"""
+        # Lambda 환경에서는 요약 파일 저장 생략 (메모리 절약 및 오류 방지)
+        try:
+            # 간단한 요약 정보만 생성 (DataFrame 직렬화 없이)
+            summary_data = {
+                'timestamp': datetime.now(KST).isoformat(),
+                'total_companies': len(stocks_data),
+                'success_count': success_count,
+                'failed_count': len(failed_companies),
+                'failed_companies': failed_companies,
+                'message': f'{success_count}개 성공, {len(failed_companies)}개 실패'
+            }
 
-        # Lambda 환경이 아닌 경우에만 상세 요약 파일 저장
-        if not os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
-            print("💾 로컬 환경: 상세 요약 파일 생성 중...")
-
-            # DataFrame을 JSON 직렬화 가능한 형태로 변환 (로컬에서만)
-            json_compatible_results = {}
-            for company_code, company_data in all_results.items():
-                json_compatible_results[company_code] = {
-                    'company_name': company_data['company_name'],
-                    'company_code': company_data['company_code'],
-                    'status': company_data.get('status', 'unknown'),
-                    'data_count': len(company_data.get('data', {}))
-                }
+            # Lambda 환경이 아닌 경우에만 상세 요약 파일 저장
+            if not os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+                logger.info("💾 로컬 환경: 상세 요약 파일 생성 중...")
+
+                # DataFrame을 JSON 직렬화 가능한 형태로 변환 (로컬에서만)
+                json_compatible_results = {}
+                for company_code, company_data in all_results.items():
+                    json_compatible_results[company_code] = {
+                        'company_name': company_data['company_name'],
+                        'company_code': company_data['company_code'],
+                        'status': company_data.get('status', 'unknown'),
+                        'data_count': len(company_data.get('data', {}))
+                    }
 
-            summary_data['results'] = json_compatible_results
+                summary_data['results'] = json_compatible_results
 
-            # 날짜 접두사 추가하여 JSON 저장
-            date_prefix = datetime.now(timezone(timedelta(hours=9))).strftime("%Y%m%d")
-            summary_filename = f"{output_dir}/{date_prefix}_crawling_summary.json"
-            with open(summary_filename, 'w', encoding='utf-8') as f:
-                json.dump(summary_data, f, ensure_ascii=False, indent=2)
-            print(f"💾 요약 파일 저장 완료: {summary_filename}")
-        else:
-            print("☁️ Lambda 환경: 상세 요약 파일 저장 생략")
-
-    except Exception as summary_error:
-        print(f"⚠️ 요약 파일 생성 중 오류 (무시하고 계속 진행): {str(summary_error)}")
-        summary_data = {
-            'timestamp': datetime.now(timezone(timedelta(hours=9))).isoformat(),
-            'total_companies': len(stocks_data),
-            'success_count': success_count,
-            'failed_count': len(failed_companies),
-            'message': '요약 파일 생성 실패하였으나 크롤링은 완료됨'
-        }
+                # 날짜 접두사/기간 구분자가 붙은 파일명으로 JSON 저장
+                if orjson is not None:
+                    with open(summary_filename, 'wb') as f:
+                        f.write(orjson.dumps(summary_data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(summary_filename, 'w', encoding='utf-8') as f:
+                        json.dump(summary_data, f, ensure_ascii=False, indent=2)
+                logger.info(f"💾 요약 파일 저장 완료: {summary_filename}")
+            else:
+                logger.info("☁️ Lambda 환경: 상세 요약 파일 저장 생략")
+
+        except Exception as summary_error:
+            logger.warning(f"⚠️ 요약 파일 생성 중 오류 (무시하고 계속 진행): {str(summary_error)}")
+            summary_data = {
+                'timestamp': datetime.now(KST).isoformat(),
+                'total_companies': len(stocks_data),
+                'success_count': success_count,
+                'failed_count': len(failed_companies),
+                'message': '요약 파일 생성 실패하였으나 크롤링은 완료됨'
+            }
+        return summary_data
     
     # 모든 회사 데이터를 하나의 CSV 파일로 합치기
     combined_csv_data = []
@@ -1449,14 +2069,11 @@ async def crawl_multiple_stocks(stocks_data, output_dir="./crawl_results", perio
         if company_data.get('status') == 'success' and 'data' in company_data:
             for tab_name, df in company_data['data'].items():
                 if isinstance(df, pd.DataFrame) and not df.empty:
-                    # 회사 정보와 탭 정보 추가
-                    df_copy = df.copy()
-                    if len(df_copy.columns) > 0:
-                        df_copy.insert(0, 'company_code', str(company_code).zfill(6))  # 6자리 문자열로 변환
-                        df_copy.insert(1, 'company_name', company_data['company_name'])
-                    else:
-                        df_copy['company_code'] = str(company_code).zfill(6)
-                        df_copy['company_name'] = company_data['company_name']
+                    # 회사 정보와 탭 정보를 한 번에 추가 (assign은 새 프레임을 반환하므로 원본 결과는 그대로)
+                    meta = {
+                        'company_code': str(company_code).zfill(6),  # 6자리 문자열로 변환
+                        'company_name': company_data['company_name']
+                    }
                     
                     # tab_name에서 finGubun과 실제 탭명 분리
                     if '_' in tab_name and any(tab_name.endswith(f'_{tab}') for tab in ['수익성', '성장성', '안정성', '활동성']):
@@ -1464,64 +2081,54 @@ async def crawl_multiple_stocks(stocks_data, output_dir="./crawl_results", perio
                         finGubun_part, actual_tab = tab_name.rsplit('_', 1)
                         
                         # finGubun 컬럼이 없는 경우에만 추가
-                        if 'finGubun' not in df_copy.columns:
-                            if len(df_copy.columns) >= 2:
-                                df_copy.insert(2, 'finGubun', finGubun_part)
-                                df_copy.insert(3, 'tab', actual_tab)
-                            else:
-                                df_copy['finGubun'] = finGubun_part
-                                df_copy['tab'] = actual_tab
-                        else:
-                            # 이미 finGubun 컬럼이 있으면 tab만 추가
-                            if len(df_copy.columns) >= 3:
-                                df_copy.insert(3, 'tab', actual_tab)
-                            else:
-                                df_copy['tab'] = actual_tab
+                        if 'finGubun' not in df.columns:
+                            meta['finGubun'] = finGubun_part
+                        meta['tab'] = actual_tab
                     else:
                         # 기존 형태 (finGubun 정보가 이미 컬럼에 있는 경우)
-                        # 안전한 인덱스 계산
-                        insert_idx = max(0, len(df_copy.columns) - 1) if len(df_copy.columns) > 0 else 0
-                        df_copy.insert(insert_idx, 'tab', tab_name)
+                        meta['tab'] = tab_name
                     
-                    # 안전한 인덱스 계산으로 search_type 추가
-                    insert_idx = max(0, len(df_copy.columns) - 1) if len(df_copy.columns) > 0 else 0
-                    df_copy.insert(insert_idx, 'search_type', period_type)
-                    combined_csv_data.append(df_copy)
+                    meta['search_type'] = period_type
+                    combined_csv_data.append(df.assign(**meta))
     
-    # 전체 데이터를 하나의 CSV로 저장 후 변환
+    # 요약 파일과 yyyymm별 파일은 서로 독립적이므로 스레드에서 동시에 저장 (이벤트 루프는 막지 않음)
+    # (컨테이너 이미지가 Python 3.8이라 asyncio.to_thread 대신 기본 executor 사용)
+    loop = asyncio.get_running_loop()
+    summary_write = loop.run_in_executor(None, write_summary)
+    
+    # 전체 데이터를 변환 후 저장
     if combined_csv_data:
-        combined_df = pd.concat(combined_csv_data, ignore_index=True)
-        
-        # 데이터 변환 (컬럼 → 행)
-        print(f"\n🔄 전체 데이터 변환 중... (기간: {period_type})")
+        # 데이터 변환 (컬럼 → 행) - 넓은 원본은 합치지 않고 프레임별로 변환 후 한 번만 concat
+        # (컬럼 순서는 변환 결과에서 한 번만 정리)
+        logger.info(f"\n🔄 전체 데이터 변환 중... (기간: {period_type})")
         
-        # 임시 크롤러 객체 생성 (변환 메소드 사용을 위해)
-        temp_crawler = PlaywrightStockCrawler()
-        transformed_df = temp_crawler.transform_to_row_format(combined_df, period_type)
+        # 프레임별 변환 결과를 yyyymm별 파일에 바로 이어 씀 (변환 결과 전체를 한 프레임으로 만들지 않음)
+        # 변환/저장 메소드는 브라우저 상태를 쓰지 않으므로 크롤링에 사용한 객체를 그대로 사용
+        _, written = await asyncio.gather(
+            summary_write,
+            loop.run_in_executor(None, crawler.save_frames_by_yyyymm, combined_csv_data, output_dir, period_type, s3_bucket, save_local)
+        )
         
-        if not transformed_df.empty:
-            # yyyymm별로 데이터 분리하여 저장
-            temp_crawler = PlaywrightStockCrawler()
-            temp_crawler.save_data_by_yyyymm(transformed_df, output_dir, period_type, s3_bucket, save_local)
-        else:
-            print("❌ 데이터 변환에 실패했습니다.")
+        if not written:
+            logger.error("❌ 데이터 변환에 실패했습니다.")
     else:
-        print("⚠️ 통합할 데이터가 없어 파일을 생성하지 않았습니다.")
+        await summary_write
+        logger.warning("⚠️ 통합할 데이터가 없어 파일을 생성하지 않았습니다.")
     
     # 결과 출력
-    print(f"\n{'='*60}")
-    print(f"📊 전체 크롤링 결과 요약")
-    print(f"{'='*60}")
-    print(f"🏢 총 회사 수: {len(stocks_data)}")
-    print(f"✅ 성공: {success_count}개")
-    print(f"❌ 실패: {len(failed_companies)}개")
+    logger.info(f"\n{'='*60}")
+    logger.info(f"📊 전체 크롤링 결과 요약")
+    logger.info(f"{'='*60}")
+    logger.info(f"🏢 총 회사 수: {len(stocks_data)}")
+    logger.info(f"✅ 성공: {success_count}개")
+    logger.info(f"❌ 실패: {len(failed_companies)}개")
     
     if failed_companies:
-        print(f"❌ 실패한 회사들: {', '.join(failed_companies)}")
+        logger.error(f"❌ 실패한 회사들: {', '.join(failed_companies)}")
     
-    print(f"💾 결과 파일이 '{output_dir}' 폴더에 저장되었습니다.")
-    print(f"📁 yyyymm별 분리된 파일들이 저장되었습니다.")
-    print(f"📁 요약 파일: crawling_summary.json")
+    logger.info(f"💾 결과 파일이 '{output_dir}' 폴더에 저장되었습니다.")
+    logger.info(f"📁 yyyymm별 분리된 파일들이 저장되었습니다.")
+    logger.info(f"📁 요약 파일: {os.path.basename(summary_filename)}")
     
     # 타이머 종료
     crawler.end_timer()
@@ -1543,20 +2150,68 @@ async def crawl_multiple_stocks_direct(stocks_data, output_dir="./crawl_results"
         save_local (bool): 로컬 저장 여부 (기본값: True)
     """
     try:
-        print(f"[DIRECT] {len(stocks_data)}개 회사 정보로 크롤링을 시작합니다.")
-        print(f"[PERIOD] 기간 타입: {period_type}")
+        logger.info(f"[DIRECT] {len(stocks_data)}개 회사 정보로 크롤링을 시작합니다.")
+        logger.info(f"[PERIOD] 기간 타입: {period_type}")
 
         # 다중 크롤링 실행
         return await crawl_multiple_stocks(stocks_data, output_dir, period_type, s3_bucket, save_local)
 
     except Exception as e:
         import traceback
-        print(f"[ERROR] 직접 크롤러 실행 중 오류 발생: {str(e)}")
-        print(f"[ERROR] 상세 오류 정보:")
-        print(traceback.format_exc())
+        logger.error(f"[ERROR] 직접 크롤러 실행 중 오류 발생: {str(e)}")
+        logger.error(f"[ERROR] 상세 오류 정보:")
+        logger.error(traceback.format_exc())
         raise
 
 
+def install_uvloop():
+    """
+    uvloop가 설치되어 있으면 asyncio 기본 이벤트 루프로 사용 (Windows 제외, USE_UVLOOP=0이면 사용 안 함)
+    
+    asyncio.run() 전에 호출해야 한다.
+    
+    Returns:
+        bool: uvloop 적용 여부
+    """
+    if os.name == 'nt' or os.environ.get('USE_UVLOOP', '1') == '0':
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+# 이 크기 이상인 주식 목록 파일은 (ijson이 있으면) 스트리밍 파싱
+_STOCKS_STREAM_MIN_BYTES = 1024 * 1024
+# 주식 목록 파싱 오류 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+_STOCKS_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+
+def load_stocks_file(stocks_json_file):
+    """
+    주식 목록 JSON 파일 로드
+    
+    큰 파일은 ijson으로 항목 단위로 읽으면서 크롤링에 쓰는 code/name만 남겨 원본 전체를 메모리에 올리지 않는다.
+    작은 파일은 orjson(없으면 json)으로 한 번에 파싱한다.
+    
+    Args:
+        stocks_json_file (str): 주식 목록 JSON 파일 경로 ([{"code": ..., "name": ...}, ...])
+    
+    Returns:
+        list: 주식 정보 리스트
+    """
+    if ijson is not None and os.path.getsize(stocks_json_file) >= _STOCKS_STREAM_MIN_BYTES:
+        with open(stocks_json_file, 'rb') as f:
+            return [{key: item[key] for key in ('code', 'name') if key in item}
+                    for item in ijson.items(f, 'item')]
+    
+    with open(stocks_json_file, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def run_multiple_crawler(stocks_json_file, output_dir="./crawl_results", period_type="연간", s3_bucket=None, save_local=True):
     """
     JSON 파일에서 주식 목록을 읽어 여러 회사 크롤링
@@ -1570,39 +2225,48 @@ def run_multiple_crawler(stocks_json_file, output_dir="./crawl_results", period_
     """
     try:
         # JSON 파일 읽기
-        with open(stocks_json_file, 'r', encoding='utf-8') as f:
-            stocks_data = json.load(f)
+        stocks_data = load_stocks_file(stocks_json_file)
 
-        print(f"[FILE] {stocks_json_file}에서 {len(stocks_data)}개 회사 정보를 로드했습니다.")
-        print(f"[PERIOD] 기간 타입: {period_type}")
+        logger.info(f"[FILE] {stocks_json_file}에서 {len(stocks_data)}개 회사 정보를 로드했습니다.")
+        logger.info(f"[PERIOD] 기간 타입: {period_type}")
 
-        # Windows 이벤트 루프 설정
+        # Windows 이벤트 루프 설정 (그 외 OS는 uvloop가 설치되어 있으면 사용)
         if os.name == 'nt':
             asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+        elif install_uvloop():
+            logger.info("⚡ uvloop 이벤트 루프를 사용합니다.")
 
-        # 다중 크롤링 실행
-        asyncio.run(crawl_multiple_stocks(stocks_data, output_dir, period_type, s3_bucket, save_local))
+        # 다중 크롤링 실행 (asyncio.run이 루프를 닫기 전에 공유 브라우저 종료)
+        async def _run():
+            try:
+                await crawl_multiple_stocks(stocks_data, output_dir, period_type, s3_bucket, save_local)
+            finally:
+                await close_shared_browser()
+        
+        asyncio.run(_run())
 
     except FileNotFoundError:
-        print(f"[ERROR] 파일을 찾을 수 없습니다: {stocks_json_file}")
+        logger.error(f"[ERROR] 파일을 찾을 수 없습니다: {stocks_json_file}")
         print("[INFO] 예시 JSON 파일 형식:")
         print("""[
   {"code": "004150", "name": "한솔홀딩스"},
   {"code": "005930", "name": "삼성전자"},
   {"code": "000660", "name": "SK하이닉스"}
 ]""")
-    except json.JSONDecodeError:
-        print(f"[ERROR] JSON 파일 형식이 올바르지 않습니다: {stocks_json_file}")
+    except _STOCKS_JSON_ERRORS:
+        logger.error(f"[ERROR] JSON 파일 형식이 올바르지 않습니다: {stocks_json_file}")
     except Exception as e:
         import traceback
-        print(f"[ERROR] 다중 크롤러 실행 중 오류 발생: {str(e)}")
-        print(f"[ERROR] 상세 오류 정보:")
-        print(traceback.format_exc())
+        logger.error(f"[ERROR] 다중 크롤러 실행 중 오류 발생: {str(e)}")
+        logger.error(f"[ERROR] 상세 오류 정보:")
+        logger.error(traceback.format_exc())
 
 
 if __name__ == "__main__":
     import sys
     
+    logging.basicConfig(format='%(message)s')
+    
     if len(sys.argv) > 1:
         # 명령줄 인수가 있으면 다중 크롤링
         stocks_file = sys.argv[1]
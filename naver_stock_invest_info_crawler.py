@@ -6,36 +6,143 @@ Lambda 환경에서 실행되며 결과를 JSON 형태로 반환합니다.
 
 import asyncio
 import json
+import logging
 from datetime import datetime, timezone, timedelta
 import re
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 import traceback
-import csv
-import io
+from typing import List, Optional
+try:
+    import httpx  # 선택 의존성: 정적 HTML을 브라우저 없이 가져올 때 사용
+except ImportError:
+    httpx = None
+try:
+    from selectolax.parser import HTMLParser  # 선택 의존성: httpx로 받은 HTML 파싱
+except ImportError:
+    HTMLParser = None
+try:
+    import msgspec  # 선택 의존성: 종목 목록 응답을 필요한 필드만 구조체로 디코딩
+except ImportError:
+    msgspec = None
 import os
 import sys
-from s3_utils import upload_csv_content_to_s3, generate_s3_key
-from dotenv import load_dotenv
+import time
+import urllib3
+from s3_utils import upload_lines_to_s3, upload_bytes_to_s3, delete_s3_prefix, generate_s3_key, S3_GZIP
 
-# .env 파일 로드 (로컬 환경에서만)
-if os.path.exists('.env'):
+# .env 파일 로드 (로컬 환경에서만, Lambda에서는 dotenv import/파일 확인 생략)
+if not os.environ.get('AWS_LAMBDA_FUNCTION_NAME') and os.path.exists('.env'):
+    from dotenv import load_dotenv
     load_dotenv()
 
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+# 한국 표준시
+KST = timezone(timedelta(hours=9))
+
+# 투자정보 HTML만 필요하므로 렌더링용 리소스와 광고/분석 요청은 차단
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+_BLOCKED_HOSTS_RE = re.compile(r'wcs\.naver\.net|wcslog\.naver|google-analytics|googletagmanager|doubleclick|adcr\.naver|siape\.veta\.naver')
+
+# 브라우저 컨텍스트 쿠키/스토리지 상태 (웜 스타트 간 재사용해 네이버 쿠키 협상 생략)
+_STORAGE_STATE = None
+
+# 종목 목록 람다 호출용 연결 풀 (웜 스타트 간 keep-alive 연결 재사용)
+_HTTP = urllib3.PoolManager(num_pools=4, maxsize=10, retries=urllib3.Retry(3))
+
+# 종목 목록 람다 조회 결과 캐시 (웜 스타트 간 재사용)
+_STOCKS_CACHE = None
+_STOCKS_CACHE_TS = 0.0
+_STOCKS_TTL = int(os.environ.get('STOCKS_CACHE_TTL_SECONDS', '300'))
+
+if msgspec is not None:
+    class _StockEntry(msgspec.Struct):
+        """종목 목록 응답의 종목 항목 (사용하는 필드만 디코딩, 나머지는 건너뜀)"""
+        stock_code: Optional[str] = None
+        stock_nm: Optional[str] = None
+
+    class _StocksResponse(msgspec.Struct):
+        """종목 목록 람다 응답"""
+        success: bool = False
+        data: List[_StockEntry] = []
+        error: Optional[str] = None
+
+    _STOCKS_DECODER = msgspec.json.Decoder(_StocksResponse)
+else:
+    _STOCKS_DECODER = None
+
+# 종목코드별 PER/EPS 테이블 행 캐시 (웜 스타트 간 재사용, 값: (저장 시각, 행 목록))
+_ROWS_CACHE = {}
+_ROWS_CACHE_TTL = int(os.environ.get('PER_EPS_CACHE_TTL_SECONDS', '300'))
+
+# PER/EPS 파싱용 정규식 (행마다 재사용)
+_DATE_RE = re.compile(r'\((\d{4}\.\d{2})\)')
+_DATE_CLEAN_RE = re.compile(r'\(\d{4}\.\d{2}\)')
+_DATE_SUB_RE = re.compile(r'\d{4}\.\d{2}')
+_NUM_RE = re.compile(r'[\d,]+\.?\d*')
+# 네이버 투자정보 표의 항목/값 구분자: '|'가 아니라 <span class="bar">l</span>의 소문자 l
+_ITEM_SEP = 'l'
+# PER/EPS 표에서 파싱 대상 행의 항목명 패턴 (브라우저 JS와 selectolax 경로 공용)
+_ITEM_NAME_PATTERN = r'PER|EPS|PBR|BPS|배당수익률|추정'
+_ITEM_NAME_RE = re.compile(_ITEM_NAME_PATTERN)
+# 복합 단위(억원/만원)를 한 글자 단위보다 먼저 매칭
+_UNIT_RE = re.compile(r'억원|만원|배|원|%')
+
 
 class NaverFinancePERCrawlerForLambda:
-    def __init__(self, headless=None, wait_timeout=None):
+    _USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    
+    # 동적 PER/PBR/EPS/BPS 값과 PER/EPS 테이블 행을 브라우저 안에서 한 번에 추출
+    # (투자정보 영역이 없을 때만 summary에 PER/EPS가 포함된 첫 테이블로 대체)
+    _EXTRACT_PAYLOAD_JS = """() => {
+        const ITEM_NAME_RE = /%s/;
+        const out = {dyn: {}, rows: null, summary: null, has_aside: false, summaries: []};
+        for (const id of ['_per', '_pbr', '_eps', '_bps']) {
+            const el = document.getElementById(id);
+            if (el) out.dyn[id] = el.innerText.trim();
+        }
+        const aside = document.getElementById('aside_invest_info');
+        let table = null;
+        if (aside) {
+            out.has_aside = true;
+            table = aside.querySelector('table[summary="PER/EPS 정보"]');
+            if (!table) out.summaries = [...aside.querySelectorAll('table')].map(t => t.getAttribute('summary'));
+        } else {
+            table = [...document.querySelectorAll('table[summary]')]
+                .find(t => /PER|EPS/.test(t.getAttribute('summary')));
+        }
+        if (!table) return out;
+        out.summary = table.getAttribute('summary');
+        out.rows = [];
+        // PER/EPS 관련 행의 항목명/값 두 셀만 반환
+        table.querySelectorAll('tr').forEach((tr, rowIndex) => {
+            const cells = tr.querySelectorAll('td, th');
+            if (cells.length < 2) return;
+            const name = cells[0].innerText.trim();
+            if (ITEM_NAME_RE.test(name)) out.rows.push({row_index: rowIndex, cells: [name, cells[1].innerText.trim()]});
+        });
+        return out;
+    }""" % _ITEM_NAME_PATTERN
+    
+    def __init__(self, headless=None, wait_timeout=None, max_concurrency=None):
         """
         네이버 금융 PER/EPS 크롤러 초기화 (Lambda용)
         
         Args:
             headless (bool): 브라우저를 백그라운드에서 실행할지 여부 (환경변수 우선)
             wait_timeout (int): 요소 대기 시간 (밀리초) (환경변수 우선)
+            max_concurrency (int): 동시에 크롤링할 종목 수 (기본값: 환경변수 PER_EPS_MAX_CONCURRENCY, 없으면 5)
         """
         # 환경변수에서 설정값 읽기
         self.headless = headless if headless is not None else os.environ.get('HEADLESS', 'true').lower() == 'true'
         self.wait_timeout = wait_timeout or int(os.environ.get('WAIT_TIMEOUT', '15000'))
+        self.max_concurrency = max(1, int(max_concurrency or os.environ.get('PER_EPS_MAX_CONCURRENCY', '5')))
         self.browser = None
-        self.page = None
+        self.context = None
+        self.page_pool = None
+        self.http_client = None
+        self._browser_lock = None
         self.start_time = None
         self.end_time = None
 
@@ -68,13 +175,13 @@ class NaverFinancePERCrawlerForLambda:
         """크롤링 시작 시간 기록"""
         self.start_time = datetime.now()
         timestamp = self.start_time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"🕐 PER/EPS 크롤링 시작: {timestamp}")
+        logger.info(f"🕐 PER/EPS 크롤링 시작: {timestamp}")
         
     def end_timer(self):
         """크롤링 종료 시간 기록 및 소요시간 계산"""
         self.end_time = datetime.now()
         timestamp = self.end_time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"🕐 PER/EPS 크롤링 종료: {timestamp}")
+        logger.info(f"🕐 PER/EPS 크롤링 종료: {timestamp}")
         
         if self.start_time:
             duration = self.end_time - self.start_time
@@ -84,209 +191,288 @@ class NaverFinancePERCrawlerForLambda:
             seconds = total_seconds % 60
             
             if hours > 0:
-                print(f"⏱️ 총 소요시간: {hours}시간 {minutes}분 {seconds}초")
+                logger.info(f"⏱️ 총 소요시간: {hours}시간 {minutes}분 {seconds}초")
             elif minutes > 0:
-                print(f"⏱️ 총 소요시간: {minutes}분 {seconds}초")
+                logger.info(f"⏱️ 총 소요시간: {minutes}분 {seconds}초")
             else:
-                print(f"⏱️ 총 소요시간: {seconds}초")
+                logger.info(f"⏱️ 총 소요시간: {seconds}초")
     
     async def initialize_browser(self):
         """브라우저 초기화"""
         try:
-            print("▶ [1/4] Playwright_async starting...") # 로그 추가
+            logger.debug("▶ [1/4] Playwright_async starting...") # 로그 추가
             self.playwright = await async_playwright().start()
-            print("▶ [2/4] Playwright_async started successfully.") # 로그 추가
+            logger.debug("▶ [2/4] Playwright_async started successfully.") # 로그 추가
 
             # --- 수정된 부분: self.browser_args 사용 ---
-            print(f"▶ [3/4] Launching browser with args: {self.browser_args}")
+            logger.debug("▶ [3/4] Launching browser with args: %s", self.browser_args)
             self.browser = await self.playwright.chromium.launch(
                 headless=self.headless,
                 args=self.browser_args # 하드코딩된 리스트 대신 변수 사용
             )
-            print("▶ [4.1/5] Browser object created.") # 로그 추가
-
-            print("▶ [4.2/5] Creating new page...")
-            self.page = await self.browser.new_page()
-            print("▶ [5/5] New page created successfully.")
+            logger.debug("▶ [4/4] Browser object created.") # 로그 추가
             # --- 여기까지 ---
 
-            # User-Agent 설정 등 나머지 코드...
-            await self.page.set_extra_http_headers({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            print("✅ 브라우저 초기화 완료")
+            # 동시 실행 수만큼 페이지를 미리 만들어 종목 간 재사용
+            self.page_pool = asyncio.Queue()
+            for _ in range(self.max_concurrency):
+                self.page_pool.put_nowait(await self.new_page())
+            logger.info(f"✅ 브라우저 초기화 완료 (페이지 풀: {self.max_concurrency}개)")
             return True
 
         except Exception as e:
-            print(f"❌ 브라우저 초기화 실패: {str(e)}")
-            print(traceback.format_exc()) # 스택 트레이스 전체 출력
+            logger.error(f"❌ 브라우저 초기화 실패: {str(e)}")
+            logger.error(traceback.format_exc()) # 스택 트레이스 전체 출력
+            return False
+    
+    async def ensure_browser(self):
+        """
+        브라우저가 아직 없으면 초기화 (HTTP 수집 실패 시에만 Chromium을 띄우기 위함)
+        
+        Returns:
+            bool: 브라우저 사용 가능 여부
+        """
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        async with self._browser_lock:
+            if self.browser is None:
+                return await self.initialize_browser()
+            return True
+    
+    def open_http_client(self):
+        """
+        HTTP 수집용 공유 클라이언트 생성 (httpx/selectolax가 없거나 PER_EPS_USE_HTTP=0이면 생성하지 않음)
+        
+        Returns:
+            bool: HTTP 수집 사용 가능 여부
+        """
+        if httpx is None or HTMLParser is None or os.environ.get('PER_EPS_USE_HTTP', '1') == '0':
             return False
+        
+        options = {
+            'headers': {'User-Agent': self._USER_AGENT},
+            'timeout': self.wait_timeout / 1000,
+            'follow_redirects': True,
+            # 동시 실행 수만큼 연결을 유지해 종목 간 TCP/TLS 핸드셰이크 재사용
+            'limits': httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            ),
+        }
+        try:
+            self.http_client = httpx.AsyncClient(http2=True, **options)
+        except ImportError:
+            # h2 패키지가 없으면 HTTP/1.1로 사용
+            self.http_client = httpx.AsyncClient(**options)
+        return True
+    
+    async def fetch_per_eps_http(self, stock_code, company_name):
+        """
+        브라우저 없이 HTTP 요청만으로 PER/EPS 정보 수집 (서버 렌더링된 HTML 사용)
+        
+        Args:
+            stock_code (str): 주식코드
+            company_name (str): 회사명
+            
+        Returns:
+            dict: 크롤링된 PER/EPS 데이터 (필요한 요소가 없으면 None → Playwright로 재시도)
+        """
+        url = f"https://finance.naver.com/item/main.naver?code={stock_code}"
+        
+        try:
+            response = await self.http_client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"⚠️ {company_name}({stock_code}) HTTP 요청 실패: {str(e)}")
+            return None
+        
+        # 네이버 금융 페이지는 EUC-KR(CP949)이므로 charset 헤더가 없으면 추측하지 않고 CP949로 디코딩
+        html = response.content.decode(response.charset_encoding or 'cp949', 'replace')
+        tree = HTMLParser(html)
+        table = tree.css_first('#aside_invest_info table[summary="PER/EPS 정보"]')
+        if tree.css_first('#_per') is None or table is None:
+            logger.warning(f"⚠️ {company_name}({stock_code}) HTML에 PER/EPS 요소가 없어 브라우저로 재시도")
+            return None
+        
+        rows = []
+        for row_index, tr in enumerate(table.css('tr')):
+            cells = tr.css('td, th')
+            if len(cells) < 2:
+                continue
+            # innerText와 같이 공백을 한 칸으로 정리, PER/EPS 관련 행의 항목명/값만 사용
+            name = ' '.join(cells[0].text().split())
+            if _ITEM_NAME_RE.search(name):
+                rows.append({'row_index': row_index, 'cells': [name, ' '.join(cells[1].text().split())]})
+        
+        return self.extract_table_data(rows, stock_code, company_name)
+    
+    def get_cached_per_eps_data(self, stock_code, company_name):
+        """
+        캐시 유효시간 내에 수집한 종목이면 저장된 행으로 데이터 구성 (crawl_time만 새로 기록)
+        
+        Args:
+            stock_code (str): 주식코드
+            company_name (str): 회사명
+            
+        Returns:
+            dict: 캐시된 PER/EPS 데이터 (없거나 만료되면 None)
+        """
+        hit = _ROWS_CACHE.get(stock_code)
+        if hit is None or time.time() - hit[0] >= _ROWS_CACHE_TTL:
+            return None
+        logger.info(f"♻️ {company_name}({stock_code}) 캐시된 PER/EPS 데이터 사용")
+        return self.extract_table_data(hit[1], stock_code, company_name)
+    
+    def cache_per_eps_data(self, stock_code, data):
+        """수집한 PER/EPS 테이블 행을 종목코드 기준으로 캐시 (PER_EPS_CACHE_TTL_SECONDS=0이면 미사용)"""
+        if _ROWS_CACHE_TTL > 0:
+            _ROWS_CACHE[stock_code] = (time.time(), data['per_eps_data'])
     
     async def close_browser(self):
         """브라우저 종료"""
+        global _STORAGE_STATE
         try:
-            if self.page:
-                await self.page.close()
+            if self.http_client is not None:
+                await self.http_client.aclose()
+            if self.context is not None:
+                # 다음 웜 스타트에서 쿠키를 재사용하도록 상태 저장 후 종료 (페이지도 함께 닫힘)
+                _STORAGE_STATE = await self.context.storage_state()
+                await self.context.close()
             if self.browser:
                 await self.browser.close()
             if hasattr(self, 'playwright'):
                 await self.playwright.stop()
-            print("✅ 브라우저 종료 완료")
+            logger.info("✅ 브라우저 종료 완료")
         except Exception as e:
-            print(f"❌ 브라우저 종료 중 오류: {str(e)}")
+            logger.error(f"❌ 브라우저 종료 중 오류: {str(e)}")
+    
+    async def new_page(self):
+        """
+        페이지 풀용 페이지 생성 (모든 페이지가 하나의 컨텍스트를 공유해 쿠키를 재사용)
+        
+        Returns:
+            Page: 공유 컨텍스트의 새 페이지
+        """
+        if self.context is None:
+            self.context = await self.browser.new_context(
+                user_agent=self._USER_AGENT,
+                storage_state=_STORAGE_STATE
+            )
+            await self.context.route("**/*", self._route_request)
+        return await self.context.new_page()
+    
+    async def acquire_page(self):
+        """페이지 풀에서 페이지를 가져옴 (모두 사용 중이면 반환될 때까지 대기)"""
+        return await self.page_pool.get()
+    
+    async def release_page(self, page):
+        """페이지를 풀에 반환 (닫힌 페이지는 새 페이지로 교체)"""
+        if page.is_closed():
+            page = await self.new_page()
+        self.page_pool.put_nowait(page)
+    
+    @staticmethod
+    async def _route_request(route):
+        """이미지/폰트/스타일시트와 광고·분석 요청은 중단하고 나머지는 통과"""
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_HOSTS_RE.search(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
     
-    async def crawl_per_eps_data(self, stock_code="004150", company_name="한솔홀딩스"):
+    async def crawl_per_eps_data(self, stock_code="004150", company_name="한솔홀딩스", page=None):
         """
         네이버 금융에서 PER/EPS 정보 크롤링
         
         Args:
             stock_code (str): 주식코드 (예: "004150")
             company_name (str): 회사명
+            page (Page): 사용할 페이지 (없으면 페이지 풀에서 가져와 사용 후 반환)
             
         Returns:
             dict: 크롤링된 PER/EPS 데이터
         """
+        if page is None:
+            page = await self.acquire_page()
+            try:
+                return await self.crawl_per_eps_data(stock_code, company_name, page=page)
+            finally:
+                await self.release_page(page)
+        
         url = f"https://finance.naver.com/item/main.naver?code={stock_code}"
         
         try:
-            print(f"📊 {company_name}({stock_code}) PER/EPS 데이터 크롤링 시작...")
-            print(f"🔗 URL: {url}")
+            logger.debug("📊 %s(%s) PER/EPS 데이터 크롤링 시작...", company_name, stock_code)
+            logger.debug("🔗 URL: %s", url)
             
             # 페이지 이동
-            await self.page.goto(url, wait_until="networkidle")
-            await asyncio.sleep(1)
-            
-            # 동적 데이터 로딩을 위한 추가 대기
-            print("⏳ 동적 데이터 로딩 대기 중...")
-            await asyncio.sleep(1)
-            
-            # 동적 PBR/PER 값들을 직접 가져오기
-            print("🔍 동적 PBR/PER 값 확인 중...")
-            dynamic_values = {}
+            # networkidle은 트래커 비콘 때문에 늦게 끝나므로 DOM 로드 후 필요한 요소만 대기
+            await page.goto(url, wait_until="domcontentloaded")
+            # 고정 대기 대신 동적 PER 값이 채워질 때까지만 대기
+            logger.debug("⏳ 동적 데이터 로딩 대기 중...")
             try:
-                # 특정 ID로 동적 값들 가져오기
-                target_ids = ['_per', '_pbr', '_eps', '_bps']
-                for target_id in target_ids:
-                    try:
-                        element = await self.page.query_selector(f'#{target_id}')
-                        if element:
-                            text = await element.inner_text()
-                            dynamic_values[target_id] = text.strip()
-                            print(f"🎯 {target_id}: {text.strip()}")
-                    except Exception as e:
-                        print(f"⚠️ {target_id} 검색 중 오류: {str(e)}")
-                
-                print(f"✅ 동적 값 수집 완료: {dynamic_values}")
-                
-            except Exception as e:
-                print(f"⚠️ 동적 요소 검색 중 오류: {str(e)}")
+                await page.wait_for_function(
+                    "() => { const el = document.getElementById('_per'); return el && el.innerText.trim().length > 0; }",
+                    timeout=5000
+                )
+            except PlaywrightTimeoutError:
+                logger.warning(f"⚠️ {company_name}({stock_code}) #_per 값 대기 시간 초과")
             
-            # 페이지 구조 디버깅
-            print("🔍 페이지 구조 분석 중...")
+            # 동적 값과 PER/EPS 테이블을 한 번의 evaluate로 수집 (요소별 CDP 왕복 제거)
+            logger.debug("🔍 투자정보 영역 데이터 수집 중...")
+            payload = await page.evaluate(self._EXTRACT_PAYLOAD_JS)
             
-            # aside_invest_info div 찾기
-            print("🔍 투자정보 영역 찾는 중...")
-            aside_invest_info = await self.page.query_selector('#aside_invest_info')
+            dynamic_values = payload['dyn']
+            if logger.isEnabledFor(logging.DEBUG):
+                for target_id, text in dynamic_values.items():
+                    logger.debug("🎯 %s: %s", target_id, text)
+                logger.debug("✅ 동적 값 수집 완료: %s", dynamic_values)
             
-            if not aside_invest_info:
-                print("❌ aside_invest_info를 찾을 수 없습니다.")
-                
-                # PER 키워드가 포함된 테이블들 직접 찾기
-                print("🔍 PER 키워드가 포함된 테이블들 찾는 중...")
-                all_tables = await self.page.query_selector_all('table')
-                per_tables = []
-                for i, table in enumerate(all_tables):
-                    summary = await table.get_attribute('summary')
-                    if summary and ('PER' in summary or 'EPS' in summary):
-                        per_tables.append((i, table, summary))
-                        print(f"   테이블 {i}: summary='{summary}'")
-                
-                if per_tables:
-                    print(f"✅ PER/EPS 관련 테이블 {len(per_tables)}개 발견!")
-                    # 첫 번째 PER/EPS 테이블 사용
-                    _, selected_table, selected_summary = per_tables[0]
-                    print(f"🎯 선택된 테이블: {selected_summary}")
-                    return await self.extract_table_data(selected_table, stock_code, company_name, dynamic_values)
+            if payload['rows'] is None:
+                if payload['has_aside']:
+                    logger.error("❌ PER/EPS 정보 테이블을 찾을 수 없습니다.")
+                    logger.info(f"🔍 투자정보 영역 내 사용 가능한 테이블들: {payload['summaries']}")
                 else:
-                    print("❌ PER/EPS 관련 테이블을 찾을 수 없습니다.")
-                    return None
-            
-            print("✅ 투자정보 영역 발견")
-            
-            # PER/EPS 정보 테이블 찾기
-            print("🔍 PER/EPS 정보 테이블 찾는 중...")
-            per_eps_table = await aside_invest_info.query_selector('table[summary="PER/EPS 정보"]')
-            
-            if not per_eps_table:
-                print("❌ PER/EPS 정보 테이블을 찾을 수 없습니다.")
-                # 모든 테이블 확인해보기
-                print("🔍 투자정보 영역 내 사용 가능한 테이블들:")
-                tables = await aside_invest_info.query_selector_all('table')
-                for i, table in enumerate(tables):
-                    summary = await table.get_attribute('summary')
-                    print(f"   테이블 {i+1}: summary='{summary}'")
+                    logger.error("❌ aside_invest_info를 찾을 수 없습니다.")
+                    logger.error("❌ PER/EPS 관련 테이블을 찾을 수 없습니다.")
                 return None
             
-            print("✅ PER/EPS 정보 테이블 발견")
+            logger.debug("✅ PER/EPS 정보 테이블 발견: summary='%s'", payload['summary'])
             
-            # 테이블 데이터 추출
-            return await self.extract_table_data(per_eps_table, stock_code, company_name, dynamic_values)
+            # 테이블 데이터 정리
+            return self.extract_table_data(payload['rows'], stock_code, company_name)
             
         except Exception as e:
-            print(f"❌ 크롤링 중 오류 발생: {str(e)}")
+            logger.error(f"❌ 크롤링 중 오류 발생: {str(e)}")
             return None
     
-    async def extract_table_data(self, table, stock_code, company_name, dynamic_values=None):
+    def extract_table_data(self, rows, stock_code, company_name):
         """
-        테이블에서 PER/EPS 데이터 추출
+        페이지에서 수집한 테이블 행들로 PER/EPS 데이터 구성
         
         Args:
-            table: Playwright 테이블 요소
+            rows (list): [{'row_index': int, 'cells': [항목명, 값]}, ...] 형태의 PER/EPS 관련 행 목록
             stock_code (str): 주식코드
             company_name (str): 회사명
-            dynamic_values (dict): 동적으로 가져온 PER/PBR 값들
             
         Returns:
             dict: 추출된 데이터
         """
-        try:
-            print("📋 테이블 데이터 추출 중...")
-            
-            # 테이블의 모든 행 가져오기
-            rows = await table.query_selector_all('tr')
-            
-            data = {
-                'stock_code': stock_code,
-                'company_name': company_name,
-                'crawl_time': datetime.now(timezone(timedelta(hours=9))).strftime("%Y-%m-%d %H:%M:%S"),
-                'per_eps_data': []
-            }
-            
-            for row_idx, row in enumerate(rows):
-                # 각 행의 셀들 가져오기
-                cells = await row.query_selector_all('td, th')
-                
-                if len(cells) >= 2:  # 최소 2개 이상의 셀이 있어야 의미있는 데이터
-                    row_data = []
-                    for cell in cells:
-                        cell_text = await cell.inner_text()
-                        cell_text = cell_text.strip()
-                        row_data.append(cell_text)
-                    
-                    if row_data and any(text for text in row_data):  # 빈 행이 아닌 경우만
-                        data['per_eps_data'].append({
-                            'row_index': row_idx,
-                            'cells': row_data
-                        })
-                        print(f"   행 {row_idx}: {' | '.join(row_data)}")
-            
-            print(f"✅ 총 {len(data['per_eps_data'])}개 행의 데이터 추출 완료")
-            
-            return data
-            
-        except Exception as e:
-            print(f"❌ 테이블 데이터 추출 중 오류: {str(e)}")
-            return None
+        logger.debug("📋 테이블 데이터 추출 중...")
+        
+        data = {
+            'stock_code': stock_code,
+            'company_name': company_name,
+            'crawl_time': datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S"),
+            'per_eps_data': rows
+        }
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for row_data in rows:
+                logger.debug("   행 %s: %s", row_data['row_index'], ' | '.join(row_data['cells']))
+            logger.debug("✅ 총 %s개 행의 데이터 추출 완료", len(rows))
+        
+        return data
     
     def parse_per_eps_data(self, data):
         """
@@ -300,108 +486,82 @@ class NaverFinancePERCrawlerForLambda:
             list: 파싱된 구조화된 데이터
         """
         parsed_data = []
+        value_fields = {}  # 값 문자열별 (단위, 숫자값) - 같은 값은 한 번만 파싱
+        
+        # 배치 전체에서 반복되는 짧은 문자열은 intern하여 같은 객체를 공유
+        intern = sys.intern
+        stock_code = intern(data['stock_code'])
+        company_name = intern(data['company_name'])
+        crawl_time = intern(data['crawl_time'])
+        
+        def make_row(base, item_type, item_category, date_info, value):
+            if value not in value_fields:
+                value_fields[value] = (self._extract_unit(value), self._extract_numeric_value(value))
+            unit, numeric_value = value_fields[value]
+            return {
+                **base,
+                'item_type': intern(item_type),
+                'item_category': item_category,
+                'date_info': date_info,
+                'value': value,
+                'unit': unit,
+                'numeric_value': numeric_value
+            }
         
         for row_data in data['per_eps_data']:
-            if len(row_data['cells']) >= 2:
-                item_name = row_data['cells'][0].strip()
-                item_value = row_data['cells'][1].strip()
+            # 행 필터링/공백 정리는 수집 단계에서 완료 (항목명, 값 두 셀)
+            item_name, item_value = row_data['cells']
+            
+            # 행의 모든 파싱 결과에 공통으로 들어가는 필드
+            base = {
+                'stock_code': stock_code,
+                'company_name': company_name,
+                'crawl_time': crawl_time,
+                'raw_item_name': item_name,
+                'raw_item_value': item_value,
+                'original_row_index': row_data['row_index']
+            }
+            
+            # "l"로 구분된 값들 분리 (구분자가 없으면 right_value는 빈 문자열)
+            left_value, _, right_value = item_value.partition(_ITEM_SEP)
+            left_value = left_value.strip()
+            right_value = right_value.partition(_ITEM_SEP)[0].strip()
+            
+            # 항목명에서 날짜 정보 추출
+            date_match = _DATE_RE.search(item_name)
+            date_info = date_match.group(1) if date_match else ""
+            
+            # 항목명 정리 (날짜 정보 제거)
+            clean_item_name = _DATE_CLEAN_RE.sub('', item_name).strip()
+            
+            # "l"로 구분된 항목명 처리하여 각각을 개별 행으로 분리
+            main_item, has_sep, sub_item = clean_item_name.partition(_ITEM_SEP)
+            if has_sep:
+                main_item = main_item.strip()
+                sub_item = sub_item.partition(_ITEM_SEP)[0].strip()
                 
-                # "l"로 구분된 값들 분리
-                if 'l' in item_value:
-                    value_parts = item_value.split('l')
-                    left_value = value_parts[0].strip()
-                    right_value = value_parts[1].strip() if len(value_parts) > 1 else ""
+                # 배당수익률의 경우 날짜 필드는 저장하지 않음
+                if main_item == "배당수익률":
+                    # 날짜 정보를 항목명에서 추출하되, 별도 행으로 저장하지 않음
+                    date_match_from_sub = _DATE_SUB_RE.search(sub_item)
+                    extracted_date = date_match_from_sub.group() if date_match_from_sub else date_info
+                    
+                    parsed_data.append(make_row(base, main_item, 'main', extracted_date, left_value))
                 else:
-                    left_value = item_value
-                    right_value = ""
-                
-                # 항목명에서 날짜 정보 추출
-                date_match = re.search(r'\((\d{4}\.\d{2})\)', item_name)
-                date_info = date_match.group(1) if date_match else ""
-                
-                # 항목명 정리 (날짜 정보 제거)
-                clean_item_name = re.sub(r'\(\d{4}\.\d{2}\)', '', item_name).strip()
-                
-                # "l"로 구분된 항목명 처리하여 각각을 개별 행으로 분리
-                if 'l' in clean_item_name:
-                    name_parts = clean_item_name.split('l')
-                    main_item = name_parts[0].strip()
-                    sub_item = name_parts[1].strip() if len(name_parts) > 1 else ""
+                    # 기존 로직: PER/EPS 등은 두 개의 행으로 분리
+                    # 첫 번째 항목 (예: PER, 추정PER)
+                    parsed_data.append(make_row(base, main_item, 'main', date_info, left_value))
                     
-                    # 배당수익률의 경우 날짜 필드는 저장하지 않음
-                    if main_item == "배당수익률":
-                        # 날짜 정보를 항목명에서 추출하되, 별도 행으로 저장하지 않음
-                        date_match_from_sub = re.search(r'\d{4}\.\d{2}', sub_item)
-                        extracted_date = date_match_from_sub.group() if date_match_from_sub else date_info
-                        
-                        parsed_data.append({
-                            'stock_code': data['stock_code'],
-                            'company_name': data['company_name'],
-                            'crawl_time': data['crawl_time'],
-                            'item_type': main_item,
-                            'item_category': 'main',
-                            'date_info': extracted_date,
-                            'value': left_value,
-                            'unit': self._extract_unit(left_value),
-                            'numeric_value': self._extract_numeric_value(left_value),
-                            'raw_item_name': item_name,
-                            'raw_item_value': item_value,
-                            'original_row_index': row_data['row_index']
-                        })
-                    else:
-                        # 기존 로직: PER/EPS 등은 두 개의 행으로 분리
-                        # 첫 번째 항목 (예: PER, 추정PER)
-                        parsed_data.append({
-                            'stock_code': data['stock_code'],
-                            'company_name': data['company_name'],
-                            'crawl_time': data['crawl_time'],
-                            'item_type': main_item,
-                            'item_category': 'main',
-                            'date_info': date_info,
-                            'value': left_value,
-                            'unit': self._extract_unit(left_value),
-                            'numeric_value': self._extract_numeric_value(left_value),
-                            'raw_item_name': item_name,
-                            'raw_item_value': item_value,
-                            'original_row_index': row_data['row_index']
-                        })
+                    # 두 번째 항목 (예: EPS, 추정EPS)
+                    if sub_item:
+                        # "추정PER"의 경우 sub_item을 "추정EPS"로 변경
+                        if main_item == "추정PER" and sub_item == "EPS":
+                            sub_item = "추정EPS"
                         
-                        # 두 번째 항목 (예: EPS, 추정EPS)
-                        if sub_item:
-                            # "추정PER"의 경우 sub_item을 "추정EPS"로 변경
-                            if main_item == "추정PER" and sub_item == "EPS":
-                                sub_item = "추정EPS"
-                            
-                            parsed_data.append({
-                                'stock_code': data['stock_code'],
-                                'company_name': data['company_name'],
-                                'crawl_time': data['crawl_time'],
-                                'item_type': sub_item,
-                                'item_category': 'sub',
-                                'date_info': date_info,
-                                'value': right_value,
-                                'unit': self._extract_unit(right_value),
-                                'numeric_value': self._extract_numeric_value(right_value),
-                                'raw_item_name': item_name,
-                                'raw_item_value': item_value,
-                                'original_row_index': row_data['row_index']
-                            })
-                else:
-                    # "l"로 구분되지 않은 단일 항목
-                    parsed_data.append({
-                        'stock_code': data['stock_code'],
-                        'company_name': data['company_name'],
-                        'crawl_time': data['crawl_time'],
-                        'item_type': clean_item_name,
-                        'item_category': 'single',
-                        'date_info': date_info,
-                        'value': left_value,
-                        'unit': self._extract_unit(left_value),
-                        'numeric_value': self._extract_numeric_value(left_value),
-                        'raw_item_name': item_name,
-                        'raw_item_value': item_value,
-                        'original_row_index': row_data['row_index']
-                    })
+                        parsed_data.append(make_row(base, sub_item, 'sub', date_info, right_value))
+            else:
+                # "l"로 구분되지 않은 단일 항목
+                parsed_data.append(make_row(base, clean_item_name, 'single', date_info, left_value))
         
         return parsed_data
     
@@ -410,12 +570,8 @@ class NaverFinancePERCrawlerForLambda:
         if not value_str or value_str == 'N/A':
             return ""
         
-        # 일반적인 단위들 찾기
-        units = ['배', '원', '%', '억원', '만원']
-        for unit in units:
-            if unit in value_str:
-                return unit
-        return ""
+        unit_match = _UNIT_RE.search(value_str)
+        return sys.intern(unit_match.group(0)) if unit_match else ""
     
     def _extract_numeric_value(self, value_str):
         """값에서 숫자 부분만 추출"""
@@ -423,7 +579,7 @@ class NaverFinancePERCrawlerForLambda:
             return None
         
         # 숫자와 소수점, 콤마만 추출
-        numeric_match = re.search(r'[\d,]+\.?\d*', value_str.replace(',', ''))
+        numeric_match = _NUM_RE.search(value_str.replace(',', ''))
         if numeric_match:
             try:
                 return float(numeric_match.group().replace(',', ''))
@@ -432,55 +588,71 @@ class NaverFinancePERCrawlerForLambda:
         return None
 
 
-def convert_results_to_csv(batch_results):
+_CSV_HEADERS = (
+    'stock_code', 'company_name', 'crawl_time', 'item_type', 
+    'item_category', 'date_info', 'raw_value', 'unit', 'value',
+    'raw_item_name', 'raw_item_value', 'original_row_index'
+)
+_CSV_SPECIAL_CHARS = (',', '"', '\r', '\n')
+
+
+def _csv_field(value):
+    """CSV 필드 직렬화 (csv.writer의 QUOTE_MINIMAL과 동일하게 특수문자가 있을 때만 따옴표 처리)"""
+    if value is None:
+        return ''
+    text = str(value)
+    if any(char in text for char in _CSV_SPECIAL_CHARS):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def iter_csv_rows(batch_results):
     """
-    배치 크롤링 결과를 CSV 형태로 변환 (UTF-8 BOM 포함)
+    배치 크롤링 결과를 CSV 줄 단위로 생성 (전체 CSV 문자열을 메모리에 만들지 않음)
     
     Args:
         batch_results (dict): 배치 크롤링 결과 데이터
         
-    Returns:
-        str: CSV 형태의 문자열 (UTF-8 BOM 포함)
+    Yields:
+        str: UTF-8 BOM이 붙은 헤더 줄, 이후 데이터 줄 (결과가 없으면 아무것도 생성하지 않음)
     """
     if not batch_results.get("success") or not batch_results.get("results"):
-        return ""
-    
-    csv_buffer = io.StringIO()
-    csv_writer = csv.writer(csv_buffer)
+        return
     
-    # CSV 헤더 작성
-    headers = [
-        'stock_code', 'company_name', 'crawl_time', 'item_type', 
-        'item_category', 'date_info', 'raw_value', 'unit', 'value',
-        'raw_item_name', 'raw_item_value', 'original_row_index'
-    ]
-    csv_writer.writerow(headers)
+    # CSV 헤더 작성 (UTF-8 BOM 포함, csv.writer와 같은 \r\n 줄바꿈 유지)
+    yield '\ufeff' + ','.join(_CSV_HEADERS) + '\r\n'
     
     # 각 종목의 파싱된 데이터를 CSV 행으로 변환
     for result in batch_results["results"]:
         if result.get("success") and result.get("parsed_data"):
             for item in result["parsed_data"]:
-                row = [
-                    str(item.get('stock_code', '')),
-                    str(item.get('company_name', '')),
-                    str(item.get('crawl_time', '')),
-                    str(item.get('item_type', '')),
-                    str(item.get('item_category', '')),
-                    str(item.get('date_info', '')),
-                    str(item.get('value', '')),  # raw_value 컬럼
-                    str(item.get('unit', '')),
-                    item.get('numeric_value', ''),  # value 컬럼 (숫자)
-                    str(item.get('raw_item_name', '')),
-                    str(item.get('raw_item_value', '')),
-                    str(item.get('original_row_index', ''))
-                ]
-                csv_writer.writerow(row)
-    
-    csv_content = csv_buffer.getvalue()
-    csv_buffer.close()
+                yield ','.join((
+                    _csv_field(item.get('stock_code', '')),
+                    _csv_field(item.get('company_name', '')),
+                    _csv_field(item.get('crawl_time', '')),
+                    _csv_field(item.get('item_type', '')),
+                    _csv_field(item.get('item_category', '')),
+                    _csv_field(item.get('date_info', '')),
+                    _csv_field(item.get('value', '')),  # raw_value 컬럼
+                    _csv_field(item.get('unit', '')),
+                    _csv_field(item.get('numeric_value', '')),  # value 컬럼 (숫자)
+                    _csv_field(item.get('raw_item_name', '')),
+                    _csv_field(item.get('raw_item_value', '')),
+                    _csv_field(item.get('original_row_index', ''))
+                )) + '\r\n'
+
+
+def convert_results_to_csv(batch_results):
+    """
+    배치 크롤링 결과를 CSV 형태로 변환 (UTF-8 BOM 포함)
     
-    # UTF-8 BOM 추가 (한글 깨짐 방지)
-    return '\ufeff' + csv_content
+    Args:
+        batch_results (dict): 배치 크롤링 결과 데이터
+        
+    Returns:
+        str: CSV 형태의 문자열 (UTF-8 BOM 포함)
+    """
+    return ''.join(iter_csv_rows(batch_results))
 
 
 
@@ -492,7 +664,7 @@ async def run_batch_per_eps_crawler_for_lambda(stocks, headless=True, delay_betw
     Args:
         stocks (list): 종목 정보 리스트 [{"code": "004150", "name": "한솔홀딩스"}, ...]
         headless (bool): 헤드리스 모드 여부
-        delay_between_stocks (int): 종목 간 대기 시간 (초)
+        delay_between_stocks (int): 동시 실행 슬롯별 종목 간 대기 시간 (초, 0이면 대기 없음)
         
     Returns:
         dict: 배치 크롤링 결과 JSON 데이터
@@ -500,63 +672,76 @@ async def run_batch_per_eps_crawler_for_lambda(stocks, headless=True, delay_betw
     crawler = NaverFinancePERCrawlerForLambda(headless=headless)
     crawler.start_timer()
     
-    all_results = []
-    successful_count = 0
-    failed_count = 0
-    
     try:
-        # 브라우저 초기화 (한 번만 초기화하여 재사용)
-        if not await crawler.initialize_browser():
+        # HTTP 수집이 가능하면 브라우저는 필요할 때만 초기화 (한 번만 초기화하여 재사용)
+        if crawler.open_http_client():
+            logger.info("🌐 HTTP 수집 사용 (실패한 종목만 브라우저로 재시도)")
+        elif not await crawler.ensure_browser():
             return {"success": False, "error": "브라우저 초기화 실패"}
         
-        print(f"🚀 총 {len(stocks)}개 종목 배치 크롤링 시작")
-        print("=" * 60)
+        logger.info(f"🚀 총 {len(stocks)}개 종목 배치 크롤링 시작 (동시 실행: {crawler.max_concurrency})")
+        logger.info("=" * 60)
+        
+        semaphore = asyncio.Semaphore(crawler.max_concurrency)
         
-        for idx, stock in enumerate(stocks, 1):
+        async def crawl_stock(idx, stock):
+            """종목 하나를 HTTP로 수집하고 실패하면 페이지 풀의 브라우저 페이지로 재시도"""
             stock_code = stock.get('code', '')
             company_name = stock.get('name', '')
             
-            print(f"[{idx}/{len(stocks)}] {company_name}({stock_code}) 크롤링 중...")
+            data = crawler.get_cached_per_eps_data(stock_code, company_name)
+            if data is None:
+                async with semaphore:
+                    logger.debug("[%s/%s] %s(%s) 크롤링 중...", idx, len(stocks), company_name, stock_code)
+                    # 개별 종목 크롤링
+                    if crawler.http_client is not None:
+                        data = await crawler.fetch_per_eps_http(stock_code, company_name)
+                    if data is None:
+                        if not await crawler.ensure_browser():
+                            raise RuntimeError("브라우저 초기화 실패")
+                        data = await crawler.crawl_per_eps_data(stock_code, company_name)
+                    if data:
+                        crawler.cache_per_eps_data(stock_code, data)
+                    
+                    # 같은 작업 슬롯의 다음 종목 전 대기 (슬롯별 요청 간격 유지)
+                    if delay_between_stocks > 0:
+                        await asyncio.sleep(delay_between_stocks)
             
-            try:
-                # 개별 종목 크롤링
-                data = await crawler.crawl_per_eps_data(stock_code, company_name)
-                
-                if data:
-                    parsed_data = crawler.parse_per_eps_data(data)
-                    all_results.append({
-                        "stock_code": stock_code,
-                        "company_name": company_name,
-                        "success": True,
-                        "raw_data": data,
-                        "parsed_data": parsed_data
-                    })
-                    successful_count += 1
-                    print(f"✅ {company_name}({stock_code}) 크롤링 성공")
-                else:
-                    all_results.append({
-                        "stock_code": stock_code,
-                        "company_name": company_name,
-                        "success": False,
-                        "error": "데이터를 가져올 수 없습니다"
-                    })
-                    failed_count += 1
-                    print(f"❌ {company_name}({stock_code}) 크롤링 실패")
-                
-            except Exception as e:
-                all_results.append({
+            if data:
+                logger.debug("✅ %s(%s) 크롤링 성공", company_name, stock_code)
+                return {
                     "stock_code": stock_code,
                     "company_name": company_name,
+                    "success": True,
+                    "raw_data": data,
+                    "parsed_data": crawler.parse_per_eps_data(data)
+                }
+            logger.error(f"❌ {company_name}({stock_code}) 크롤링 실패")
+            return {
+                "stock_code": stock_code,
+                "company_name": company_name,
+                "success": False,
+                "error": "데이터를 가져올 수 없습니다"
+            }
+        
+        outcomes = await asyncio.gather(*[
+            crawl_stock(idx, stock) for idx, stock in enumerate(stocks, 1)
+        ], return_exceptions=True)
+        
+        # 입력 순서대로 성공/실패 집계 (한 종목의 예외가 배치를 중단시키지 않음)
+        all_results = []
+        for stock, outcome in zip(stocks, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"❌ {stock.get('name', '')}({stock.get('code', '')}) 크롤링 중 오류: {str(outcome)}")
+                outcome = {
+                    "stock_code": stock.get('code', ''),
+                    "company_name": stock.get('name', ''),
                     "success": False,
-                    "error": str(e)
-                })
-                failed_count += 1
-                print(f"❌ {company_name}({stock_code}) 크롤링 중 오류: {str(e)}")
-            
-            # 종목 간 딜레이 (마지막 종목이 아닌 경우에만)
-            if idx < len(stocks) and delay_between_stocks > 0:
-                print(f"⏳ {delay_between_stocks}초 대기 중...")
-                await asyncio.sleep(delay_between_stocks)
+                    "error": str(outcome)
+                }
+            all_results.append(outcome)
+        successful_count = sum(1 for outcome in all_results if outcome["success"])
+        failed_count = len(all_results) - successful_count
         
         # 최종 결과
         result = {
@@ -566,21 +751,21 @@ async def run_batch_per_eps_crawler_for_lambda(stocks, headless=True, delay_betw
                 "successful_count": successful_count,
                 "failed_count": failed_count,
                 "success_rate": f"{(successful_count/len(stocks)*100):.1f}%",
-                "crawl_time": datetime.now(timezone(timedelta(hours=9))).strftime("%Y-%m-%d %H:%M:%S")
+                "crawl_time": datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
             },
             "results": all_results
         }
         
-        print("\n" + "=" * 60)
-        print("🎉 배치 크롤링 완료!")
-        print(f"📊 총 종목 수: {len(stocks)}")
-        print(f"✅ 성공: {successful_count}개")
-        print(f"❌ 실패: {failed_count}개")
-        print(f"📈 성공률: {(successful_count/len(stocks)*100):.1f}%")
-        print("=" * 60)
-        print("📊 배치 크롤링 결과 JSON:")
-        print(json.dumps(result, ensure_ascii=False, indent=2))
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("🎉 배치 크롤링 완료!")
+        logger.info(f"📊 총 종목 수: {len(stocks)}")
+        logger.info(f"✅ 성공: {successful_count}개")
+        logger.info(f"❌ 실패: {failed_count}개")
+        logger.info(f"📈 성공률: {(successful_count/len(stocks)*100):.1f}%")
+        logger.info("=" * 60)
+        if logger.isEnabledFor(logging.DEBUG):
+            # 전체 결과 JSON은 크기가 커서 DEBUG에서만 한 줄(compact)로 출력
+            logger.debug(f"📊 배치 크롤링 결과 JSON: {json.dumps(result, ensure_ascii=False, separators=(',', ':'))}")
         
         return result
         
@@ -592,6 +777,170 @@ async def run_batch_per_eps_crawler_for_lambda(stocks, headless=True, delay_betw
         crawler.end_timer()
 
 
+def load_stocks_from_lambda():
+    """
+    종목 목록 람다 펑션(STOCK_LAMBDA_URL)에서 크롤링할 종목 목록 조회
+    웜 스타트에서는 STOCKS_CACHE_TTL_SECONDS 동안 이전 조회 결과를 재사용
+    
+    Returns:
+        list: [{"code": "004150", "name": "한솔홀딩스"}, ...]
+        
+    Raises:
+        Exception: 람다 호출 또는 응답 검증 실패
+    """
+    global _STOCKS_CACHE, _STOCKS_CACHE_TS
+    if _STOCKS_CACHE is not None and time.time() - _STOCKS_CACHE_TS < _STOCKS_TTL:
+        logger.info(f"♻️ 캐시된 종목 목록 사용 ({len(_STOCKS_CACHE)}개)")
+        return _STOCKS_CACHE
+    
+    # 환경변수에서 람다 URL 가져오기
+    lambda_url = os.environ.get('STOCK_LAMBDA_URL', 'https://rbtvqk5rybgcl63umd5skjnc4i0tqjpl.lambda-url.ap-northeast-2.on.aws/')
+    logger.debug("📋 람다 펑션에서 종목 목록 가져오기: %s", lambda_url)
+
+    response = _HTTP.request('GET', lambda_url, timeout=30)
+    if response.status >= 400:
+        raise Exception(f"람다 API HTTP 오류: {response.status}")
+
+    if _STOCKS_DECODER is not None:
+        # 종목 항목을 dict로 만들지 않고 필요한 두 필드만 구조체로 디코딩
+        api_response = _STOCKS_DECODER.decode(response.data)
+        success, error_msg, raw_stocks = api_response.success, api_response.error, api_response.data
+        entries = ((stock.stock_code, stock.stock_nm) for stock in raw_stocks)
+    else:
+        api_response = json.loads(response.data.decode('utf-8'))
+        success, error_msg, raw_stocks = api_response.get('success'), api_response.get('error'), api_response.get('data', [])
+        entries = ((stock.get('stock_code'), stock.get('stock_nm')) for stock in raw_stocks)
+
+    # API 응답 검증
+    if not success:
+        raise Exception(f"람다 API 호출 실패: {error_msg or 'Unknown error'}")
+
+    logger.info(f"📋 람다 API에서 {len(raw_stocks)}개 회사 데이터 수신")
+
+    # stock_code가 있는 경우만 변환 (이 프로젝트용)
+    stocks = [{'code': stock_code, 'name': stock_nm} for stock_code, stock_nm in entries if stock_code and stock_nm]
+
+    logger.info(f"📋 람다 펑션에서 {len(stocks)}개 유효한 종목 로드 완료")
+    _STOCKS_CACHE = stocks
+    _STOCKS_CACHE_TS = time.time()
+    return stocks
+
+
+def daily_s3_key():
+    """람다 실행 시각(KST) 기준 일별 CSV S3 키"""
+    year, month, day = datetime.now(KST).strftime("%Y %m %d").split()
+    return generate_s3_key("daily", year, month, day)
+
+
+def dispatch_shards(event, context, stocks, shard_size):
+    """
+    종목 목록을 shard_size개씩 나눠 같은 Lambda를 비동기(Event)로 호출
+    각 샤드는 일별 경로에 자신의 파트 파일(stock_invest_info.partNNN.csv)을 쓰고,
+    같은 경로의 _manifest.json에 파트 목록을 기록 (밑줄로 시작해 테이블 조회 대상에서 제외)
+    호출 전에 같은 날 이전 실행이 남긴 stock_invest_info* 객체를 삭제해 테이블 조회 시 행이 중복되지 않게 함
+    
+    Args:
+        event (dict): 원본 Lambda 이벤트 (샤드 이벤트에 그대로 전달)
+        context: Lambda 컨텍스트 (자기 자신 호출용 함수 ARN)
+        stocks (list): 전체 종목 리스트
+        shard_size (int): 샤드당 종목 수
+        
+    Returns:
+        dict: HTTP 응답 (202)
+    """
+    import boto3
+    
+    bucket_name = os.environ.get('S3_BUCKET') or event.get('s3_bucket') or 'test-stock-info-bucket'
+    key_root, key_ext = os.path.splitext(daily_s3_key())
+    lambda_client = boto3.client('lambda')
+    
+    # 같은 날 재실행 시 이전 파트(샤드 수가 더 많았던 경우)나 비샤드 실행의 단일 파일이 남지 않도록 먼저 삭제
+    cleanup = delete_s3_prefix(bucket_name, key_root)
+    if not cleanup.get("success"):
+        raise Exception(f"이전 일별 파일 삭제 실패: {cleanup.get('error')}")
+    
+    shards = [stocks[i:i + shard_size] for i in range(0, len(stocks), shard_size)]
+    parts = []
+    for shard_index, shard_stocks in enumerate(shards):
+        part_key = f"{key_root}.part{shard_index:03d}{key_ext}"
+        payload = dict(event, stocks=shard_stocks, s3_key=part_key)
+        lambda_client.invoke(
+            FunctionName=context.invoked_function_arn,
+            InvocationType='Event',
+            Payload=json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        )
+        # S3_GZIP=1이면 샤드 업로드 시 키에 .gz가 붙음
+        parts.append({"key": part_key + ('.gz' if S3_GZIP else ''), "stock_count": len(shard_stocks)})
+    logger.info(f"🔀 {len(stocks)}개 종목을 {len(shards)}개 샤드로 나눠 호출")
+    
+    manifest = {
+        "dispatched": True,
+        "bucket": bucket_name,
+        "total_stocks": len(stocks),
+        "shard_size": shard_size,
+        "parts": parts
+    }
+    manifest_key = f"{os.path.dirname(key_root)}/_manifest.json"
+    manifest["manifest_upload"] = upload_bytes_to_s3(
+        json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'),
+        bucket_name,
+        manifest_key,
+        'application/json; charset=utf-8'
+    )
+    
+    return {
+        'statusCode': 202,
+        'headers': {
+            'Content-Type': 'application/json; charset=utf-8'
+        },
+        'body': json.dumps(manifest, ensure_ascii=False, indent=2)
+    }
+
+
+def new_event_loop():
+    """
+    uvloop가 설치되어 있으면 uvloop 이벤트 루프를, 아니면 asyncio 기본 이벤트 루프를 생성
+    (Windows 제외, USE_UVLOOP=0이면 uvloop 사용 안 함)
+    
+    전역 이벤트 루프 정책은 바꾸지 않는다. 팩토리는 분기/연간 크롤링용 루프를 웜 스타트 간 유지하는데,
+    정책이 uvloop로 바뀌면 그 루프에서 Playwright 드라이버 subprocess 생성이 실패하기 때문이다.
+    
+    Returns:
+        asyncio.AbstractEventLoop: 새 이벤트 루프
+    """
+    if os.name != 'nt' and os.environ.get('USE_UVLOOP', '1') != '0':
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            logger.info("⚡ uvloop 이벤트 루프를 사용합니다.")
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run_in_new_loop(coro):
+    """
+    코루틴을 새 이벤트 루프에서 실행한 뒤 루프를 닫음 (asyncio.run과 같지만 전역 정책을 바꾸지 않음)
+    
+    Args:
+        coro: 실행할 코루틴
+        
+    Returns:
+        코루틴 반환값
+    """
+    loop = new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
 # Lambda 핸들러 함수
 def lambda_handler(event, context):
     """
@@ -605,46 +954,9 @@ def lambda_handler(event, context):
         dict: HTTP 응답
     """
     try:
-        # 람다 펑션에서 종목 목록 가져오기
+        # 람다 펑션에서 종목 목록 가져오기 (샤드 호출이면 이벤트로 전달된 종목 사용)
         try:
-            import urllib.request
-            import urllib.error
-
-            # 환경변수에서 람다 URL 가져오기
-            lambda_url = os.environ.get('STOCK_LAMBDA_URL', 'https://rbtvqk5rybgcl63umd5skjnc4i0tqjpl.lambda-url.ap-northeast-2.on.aws/')
-            print(f"📋 람다 펑션에서 종목 목록 가져오기: {lambda_url}")
-
-            with urllib.request.urlopen(lambda_url, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-
-            print(f"🔍 람다 응답 데이터: {response_data[:500]}...")
-
-            api_response = json.loads(response_data)
-            print(f"🔍 API 응답 구조: {type(api_response)}")
-
-            # API 응답 검증
-            if not api_response.get('success'):
-                error_msg = api_response.get('error', 'Unknown error')
-                raise Exception(f"람다 API 호출 실패: {error_msg}")
-
-            # 데이터 추출
-            raw_stocks = api_response.get('data', [])
-            print(f"📋 람다 API에서 {len(raw_stocks)}개 회사 데이터 수신")
-
-            # stock_code가 null이 아닌 값만 필터링하고 변환
-            stocks = []
-            for stock in raw_stocks:
-                stock_code = stock.get('stock_code')
-                stock_nm = stock.get('stock_nm')
-
-                # stock_code가 있는 경우만 (이 프로젝트용)
-                if stock_code and stock_nm:
-                    stocks.append({
-                        'code': stock_code,
-                        'name': stock_nm
-                    })
-
-            print(f"📋 람다 펑션에서 {len(stocks)}개 유효한 종목 로드 완료")
+            stocks = event['stocks'] if 'stocks' in event else load_stocks_from_lambda()
         except Exception as e:
             return {
                 'statusCode': 500,
@@ -657,11 +969,16 @@ def lambda_handler(event, context):
                 }, ensure_ascii=False, indent=2)
             }
         
+        # 종목이 많으면 같은 Lambda를 샤드별로 비동기 호출하고 종료 (SHARD_SIZE=0이면 사용 안 함)
+        shard_size = int(os.environ.get('SHARD_SIZE', '0'))
+        if shard_size > 0 and len(stocks) > shard_size and 's3_key' not in event and context is not None:
+            return dispatch_shards(event, context, stocks, shard_size)
+        
         # 배치 크롤링 실행
-        print("🚀 stocks.json 기반 배치 크롤링 시작")
+        logger.info("🚀 stocks.json 기반 배치 크롤링 시작")
         delay_between_stocks = event.get('delay_between_stocks', 2)
         
-        result = asyncio.run(run_batch_per_eps_crawler_for_lambda(
+        result = run_in_new_loop(run_batch_per_eps_crawler_for_lambda(
             stocks=stocks,
             headless=True,
             delay_between_stocks=delay_between_stocks
@@ -674,39 +991,35 @@ def lambda_handler(event, context):
                 # S3 설정 (환경변수 우선순위: 환경변수 > 이벤트 > 기본값)
                 bucket_name = os.environ.get('S3_BUCKET') or event.get('s3_bucket') or 'test-stock-info-bucket'
                 
-                # 동적 S3 키 생성 (람다 실행 시간 기준, KST)
-                current_time = datetime.now(timezone(timedelta(hours=9)))
-                s3_key = generate_s3_key("daily", current_time.strftime("%Y"), current_time.strftime("%m"), current_time.strftime("%d"))
-                
-                print(f"📤 S3 업로드 준비: s3://{bucket_name}/{s3_key}")
+                # 동적 S3 키 생성 (람다 실행 시간 기준, KST / 샤드 호출이면 전달받은 파트 키 사용)
+                s3_key = event.get('s3_key') or daily_s3_key()
                 
-                # 크롤링 결과를 CSV로 변환
-                csv_content = convert_results_to_csv(result)
+                logger.info(f"📤 S3 업로드 준비: s3://{bucket_name}/{s3_key}")
                 
-                if csv_content:
-                    # S3에 CSV 업로드
-                    s3_upload_result = upload_csv_content_to_s3(csv_content, bucket_name, s3_key)
+                if result.get("results"):
+                    # 크롤링 결과를 CSV 줄 단위로 변환하면서 S3에 멀티파트 업로드
+                    s3_upload_result = upload_lines_to_s3(iter_csv_rows(result), bucket_name, s3_key)
                     
                     if s3_upload_result.get("success"):
-                        print(f"✅ S3 업로드 성공: {s3_upload_result['s3_url']}")
+                        logger.info(f"✅ S3 업로드 성공: {s3_upload_result['s3_url']}")
                         
                         # 응답에 S3 정보 추가
                         result["s3_upload"] = s3_upload_result
                     else:
-                        print(f"❌ S3 업로드 실패: {s3_upload_result.get('error', '알 수 없는 오류')}")
+                        logger.error(f"❌ S3 업로드 실패: {s3_upload_result.get('error', '알 수 없는 오류')}")
                         result["s3_upload"] = {
                             "success": False,
                             "error": s3_upload_result.get('error', '알 수 없는 오류')
                         }
                 else:
-                    print("⚠️ CSV 변환 결과가 비어있어 S3 업로드를 건너뜁니다.")
+                    logger.warning("⚠️ CSV 변환 결과가 비어있어 S3 업로드를 건너뜁니다.")
                     result["s3_upload"] = {
                         "success": False,
                         "error": "CSV 변환 결과가 비어있음"
                     }
                     
             except Exception as e:
-                print(f"❌ S3 업로드 과정에서 오류: {str(e)}")
+                logger.error(f"❌ S3 업로드 과정에서 오류: {str(e)}")
                 result["s3_upload"] = {
                     "success": False,
                     "error": f"S3 업로드 과정에서 오류: {str(e)}"
@@ -734,71 +1047,72 @@ def lambda_handler(event, context):
 
 
 if __name__ == "__main__":
-    print("🚀 네이버 금융 투자정보 크롤러 (Lambda용) - stocks.json 배치 테스트")
-    print("=" * 50)
+    logging.basicConfig(format='%(message)s')
+    
+    logger.info("🚀 네이버 금융 투자정보 크롤러 (Lambda용) - stocks.json 배치 테스트")
+    logger.info("=" * 50)
     
     # stocks.json 파일 기반 배치 테스트
     try:
         with open('stocks.json', 'r', encoding='utf-8') as f:
             stocks = json.load(f)
-        print(f"📋 stocks.json에서 {len(stocks)}개 종목 로드")
+        logger.info(f"📋 stocks.json에서 {len(stocks)}개 종목 로드")
         
-        print("📊 배치 크롤링 테스트 시작")
-        result = asyncio.run(run_batch_per_eps_crawler_for_lambda(
+        logger.info("📊 배치 크롤링 테스트 시작")
+        result = run_in_new_loop(run_batch_per_eps_crawler_for_lambda(
             stocks=stocks,
             headless=True,
             delay_between_stocks=2
         ))
         
         if result.get("success"):
-            print("✅ Lambda용 배치 크롤러 테스트 성공!")
-            print(f"📈 성공률: {result['batch_info']['success_rate']}")
+            logger.info("✅ Lambda용 배치 크롤러 테스트 성공!")
+            logger.info(f"📈 성공률: {result['batch_info']['success_rate']}")
             
             # S3 업로드 테스트 (로컬 환경에서는 건너뛰기)
-            print("\n📤 S3 업로드 테스트...")
+            logger.info("\n📤 S3 업로드 테스트...")
             try:
                 # 동적 S3 키 생성 (KST)
-                current_time = datetime.now(timezone(timedelta(hours=9)))
-                s3_key = generate_s3_key("daily", current_time.strftime("%Y"), current_time.strftime("%m"), current_time.strftime("%d"))
+                s3_key = daily_s3_key()
                 bucket_name = 'test-stock-info-bucket'
                 
-                print(f"📍 예상 S3 경로: s3://{bucket_name}/{s3_key}")
+                logger.info(f"📍 예상 S3 경로: s3://{bucket_name}/{s3_key}")
                 
                 # CSV 변환 테스트
                 csv_content = convert_results_to_csv(result)
                 if csv_content:
-                    print(f"✅ CSV 변환 성공 (크기: {len(csv_content)} bytes)")
-                    print("📄 CSV 첫 10줄 미리보기:")
+                    logger.info(f"✅ CSV 변환 성공 (크기: {len(csv_content)} bytes)")
+                    logger.info("📄 CSV 첫 10줄 미리보기:")
                     lines = csv_content.split('\n')[:10]
                     for i, line in enumerate(lines, 1):
-                        print(f"   {i}: {line}")
+                        logger.info(f"   {i}: {line}")
                 else:
-                    print("❌ CSV 변환 실패")
+                    logger.error("❌ CSV 변환 실패")
                 
                 # S3 업로드 시도 (AWS CLI 설정이 있는 경우)
-                print("📤 S3 업로드 시도 중...")
+                logger.info("📤 S3 업로드 시도 중...")
                 try:
-                    s3_upload_result = upload_csv_content_to_s3(csv_content, bucket_name, s3_key)
+                    s3_upload_result = upload_lines_to_s3(iter_csv_rows(result), bucket_name, s3_key)
                     
                     if s3_upload_result.get("success"):
-                        print(f"✅ S3 업로드 성공!")
-                        print(f"📍 업로드된 위치: {s3_upload_result['s3_url']}")
-                        print(f"📦 파일 크기: {s3_upload_result['size']} bytes")
+                        logger.info(f"✅ S3 업로드 성공!")
+                        logger.info(f"📍 업로드된 위치: {s3_upload_result['s3_url']}")
+                        logger.info(f"📦 파일 크기: {s3_upload_result['size']} bytes")
                     else:
-                        print(f"❌ S3 업로드 실패: {s3_upload_result.get('error', '알 수 없는 오류')}")
-                        print("💡 AWS CLI가 설정되어 있는지, S3 버킷이 존재하는지 확인해주세요.")
+                        logger.error(f"❌ S3 업로드 실패: {s3_upload_result.get('error', '알 수 없는 오류')}")
+                        logger.warning("💡 AWS CLI가 설정되어 있는지, S3 버킷이 존재하는지 확인해주세요.")
                         
                 except Exception as upload_error:
-                    print(f"❌ S3 업로드 중 오류: {str(upload_error)}")
-                    print("💡 AWS CLI 설정을 확인해주세요: aws configure list")
+                    logger.error(f"❌ S3 업로드 중 오류: {str(upload_error)}")
+                    logger.warning("💡 AWS CLI 설정을 확인해주세요: aws configure list")
                 
             except Exception as e:
-                print(f"❌ S3 업로드 테스트 중 오류: {str(e)}")
+                logger.error(f"❌ S3 업로드 테스트 중 오류: {str(e)}")
         else:
-            print("❌ Lambda용 배치 크롤러 테스트 실패!")
-            print(f"🚨 오류: {result.get('error', '알 수 없는 오류')}")
+            logger.error("❌ Lambda용 배치 크롤러 테스트 실패!")
+            logger.error(f"🚨 오류: {result.get('error', '알 수 없는 오류')}")
             
     except FileNotFoundError:
-        print("❌ stocks.json 파일을 찾을 수 없습니다.")
+        logger.error("❌ stocks.json 파일을 찾을 수 없습니다.")
     except Exception as e:
-        print(f"❌ 테스트 실행 중 오류: {str(e)}")
\ No newline at end of file
+        logger.error(f"❌ 테스트 실행 중 오류: {str(e)}")
\ No newline at end of file
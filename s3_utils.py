@@ -2,12 +2,125 @@
 S3 업로드 공통 유틸리티 함수들
 """
 
-import boto3
+import codecs
+import io
+import logging
 import os
+import random
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
 
-def upload_file_to_s3(file_path, bucket_name, s3_key):
+# 한국 표준시
+KST = timezone(timedelta(hours=9))
+
+# 8MB 이상 파일은 16MB 파트 단위 멀티파트로 병렬 업로드
+# (io_chunksize: 파트 전송 시 읽기 단위, 기본 256KB보다 크게 잡아 읽기/전송 호출 수 감소)
+_TRANSFER_SETTINGS = dict(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    io_chunksize=1024 * 1024,
+    use_threads=True
+)
+# boto3 import는 콜드 스타트 비용이 크므로 첫 업로드 시점까지 미룸 (_get_transfer_config에서 생성)
+TRANSFER_CONFIG = None
+
+# 줄 단위 스트리밍 업로드의 파트 크기 (S3 멀티파트 최소 5MB 이상)
+STREAM_PART_SIZE = 8 * 1024 * 1024
+# 줄 단위 스트리밍 업로드에서 동시에 전송하는 최대 파트 수 (메모리 상한: 파트 크기 x 이 값)
+STREAM_MAX_CONCURRENCY = _TRANSFER_SETTINGS['max_concurrency']
+
+# S3_GZIP=1이면 CSV 문자열/줄 업로드를 gzip 압축 (키에 .gz 추가, Content-Encoding: gzip)
+S3_GZIP = os.environ.get('S3_GZIP', '0') == '1'
+
+# 웜 스타트/업로드 간 재사용할 S3 클라이언트 (자격증명·엔드포인트·연결 풀 재사용)
+_S3_CLIENT = None
+# boto3 기본 세션의 클라이언트 생성은 스레드 안전하지 않으므로 잠금 후 생성
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_s3():
+    """
+    공유 S3 클라이언트 반환 (최초 호출 시 한 번만 생성, 생성된 클라이언트는 스레드 간 공유 가능)
+    
+    Returns:
+        S3.Client: boto3 S3 클라이언트
+    """
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        with _CLIENT_LOCK:
+            if _S3_CLIENT is None:
+                import boto3
+                from botocore.config import Config
+                
+                # S3_ACCELERATE=1이면 Transfer Acceleration 엔드포인트 사용 (버킷에 가속 설정 필요)
+                if os.environ.get('S3_ACCELERATE', '0') == '1':
+                    config = Config(s3={'use_accelerate_endpoint': True}, signature_version='s3v4')
+                    _S3_CLIENT = boto3.client('s3', config=config)
+                else:
+                    _S3_CLIENT = boto3.client('s3')
+    return _S3_CLIENT
+
+
+def _get_transfer_config():
+    """
+    upload_file/upload_fileobj용 공유 TransferConfig 반환 (최초 호출 시 생성)
+    
+    Returns:
+        TransferConfig: 멀티파트 전송 설정
+    """
+    global TRANSFER_CONFIG
+    if TRANSFER_CONFIG is None:
+        from boto3.s3.transfer import TransferConfig
+        TRANSFER_CONFIG = TransferConfig(**_TRANSFER_SETTINGS)
+    return TRANSFER_CONFIG
+
+
+def warm_s3_client(bucket_name=None, timeout=None):
+    """
+    S3 클라이언트 예열 (클라이언트/TransferConfig 생성, 자격증명 확인, DNS·TLS 연결 수립)
+    
+    Lambda INIT 단계에서 호출하면 첫 업로드가 연결 수립 비용을 치르지 않는다.
+    예열은 데몬 스레드에서 실행하고 timeout까지만 기다리므로, S3 경로가 없거나 자격증명 조회가 느려도
+    INIT 제한 시간(약 10초)을 넘기지 않는다.
+    예열 실패(권한 없음, 버킷 없음 등)는 업로드에 영향이 없으므로 무시한다.
+    
+    Args:
+        bucket_name (str): head_bucket으로 연결을 열 버킷명 (없으면 클라이언트 생성만)
+        timeout (float): 예열 완료를 기다릴 최대 시간(초) (기본값: 환경변수 S3_WARMUP_TIMEOUT, 없으면 2)
+        
+    Returns:
+        bool: 제한 시간 안에 예열이 끝났는지 여부
+    """
+    if timeout is None:
+        timeout = float(os.environ.get('S3_WARMUP_TIMEOUT', '2'))
+    
+    def warm():
+        try:
+            s3_client = _get_s3()
+            _get_transfer_config()
+            if bucket_name:
+                # 요청 서명 시 자격증명이 로드되고, 응답 후 연결은 풀에 남아 재사용됨 (403도 연결은 수립됨)
+                s3_client.head_bucket(Bucket=bucket_name)
+        except Exception as e:
+            logger.warning(f"⚠️ S3 클라이언트 예열 실패 (무시): {str(e)}")
+    
+    thread = threading.Thread(target=warm, name='s3-warmup', daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        logger.warning(f"⚠️ S3 클라이언트 예열이 {timeout}초 안에 끝나지 않아 기다리지 않고 진행합니다.")
+        return False
+    return True
+
+
+def upload_file_to_s3(file_path, bucket_name, s3_key, content_type='text/csv; charset=utf-8', file_size=None):
     """
     파일을 S3에 업로드
     
@@ -15,12 +128,16 @@ def upload_file_to_s3(file_path, bucket_name, s3_key):
         file_path (str): 업로드할 파일 경로
         bucket_name (str): S3 버킷명
         s3_key (str): S3 객체 키 (경로)
+        content_type (str): 객체 Content-Type
+        file_size (int): 파일 크기 (호출자가 이미 알고 있으면 전달, 없으면 업로드 전에 한 번 stat)
         
     Returns:
         dict: 업로드 결과
     """
     try:
-        s3_client = boto3.client('s3')
+        s3_client = _get_s3()
+        if file_size is None:
+            file_size = os.stat(file_path).st_size
         
         # 파일 업로드
         s3_client.upload_file(
@@ -28,14 +145,14 @@ def upload_file_to_s3(file_path, bucket_name, s3_key):
             bucket_name,
             s3_key,
             ExtraArgs={
-                'ContentType': 'text/csv; charset=utf-8'
-            }
+                'ContentType': content_type
+            },
+            Config=_get_transfer_config()
         )
         
         s3_url = f"s3://{bucket_name}/{s3_key}"
-        file_size = os.path.getsize(file_path)
         
-        print(f"✅ 파일 S3 업로드 성공: {s3_url}")
+        logger.info(f"✅ 파일 S3 업로드 성공: {s3_url}")
         
         return {
             "success": True,
@@ -46,14 +163,246 @@ def upload_file_to_s3(file_path, bucket_name, s3_key):
         }
         
     except Exception as e:
-        print(f"❌ S3 업로드 실패: {str(e)}")
+        logger.error(f"❌ S3 업로드 실패: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def upload_bytes_to_s3(data, bucket_name, s3_key, content_type='text/csv; charset=utf-8'):
+    """
+    메모리의 bytes 데이터를 로컬 파일 없이 S3에 업로드
+    
+    Args:
+        data (bytes): 업로드할 데이터
+        bucket_name (str): S3 버킷명
+        s3_key (str): S3 객체 키 (경로)
+        content_type (str): Content-Type
+        
+    Returns:
+        dict: 업로드 결과
+    """
+    try:
+        s3_client = _get_s3()
+        
+        # 큰 데이터도 멀티파트 병렬 업로드되도록 upload_fileobj 사용
+        s3_client.upload_fileobj(
+            io.BytesIO(data),
+            bucket_name,
+            s3_key,
+            ExtraArgs={
+                'ContentType': content_type
+            },
+            Config=_get_transfer_config()
+        )
+        
+        s3_url = f"s3://{bucket_name}/{s3_key}"
+        logger.info(f"✅ 데이터 S3 업로드 성공: {s3_url}")
+        
+        return {
+            "success": True,
+            "s3_url": s3_url,
+            "bucket": bucket_name,
+            "key": s3_key,
+            "size": len(data)
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ S3 업로드 실패: {str(e)}")
         return {
             "success": False,
             "error": str(e)
         }
 
 
-def upload_csv_content_to_s3(csv_content, bucket_name, s3_key):
+def delete_s3_prefix(bucket_name, prefix):
+    """
+    prefix로 시작하는 S3 객체를 모두 삭제 (delete_objects로 1000개씩)
+    
+    Args:
+        bucket_name (str): S3 버킷명
+        prefix (str): 삭제할 객체 키 접두사
+        
+    Returns:
+        dict: 삭제 결과
+    """
+    try:
+        s3_client = _get_s3()
+        deleted = 0
+        paginator = s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            objects = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+            if not objects:
+                continue
+            response = s3_client.delete_objects(Bucket=bucket_name, Delete={'Objects': objects, 'Quiet': True})
+            errors = response.get('Errors')
+            if errors:
+                raise Exception(f"{len(errors)}개 객체 삭제 실패 (예: {errors[0].get('Key')}: {errors[0].get('Message')})")
+            deleted += len(objects)
+        
+        logger.info(f"🧹 S3 객체 삭제: s3://{bucket_name}/{prefix}* ({deleted}개)")
+        return {
+            "success": True,
+            "bucket": bucket_name,
+            "prefix": prefix,
+            "deleted": deleted
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ S3 객체 삭제 실패: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def _gzip_compressor():
+    """gzip 형식(헤더 mtime=0) 스트리밍 압축기 (압축 레벨 6)"""
+    return zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+def _gzip_key(s3_key):
+    """gzip 업로드용 S3 키 (.gz 확장자 추가)"""
+    return s3_key if s3_key.endswith('.gz') else s3_key + '.gz'
+
+
+def upload_lines_to_s3(lines, bucket_name, s3_key, content_type='text/csv; charset=utf-8', part_size=STREAM_PART_SIZE, gzip_body=S3_GZIP):
+    """
+    텍스트 줄들을 전체 파일을 메모리에 만들지 않고 S3에 업로드
+    part_size만큼 모일 때마다 멀티파트 파트로 전송하며, 전체가 한 파트 미만이면 put_object 사용
+    파트는 스레드 풀에서 병렬로 전송하고, 줄 생성은 전송을 기다리지 않고 계속 진행
+    
+    Args:
+        lines (iterable): 업로드할 문자열 줄들 (제너레이터 가능, UTF-8로 인코딩)
+        bucket_name (str): S3 버킷명
+        s3_key (str): S3 객체 키 (경로)
+        content_type (str): Content-Type
+        part_size (int): 멀티파트 파트 크기 (bytes)
+        gzip_body (bool): gzip 압축 업로드 여부 (키에 .gz 추가)
+        
+    Returns:
+        dict: 업로드 결과
+    """
+    upload_id = None
+    extra_args = {'ContentType': content_type}
+    compressor = None
+    if gzip_body:
+        s3_key = _gzip_key(s3_key)
+        extra_args['ContentEncoding'] = 'gzip'
+        compressor = _gzip_compressor()
+    try:
+        s3_client = _get_s3()
+        
+        parts = []
+        part_futures = []
+        buffer = bytearray()
+        total_size = 0
+        
+        def send_part(part_number, body):
+            response = s3_client.upload_part(
+                Bucket=bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+            return {'PartNumber': part_number, 'ETag': response['ETag']}
+        
+        # 예외 발생 시에도 with 종료에서 전송 중인 파트를 기다린 뒤 멀티파트 업로드를 중단함
+        with ThreadPoolExecutor(max_workers=STREAM_MAX_CONCURRENCY) as pool:
+            def upload_part():
+                # 전송 중인 파트 수를 제한해 메모리 사용량 상한 유지 (가장 오래된 파트 완료 대기)
+                if len(part_futures) >= STREAM_MAX_CONCURRENCY:
+                    part_futures[-STREAM_MAX_CONCURRENCY].result()
+                part_futures.append(pool.submit(send_part, len(part_futures) + 1, bytes(buffer)))
+            
+            for line in lines:
+                data = line.encode('utf-8')
+                buffer += compressor.compress(data) if compressor else data
+                if len(buffer) >= part_size:
+                    if upload_id is None:
+                        upload_id = s3_client.create_multipart_upload(
+                            Bucket=bucket_name,
+                            Key=s3_key,
+                            **extra_args
+                        )['UploadId']
+                    upload_part()
+                    total_size += len(buffer)
+                    buffer.clear()
+            if compressor:
+                buffer += compressor.flush()
+            total_size += len(buffer)
+            
+            if upload_id is not None and buffer:
+                upload_part()
+            parts = [future.result() for future in part_futures]
+        
+        if upload_id is None:
+            s3_client.put_object(
+                Bucket=bucket_name,
+                Key=s3_key,
+                Body=bytes(buffer),
+                **extra_args
+            )
+        else:
+            s3_client.complete_multipart_upload(
+                Bucket=bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+        
+        s3_url = f"s3://{bucket_name}/{s3_key}"
+        logger.info(f"✅ 스트리밍 S3 업로드 성공: {s3_url} ({len(parts) or 1}개 파트)")
+        
+        return {
+            "success": True,
+            "s3_url": s3_url,
+            "bucket": bucket_name,
+            "key": s3_key,
+            "size": total_size
+        }
+        
+    except Exception as e:
+        if upload_id is not None:
+            # 미완료 멀티파트 업로드가 버킷에 남지 않도록 중단
+            try:
+                s3_client.abort_multipart_upload(Bucket=bucket_name, Key=s3_key, UploadId=upload_id)
+            except Exception:
+                pass
+        logger.error(f"❌ S3 업로드 실패: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def upload_with_retry(upload_func, *args, max_attempts=3):
+    """
+    업로드 함수를 실행하고 실패 시 지수 백오프(2^n초)로 재시도
+    
+    Args:
+        upload_func (callable): upload_file_to_s3 / upload_bytes_to_s3 등 결과 dict를 반환하는 함수
+        *args: 업로드 함수 인자
+        max_attempts (int): 최대 시도 횟수
+        
+    Returns:
+        dict: 마지막 시도의 업로드 결과
+    """
+    result = {"success": False, "error": "업로드를 시도하지 않았습니다"}
+    for attempt in range(max_attempts):
+        if attempt > 0:
+            delay = 2 ** attempt + random.uniform(0, 1)
+            logger.warning(f"🔁 S3 업로드 재시도 {attempt}/{max_attempts - 1} ({delay:.1f}초 후)")
+            time.sleep(delay)
+        result = upload_func(*args)
+        if result.get("success"):
+            break
+    return result
+
+
+def upload_csv_content_to_s3(csv_content, bucket_name, s3_key, gzip_body=S3_GZIP):
     """
     CSV 문자열 데이터를 S3에 업로드
     
@@ -61,44 +410,67 @@ def upload_csv_content_to_s3(csv_content, bucket_name, s3_key):
         csv_content (str): CSV 형태의 문자열 데이터
         bucket_name (str): S3 버킷명
         s3_key (str): S3 객체 키 (경로)
+        gzip_body (bool): gzip 압축 업로드 여부 (키에 .gz 추가)
         
     Returns:
         dict: 업로드 결과
     """
     try:
-        s3_client = boto3.client('s3')
+        s3_client = _get_s3()
+        extra_args = {'ContentType': 'text/csv; charset=utf-8'}
         
         # CSV 데이터를 UTF-8 BOM과 함께 bytes로 변환 (한글 깨짐 방지)
-        csv_bytes = csv_content.encode('utf-8-sig')
-        
-        # S3에 업로드
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=s3_key,
-            Body=csv_bytes,
-            ContentType='text/csv; charset=utf-8'
+        # 이미 BOM이 붙은 문자열이면 그대로 인코딩해 BOM이 중복되지 않게 함 (BytesIO는 bytes를 복사하지 않음)
+        bom = b'' if csv_content.startswith('\ufeff') else codecs.BOM_UTF8
+        if gzip_body:
+            s3_key = _gzip_key(s3_key)
+            extra_args['ContentEncoding'] = 'gzip'
+            compressor = _gzip_compressor()
+            body = io.BytesIO(compressor.compress(bom) + compressor.compress(csv_content.encode('utf-8')) + compressor.flush())
+        elif bom:
+            body = io.BytesIO()
+            body.write(bom)
+            body.write(csv_content.encode('utf-8'))
+            body.seek(0)
+        else:
+            body = io.BytesIO(csv_content.encode('utf-8'))
+        size = body.getbuffer().nbytes
+        
+        # S3에 업로드 (큰 CSV는 멀티파트 병렬 업로드)
+        s3_client.upload_fileobj(
+            body,
+            bucket_name,
+            s3_key,
+            ExtraArgs=extra_args,
+            Config=_get_transfer_config()
         )
         
         s3_url = f"s3://{bucket_name}/{s3_key}"
-        print(f"✅ CSV 파일 S3 업로드 성공: {s3_url}")
+        logger.info(f"✅ CSV 파일 S3 업로드 성공: {s3_url}")
         
         return {
             "success": True,
             "s3_url": s3_url,
             "bucket": bucket_name,
             "key": s3_key,
-            "size": len(csv_bytes)
+            "size": size
         }
         
     except Exception as e:
-        print(f"❌ S3 업로드 실패: {str(e)}")
+        logger.error(f"❌ S3 업로드 실패: {str(e)}")
         return {
             "success": False,
             "error": str(e)
         }
 
 
-def generate_s3_key(period_type, data_year=None, data_month=None, data_day=None):
+# S3 키 템플릿 (일별 / 분기·연간 / 기타 기간 타입)
+_DAILY_KEY = "l0/ver=1/sys=naver/loc=common/table=external_metrics_stock/year={year}/mmdd={mmdd}/stock_invest_info.{extension}"
+_PERIOD_KEY = "l0/ver=1/sys=naver/loc=common/table=external_metrics_{period_type}/year={year}/mm={mm}/stock_invest_info.{extension}"
+_FALLBACK_KEY = "l0/ver=1/sys=naver/loc=common/table=external_metrics_{period_type}/year={year}/mm={mm}/data.{extension}"
+
+
+def generate_s3_key(period_type, data_year=None, data_month=None, data_day=None, extension="csv"):
     """
     S3 키 생성 - 크롤링된 데이터의 연도/월 사용
     
@@ -107,6 +479,7 @@ def generate_s3_key(period_type, data_year=None, data_month=None, data_day=None)
         data_year (str): 크롤링된 데이터의 연도
         data_month (str): 크롤링된 데이터의 월
         data_day (str): 크롤링된 데이터의 일 (daily용)
+        extension (str): 파일 확장자 ("csv" 또는 "parquet")
     
     Returns:
         str: S3 키
@@ -114,22 +487,14 @@ def generate_s3_key(period_type, data_year=None, data_month=None, data_day=None)
     if data_year and data_month:
         year = data_year
         mm = data_month
-        if data_day:
-            mmdd = data_month.zfill(2) + data_day.zfill(2)
-        else:
-            mmdd = data_month.zfill(2) + "01"  # 기본값
+        mmdd = str(data_month).zfill(2) + str(data_day or '01').zfill(2)  # 일 미지정 시 01
     else:
         # 폴백: 현재 날짜 사용 (KST)
-        current_time = datetime.now(timezone(timedelta(hours=9)))
-        year = current_time.strftime("%Y")
-        mm = current_time.strftime("%m")
-        mmdd = current_time.strftime("%m%d")
+        year, mm, dd = datetime.now(KST).strftime("%Y %m %d").split()
+        mmdd = mm + dd
     
     if period_type == "daily":
-        s3_key = f"l0/ver=1/sys=naver/loc=common/table=external_metrics_stock/year={year}/mmdd={mmdd}/stock_invest_info.csv"
-    elif period_type in ["quarter", "annual"]:
-        s3_key = f"l0/ver=1/sys=naver/loc=common/table=external_metrics_{period_type}/year={year}/mm={mm}/stock_invest_info.csv"
-    else:
-        s3_key = f"l0/ver=1/sys=naver/loc=common/table=external_metrics_{period_type}/year={year}/mm={mm}/data.csv"
-    
-    return s3_key
+        return _DAILY_KEY.format(year=year, mmdd=mmdd, extension=extension)
+    if period_type in ("quarter", "annual"):
+        return _PERIOD_KEY.format(period_type=period_type, year=year, mm=mm, extension=extension)
+    return _FALLBACK_KEY.format(period_type=period_type, year=year, mm=mm, extension=extension)
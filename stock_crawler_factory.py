@@ -4,16 +4,100 @@
 """
 
 import json
+import logging
 import os
 import asyncio
 from datetime import datetime, timezone, timedelta
-import boto3
-from dotenv import load_dotenv
-
-# .env 파일 로드 (로컬 환경에서만)
-if os.path.exists('.env'):
+try:
+    import orjson  # 선택 의존성: 설치되어 있으면 응답 JSON 직렬화에 사용
+except ImportError:
+    orjson = None
+
+# .env 파일 로드 (로컬 환경에서만, Lambda에서는 dotenv import/파일 확인 생략)
+if not os.environ.get('AWS_LAMBDA_FUNCTION_NAME') and os.path.exists('.env'):
+    from dotenv import load_dotenv
     load_dotenv()
 
+# Lambda INIT 단계에서 S3 클라이언트 예열 (첫 호출의 DNS/TLS/자격증명 비용을 INIT으로 이동, S3_WARMUP=0이면 생략)
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') and os.environ.get('S3_WARMUP', '1') != '0':
+    from s3_utils import warm_s3_client
+    warm_s3_client(os.environ.get('S3_BUCKET'))
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+# 한국 표준시
+KST = timezone(timedelta(hours=9))
+
+
+def _dump(obj):
+    """
+    Lambda 응답 body용 JSON 직렬화 (한글 그대로, 2칸 들여쓰기)
+    
+    Args:
+        obj: 직렬화할 객체
+        
+    Returns:
+        str: JSON 문자열
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+# Windows 이벤트 루프 설정 (모듈 로드 시 한 번)
+if os.name == 'nt':
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+# 웜 스타트 간 재사용할 이벤트 루프
+# (공유 Playwright 브라우저는 생성된 루프에 묶이므로 루프를 유지하면 브라우저도 함께 재사용됨)
+# 같은 컨테이너의 daily 경로는 전역 이벤트 루프 정책을 바꾸지 않으므로 이 루프의 subprocess 생성에 영향이 없음
+_LOOP = asyncio.new_event_loop()
+
+
+def _get_loop():
+    """
+    분기/연간 크롤링용 영구 이벤트 루프 반환 (닫혀 있으면 새로 생성)
+    
+    Returns:
+        asyncio.AbstractEventLoop: 이벤트 루프
+    """
+    global _LOOP
+    if _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP
+
+
+# 기간 라벨 -> (응답용 crawler_type, 메시지용 이름)
+_PERIODS = {
+    '분기': ('quarter', '분기별'),
+    '연간': ('annual', '연간'),
+}
+
+
+async def _run_period(stocks, period_label, s3_bucket, output_dir):
+    """
+    분기/연간 크롤링 실행
+    
+    _LOOP에서 실행되므로 공유 브라우저는 종료하지 않고 다음 웜 스타트에서 재사용한다.
+    """
+    from naver_stock_invest_index_crawler import crawl_multiple_stocks_direct
+    return await crawl_multiple_stocks_direct(stocks, output_dir, period_label, s3_bucket)
+
+
+async def _run_periods(stocks, period_labels, s3_bucket, output_dir):
+    """
+    여러 기간의 크롤링을 동시에 실행 (한 기간의 실패가 다른 기간을 중단시키지 않도록 예외도 결과로 받음)
+    
+    gather는 실행 중인 루프에서 만들어야 _LOOP에 묶이므로 코루틴 안에서 호출한다.
+    
+    Returns:
+        list: 기간별 크롤링 결과 또는 예외 (period_labels 순서)
+    """
+    return await asyncio.gather(*[
+        _run_period(stocks, label, s3_bucket, output_dir) for label in period_labels
+    ], return_exceptions=True)
+
 
 def factory_lambda_handler(event, context):
     """
@@ -21,7 +105,7 @@ def factory_lambda_handler(event, context):
     
     Args:
         event (dict): Lambda 이벤트 데이터
-            - crawler_type: 'daily', 'quarter', 'annual'
+            - crawler_type: 'daily', 'quarter', 'annual', 'both'(분기+연간 동시 실행)
             - s3_bucket: S3 버킷명 (선택사항)
             - delay_between_stocks: 종목 간 대기시간 (선택사항)
         context: Lambda 컨텍스트
@@ -31,25 +115,26 @@ def factory_lambda_handler(event, context):
     """
     try:
         # 환경변수 우선순위로 설정값 읽기 (환경변수 > 이벤트 파라미터 > 기본값)
-        crawler_type = os.environ.get('CRAWLER_TYPE') or event.get('crawler_type') or 'daily'
-        s3_bucket = os.environ.get('S3_BUCKET') or event.get('s3_bucket') or 'test-stock-info-bucket'
-        delay_between_stocks = int(os.environ.get('DELAY_BETWEEN_STOCKS') or event.get('delay_between_stocks') or '2')
+        env = os.environ
+        env_crawler_type = env.get('CRAWLER_TYPE')
+        env_s3_bucket = env.get('S3_BUCKET')
+        env_delay = env.get('DELAY_BETWEEN_STOCKS')
+        event_crawler_type = event.get('crawler_type')
+        event_s3_bucket = event.get('s3_bucket')
+        event_delay = event.get('delay_between_stocks')
         
-        # 디버깅을 위한 환경변수 값 출력
-        print(f"🔍 환경변수 디버깅:")
-        print(f"   CRAWLER_TYPE: {os.environ.get('CRAWLER_TYPE', 'None')}")
-        print(f"   S3_BUCKET: {os.environ.get('S3_BUCKET', 'None')}")
-        print(f"   DELAY_BETWEEN_STOCKS: {os.environ.get('DELAY_BETWEEN_STOCKS', 'None')}")
-        print(f"🔍 이벤트 파라미터:")
-        print(f"   crawler_type: {event.get('crawler_type', 'None')}")
-        print(f"   s3_bucket: {event.get('s3_bucket', 'None')}")
-        print(f"   delay_between_stocks: {event.get('delay_between_stocks', 'None')}")
-        print(f"🚀 주식 크롤러 팩토리 시작 - 타입: {crawler_type}, 버킷: {s3_bucket}, 딜레이: {delay_between_stocks}초")
+        crawler_type = env_crawler_type or event_crawler_type or 'daily'
+        s3_bucket = env_s3_bucket or event_s3_bucket or 'test-stock-info-bucket'
+        delay_between_stocks = int(env_delay or event_delay or '2')
         
-        # 이벤트에 환경변수 값들 추가
-        event_with_env = event.copy()
-        event_with_env['s3_bucket'] = s3_bucket
-        event_with_env['delay_between_stocks'] = delay_between_stocks
+        # 디버깅을 위한 환경변수/이벤트 값 출력 (LOG_LEVEL=DEBUG일 때만 문자열 생성)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 환경변수 - CRAWLER_TYPE: {env_crawler_type}, S3_BUCKET: {env_s3_bucket}, DELAY_BETWEEN_STOCKS: {env_delay}")
+            logger.debug(f"🔍 이벤트 파라미터 - crawler_type: {event_crawler_type}, s3_bucket: {event_s3_bucket}, delay_between_stocks: {event_delay}")
+        logger.info(f"🚀 주식 크롤러 팩토리 시작 - 타입: {crawler_type}, 버킷: {s3_bucket}, 딜레이: {delay_between_stocks}초")
+        
+        # 이벤트에 환경변수 값들 추가 (호출자의 이벤트 dict는 변경하지 않음)
+        event_with_env = dict(event, s3_bucket=s3_bucket, delay_between_stocks=delay_between_stocks)
         
         # 타입에 따라 분기
         if crawler_type == 'daily':
@@ -58,17 +143,19 @@ def factory_lambda_handler(event, context):
             return handle_quarter_crawler(event_with_env, context)
         elif crawler_type == 'annual':
             return handle_annual_crawler(event_with_env, context)
+        elif crawler_type == 'both':
+            return handle_both_crawler(event_with_env, context)
         else:
             return {
                 'statusCode': 400,
                 'headers': {
                     'Content-Type': 'application/json; charset=utf-8'
                 },
-                'body': json.dumps({
+                'body': _dump({
                     'success': False,
                     'error': f'지원하지 않는 크롤러 타입: {crawler_type}',
-                    'supported_types': ['daily', 'quarter', 'annual']
-                }, ensure_ascii=False, indent=2)
+                    'supported_types': ['daily', 'quarter', 'annual', 'both']
+                })
             }
             
     except Exception as e:
@@ -77,10 +164,10 @@ def factory_lambda_handler(event, context):
             'headers': {
                 'Content-Type': 'application/json; charset=utf-8'
             },
-            'body': json.dumps({
+            'body': _dump({
                 'success': False,
                 'error': f'팩토리 실행 중 오류: {str(e)}'
-            }, ensure_ascii=False, indent=2)
+            })
         }
 
 
@@ -88,7 +175,7 @@ def handle_daily_crawler(event, context):
     """
     일간 투자정보 크롤러 실행 (PER/EPS)
     """
-    print("📊 일간 투자정보(PER/EPS) 크롤러 실행")
+    logger.info("📊 일간 투자정보(PER/EPS) 크롤러 실행")
     
     # 기존 naver_stock_invest_info_crawler 모듈 import
     from naver_stock_invest_info_crawler import lambda_handler
@@ -97,70 +184,41 @@ def handle_daily_crawler(event, context):
     return lambda_handler(event, context)
 
 
-def handle_quarter_crawler(event, context):
+def _handle_period(event, period_labels):
     """
-    분기별 재무정보 크롤러 실행
+    분기/연간 재무정보 크롤러 실행
+    
+    기간이 여러 개면 종목 목록은 한 번만 가져오고 기간별 크롤링은 동시에 실행한다.
+    
+    Args:
+        event (dict): Lambda 이벤트 데이터
+        period_labels (tuple): 크롤링할 기간 ("분기", "연간")
+        
+    Returns:
+        dict: HTTP 응답
     """
-    print("📈 분기별 재무정보 크롤러 실행")
+    names = '/'.join(_PERIODS[label][1] for label in period_labels)
+    logger.info(f"📈 {names} 재무정보 크롤러 실행")
 
     try:
-        # naver_stock_invest_index_crawler 모듈 import
-        from naver_stock_invest_index_crawler import crawl_multiple_stocks_direct
+        from naver_stock_invest_info_crawler import load_stocks_from_lambda
 
-        # 람다 펑션에서 종목 목록 가져오기
+        # 람다 펑션에서 종목 목록 가져오기 (웜 스타트 간 TTL 캐시)
         try:
-            import urllib.request
-            import urllib.error
-
-            # 환경변수에서 람다 URL 가져오기
-            lambda_url = os.environ.get('STOCK_LAMBDA_URL', 'https://rbtvqk5rybgcl63umd5skjnc4i0tqjpl.lambda-url.ap-northeast-2.on.aws/')
-            print(f"📋 람다 펑션에서 종목 목록 가져오기: {lambda_url}")
-
-            with urllib.request.urlopen(lambda_url, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-
-            print(f"🔍 람다 응답 데이터: {response_data[:500]}...")
-
-            api_response = json.loads(response_data)
-            print(f"🔍 API 응답 구조: {type(api_response)}")
-
-            # API 응답 검증
-            if not api_response.get('success'):
-                error_msg = api_response.get('error', 'Unknown error')
-                raise Exception(f"람다 API 호출 실패: {error_msg}")
-
-            # 데이터 추출
-            raw_stocks = api_response.get('data', [])
-            print(f"📋 람다 API에서 {len(raw_stocks)}개 회사 데이터 수신")
-
-            # stock_code가 null이 아닌 값만 필터링하고 변환
-            stocks = []
-            for stock in raw_stocks:
-                stock_code = stock.get('stock_code')
-                stock_nm = stock.get('stock_nm')
-
-                # stock_code가 있는 경우만 (이 프로젝트용)
-                if stock_code and stock_nm:
-                    stocks.append({
-                        'code': stock_code,
-                        'name': stock_nm
-                    })
-
-            print(f"📋 람다 펑션에서 {len(stocks)}개 유효한 종목 로드 완료")
+            stocks = load_stocks_from_lambda()
         except Exception as e:
             return {
                 'statusCode': 500,
                 'headers': {
                     'Content-Type': 'application/json; charset=utf-8'
                 },
-                'body': json.dumps({
+                'body': _dump({
                     'success': False,
                     'error': f'람다 펑션에서 종목 목록 로드 실패: {str(e)}'
-                }, ensure_ascii=False, indent=2)
+                })
             }
         
-        # 분기별 크롤링 실행
-        print("🚀 분기별 재무정보 크롤링 시작")
+        logger.info(f"🚀 {names} 재무정보 크롤링 시작")
 
         # 임시 출력 디렉토리 생성
         output_dir = "/tmp/crawl_results"
@@ -169,27 +227,34 @@ def handle_quarter_crawler(event, context):
         # s3_bucket 설정
         s3_bucket = os.environ.get('S3_BUCKET') or event.get('s3_bucket') or 'test-stock-info-bucket'
 
-        # crawl_multiple_stocks_direct 실행 (분기) - 종목 목록을 직접 전달
-        import asyncio
-        if os.name == 'nt':
-            asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-
-        crawl_result = asyncio.run(crawl_multiple_stocks_direct(stocks, output_dir, "분기", s3_bucket))
+        # crawl_multiple_stocks_direct 실행 - 종목 목록을 직접 전달
+        crawl_results = _get_loop().run_until_complete(_run_periods(stocks, period_labels, s3_bucket, output_dir))
+        if len(period_labels) == 1 and isinstance(crawl_results[0], BaseException):
+            raise crawl_results[0]
 
         # 크롤링 결과를 JSON 직렬화 가능한 형태로 요약
-        if crawl_result:
-            summary_result = {
-                "success": True,
-                "total_companies": len(stocks),
-                "message": f"{len(stocks)}개 회사의 분기별 재무정보 크롤링 완료",
-                "output_directory": output_dir,
-                "s3_bucket": s3_bucket
-            }
-        else:
-            summary_result = {
-                "success": False,
-                "message": "크롤링 실행 중 오류 발생"
-            }
+        summaries = {}
+        for label, crawl_result in zip(period_labels, crawl_results):
+            crawler_type, name = _PERIODS[label]
+            if isinstance(crawl_result, BaseException):
+                logger.error(f"❌ {name} 크롤링 중 오류: {str(crawl_result)}")
+                summaries[crawler_type] = {
+                    "success": False,
+                    "message": f"크롤링 실행 중 오류 발생: {str(crawl_result)}"
+                }
+            elif crawl_result:
+                summaries[crawler_type] = {
+                    "success": True,
+                    "total_companies": len(stocks),
+                    "message": f"{len(stocks)}개 회사의 {name} 재무정보 크롤링 완료",
+                    "output_directory": output_dir,
+                    "s3_bucket": s3_bucket
+                }
+            else:
+                summaries[crawler_type] = {
+                    "success": False,
+                    "message": "크롤링 실행 중 오류 발생"
+                }
 
         # S3 업로드 결과
         s3_upload_result = {
@@ -197,18 +262,24 @@ def handle_quarter_crawler(event, context):
             "message": "S3 업로드는 크롤링 함수 내부에서 처리됨"
         }
 
+        # 단일 기간이면 기존 응답 형태 유지, 여러 기간이면 crawler_type별로 요약
+        if len(period_labels) == 1:
+            crawler_type, summary_result = next(iter(summaries.items()))
+        else:
+            crawler_type, summary_result = 'both', summaries
+
         return {
             'statusCode': 200,
             'headers': {
                 'Content-Type': 'application/json; charset=utf-8'
             },
-            'body': json.dumps({
+            'body': _dump({
                 'success': True,
-                'crawler_type': 'quarter',
+                'crawler_type': crawler_type,
                 'crawl_result': summary_result,
                 's3_upload': s3_upload_result,
-                'crawl_time': datetime.now(timezone(timedelta(hours=9))).strftime("%Y-%m-%d %H:%M:%S")
-            }, ensure_ascii=False, indent=2)
+                'crawl_time': datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
+            })
         }
         
     except Exception as e:
@@ -217,141 +288,38 @@ def handle_quarter_crawler(event, context):
             'headers': {
                 'Content-Type': 'application/json; charset=utf-8'
             },
-            'body': json.dumps({
+            'body': _dump({
                 'success': False,
-                'error': f'분기별 크롤러 실행 중 오류: {str(e)}'
-            }, ensure_ascii=False, indent=2)
+                'error': f'{names} 크롤러 실행 중 오류: {str(e)}'
+            })
         }
 
 
-def handle_annual_crawler(event, context):
+def handle_quarter_crawler(event, context):
     """
-    연간 재무정보 크롤러 실행
+    분기별 재무정보 크롤러 실행
     """
-    print("📊 연간 재무정보 크롤러 실행")
+    return _handle_period(event, ('분기',))
 
-    try:
-        # naver_stock_invest_index_crawler 모듈 import
-        from naver_stock_invest_index_crawler import crawl_multiple_stocks_direct
 
-        # 람다 펑션에서 종목 목록 가져오기
-        try:
-            import urllib.request
-            import urllib.error
-
-            # 환경변수에서 람다 URL 가져오기
-            lambda_url = os.environ.get('STOCK_LAMBDA_URL', 'https://rbtvqk5rybgcl63umd5skjnc4i0tqjpl.lambda-url.ap-northeast-2.on.aws/')
-            print(f"📋 람다 펑션에서 종목 목록 가져오기: {lambda_url}")
-
-            with urllib.request.urlopen(lambda_url, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-
-            print(f"🔍 람다 응답 데이터: {response_data[:500]}...")
-
-            api_response = json.loads(response_data)
-            print(f"🔍 API 응답 구조: {type(api_response)}")
-
-            # API 응답 검증
-            if not api_response.get('success'):
-                error_msg = api_response.get('error', 'Unknown error')
-                raise Exception(f"람다 API 호출 실패: {error_msg}")
-
-            # 데이터 추출
-            raw_stocks = api_response.get('data', [])
-            print(f"📋 람다 API에서 {len(raw_stocks)}개 회사 데이터 수신")
-
-            # stock_code가 null이 아닌 값만 필터링하고 변환
-            stocks = []
-            for stock in raw_stocks:
-                stock_code = stock.get('stock_code')
-                stock_nm = stock.get('stock_nm')
-
-                # stock_code가 있는 경우만 (이 프로젝트용)
-                if stock_code and stock_nm:
-                    stocks.append({
-                        'code': stock_code,
-                        'name': stock_nm
-                    })
-
-            print(f"📋 람다 펑션에서 {len(stocks)}개 유효한 종목 로드 완료")
-        except Exception as e:
-            return {
-                'statusCode': 500,
-                'headers': {
-                    'Content-Type': 'application/json; charset=utf-8'
-                },
-                'body': json.dumps({
-                    'success': False,
-                    'error': f'람다 펑션에서 종목 목록 로드 실패: {str(e)}'
-                }, ensure_ascii=False, indent=2)
-            }
-        
-        # 연간 크롤링 실행
-        print("🚀 연간 재무정보 크롤링 시작")
-
-        # 임시 출력 디렉토리 생성
-        output_dir = "/tmp/crawl_results"
-        os.makedirs(output_dir, exist_ok=True)
-
-        # s3_bucket 설정
-        s3_bucket = os.environ.get('S3_BUCKET') or event.get('s3_bucket') or 'test-stock-info-bucket'
-
-        # crawl_multiple_stocks_direct 실행 (연간) - 종목 목록을 직접 전달
-        import asyncio
-        if os.name == 'nt':
-            asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-
-        crawl_result = asyncio.run(crawl_multiple_stocks_direct(stocks, output_dir, "연간", s3_bucket))
-
-        # 크롤링 결과를 JSON 직렬화 가능한 형태로 요약
-        if crawl_result:
-            summary_result = {
-                "success": True,
-                "total_companies": len(stocks),
-                "message": f"{len(stocks)}개 회사의 연간 재무정보 크롤링 완료",
-                "output_directory": output_dir,
-                "s3_bucket": s3_bucket
-            }
-        else:
-            summary_result = {
-                "success": False,
-                "message": "크롤링 실행 중 오류 발생"
-            }
+def handle_annual_crawler(event, context):
+    """
+    연간 재무정보 크롤러 실행
+    """
+    return _handle_period(event, ('연간',))
 
-        # S3 업로드 결과
-        s3_upload_result = {
-            "success": True,
-            "message": "S3 업로드는 크롤링 함수 내부에서 처리됨"
-        }
 
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json; charset=utf-8'
-            },
-            'body': json.dumps({
-                'success': True,
-                'crawler_type': 'annual',
-                'crawl_result': summary_result,
-                's3_upload': s3_upload_result,
-                'crawl_time': datetime.now(timezone(timedelta(hours=9))).strftime("%Y-%m-%d %H:%M:%S")
-            }, ensure_ascii=False, indent=2)
-        }
-        
-    except Exception as e:
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json; charset=utf-8'
-            },
-            'body': json.dumps({
-                'success': False,
-                'error': f'연간 크롤러 실행 중 오류: {str(e)}'
-            }, ensure_ascii=False, indent=2)
-        }
+def handle_both_crawler(event, context):
+    """
+    분기별/연간 재무정보 크롤러를 한 번의 호출에서 동시에 실행
+    """
+    return _handle_period(event, ('분기', '연간'))
 
 
 if __name__ == "__main__":
+    # 로컬 실행 시 크롤러 모듈 로그를 콘솔로 출력 (Lambda는 런타임 핸들러 사용)
+    logging.basicConfig(format='%(message)s')
+    
     print("🏭 주식 크롤러 팩토리 - 로컬 테스트")
     print("=" * 50)
     
@@ -385,3 +353,8 @@ if __name__ == "__main__":
             print(f"✅ 성공: {body.get('success', False)}")
         else:
             print(f"❌ 실패: {result['statusCode']}")
+    
+    # 로컬 테스트 종료 시 웜 스타트용으로 유지하던 공유 브라우저 정리
+    from naver_stock_invest_index_crawler import close_shared_browser
+    _get_loop().run_until_complete(close_shared_browser())
+    _get_loop().close()
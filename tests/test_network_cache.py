@@ -0,0 +1,96 @@
+"""
+naver_stock_invest_index_crawler 네트워크 디스크 캐시 라우트 핸들러 테스트
+(Playwright Route 대신 가짜 route로 캐시 적중/미스/요청 실패 경로 확인)
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import naver_stock_invest_index_crawler as crawler_module
+
+_URL = 'https://ssl.pstatic.net/static/js/finance.js?t=1'
+
+
+class _FakeResponse:
+    def __init__(self, status=200, body=b'console.log(1);\n'):
+        self.status = status
+        self.headers = {'content-type': 'application/javascript', 'content-length': str(len(body))}
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class _FakeRoute:
+    def __init__(self, response=None, fetch_error=None):
+        self.request = types.SimpleNamespace(method='GET', url=_URL, resource_type='script')
+        self.response = response or _FakeResponse()
+        self.fetch_error = fetch_error
+        self.fetch_count = 0
+        self.fulfilled = []
+        self.continued = False
+
+    async def fetch(self):
+        self.fetch_count += 1
+        if self.fetch_error is not None:
+            raise self.fetch_error
+        return self.response
+
+    async def fulfill(self, **kwargs):
+        self.fulfilled.append(kwargs)
+
+    async def continue_(self):
+        self.continued = True
+
+
+class NetworkCacheTest(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_dir = cache_dir.name
+        patchers = [
+            mock.patch.object(crawler_module, '_NW_CACHE_DIR', self.cache_dir),
+            mock.patch.object(crawler_module, '_NW_CACHE_TTL', 3600),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _handle(self, route):
+        asyncio.run(crawler_module._fulfill_from_network_cache(route))
+
+    def test_miss_then_hit(self):
+        first = _FakeRoute()
+        self._handle(first)
+        self.assertEqual(first.fetch_count, 1)
+        self.assertEqual(first.fulfilled[0]['body'], b'console.log(1);\n')
+        self.assertEqual([name for name in os.listdir(self.cache_dir) if name.endswith('.tmp')], [])
+
+        second = _FakeRoute()
+        self._handle(second)
+        self.assertEqual(second.fetch_count, 0)
+        fulfilled = second.fulfilled[0]
+        self.assertEqual(fulfilled['status'], 200)
+        self.assertEqual(fulfilled['body'], b'console.log(1);\n')
+        self.assertEqual(fulfilled['headers'], {'content-type': 'application/javascript'})
+
+    def test_non_200_is_not_cached(self):
+        self._handle(_FakeRoute(response=_FakeResponse(status=404, body=b'')))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_fetch_error_continues_request(self):
+        route = _FakeRoute(fetch_error=RuntimeError('Target closed'))
+        self._handle(route)
+        self.assertTrue(route.continued)
+        self.assertEqual(route.fulfilled, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+stock_crawler_factory 분기/연간 핸들러 스모크 테스트
+(크롤러 모듈은 대체하고 _LOOP에서의 실행 경로만 확인)
+"""
+
+import asyncio
+import json
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stock_crawler_factory as factory
+
+_STOCKS = [{'code': '004150', 'name': '한솔홀딩스'}]
+
+
+class PeriodHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        info_crawler = types.SimpleNamespace(load_stocks_from_lambda=lambda: _STOCKS)
+        patchers = [
+            mock.patch.dict(sys.modules, {'naver_stock_invest_info_crawler': info_crawler}),
+            mock.patch.object(factory, '_run_period', self._fake_run_period),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def _fake_run_period(self, stocks, period_label, s3_bucket, output_dir):
+        # Playwright 드라이버처럼 subprocess를 띄워 루프의 child watcher까지 확인
+        process = await asyncio.create_subprocess_exec(sys.executable, '-c', 'pass')
+        await process.wait()
+        self.calls.append(period_label)
+        if period_label == '연간' and getattr(self, 'fail_annual', False):
+            raise RuntimeError('annual failed')
+        return {'ok': True}
+
+    def test_quarter(self):
+        result = factory.handle_quarter_crawler({}, None)
+        self.assertEqual(result['statusCode'], 200)
+        body = json.loads(result['body'])
+        self.assertEqual(body['crawler_type'], 'quarter')
+        self.assertTrue(body['crawl_result']['success'])
+        self.assertEqual(self.calls, ['분기'])
+
+    def test_both_reports_each_period(self):
+        self.fail_annual = True
+        result = factory.handle_both_crawler({}, None)
+        self.assertEqual(result['statusCode'], 200)
+        body = json.loads(result['body'])
+        self.assertEqual(body['crawler_type'], 'both')
+        self.assertTrue(body['crawl_result']['quarter']['success'])
+        self.assertFalse(body['crawl_result']['annual']['success'])
+        self.assertEqual(sorted(self.calls), ['분기', '연간'])
+
+    def test_quarter_after_daily_run(self):
+        # daily 경로처럼 별도 루프를 만들어 실행하고 닫은 뒤(현재 루프 해제) 같은 프로세스에서 분기 실행
+        async def noop():
+            return None
+        asyncio.run(noop())
+        result = factory.handle_quarter_crawler({}, None)
+        self.assertEqual(result['statusCode'], 200)
+        self.assertEqual(self.calls, ['분기'])
+
+
+if __name__ == '__main__':
+    unittest.main()